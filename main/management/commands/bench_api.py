@@ -0,0 +1,200 @@
+import json
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import URLPattern, get_resolver, reverse
+from rest_framework.test import APIClient
+
+from main.models.category import Category
+from main.models.comment import Comment
+from main.models.customuser import CustomUser
+from main.models.post import Post
+from main.utils.neighbors import neighbors_of
+
+# ✅ 같은 상태로 되돌릴 수 있는 쓰기 API만 측정 (토글은 두 번 호출하면 원래대로)
+TOGGLE_ENDPOINTS = {'toggle-heart', 'toggle-comment-heart'}
+
+# ✅ 경로 파라미터 pk가 가리키는 대상 (URL 이름 기준)
+PK_SAMPLES = {
+    'post-detail': 'public_post',
+    'post-my-detail': 'my_post',
+    'post-manage': 'my_post',
+    'post-mutual-detail': 'mutual_post',
+    'draft_post_detail': 'my_draft',
+    'category-detail': 'target_category',
+    'category-my-detail': 'my_category',
+    'comment-detail': 'comment',
+}
+
+# ✅ 필수 쿼리 파라미터가 있는 API
+QUERY_SAMPLES = {
+    'blog-post-search': lambda s: {'urlname': s['urlname'], 'q': '여행'},
+    'global-blog-search': lambda s: {'q': 'seed'},
+    'global-nickandid-search': lambda s: {'q': 'seed'},
+    'global-post-search': lambda s: {'q': '여행'},
+    'category-list': lambda s: {'urlname': s['urlname']},
+    'category-detail': lambda s: {'urlname': s['urlname']},
+}
+
+
+def iter_patterns(patterns):
+    """ ✅ 최상위 urlpatterns 중 API 경로만 (include된 admin 등 URLResolver는 제외) """
+    for pattern in patterns:
+        if isinstance(pattern, URLPattern):
+            yield pattern
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Command(BaseCommand):
+    help = "naver_blog/urls.py의 모든 API를 테스트 클라이언트로 호출해 p50/p95 응답 시간과 SQL 쿼리 수를 측정합니다. (seed_data 먼저 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help="API당 반복 호출 횟수")
+        parser.add_argument('--user', help="요청 사용자 id (기본: 서로이웃이 가장 많은 사용자)")
+        parser.add_argument('--json', action='store_true', help="결과를 JSON으로 출력 (CI 비교용)")
+        parser.add_argument('--fail-on-error', action='store_true', help="5xx 응답이 있으면 실패 처리")
+
+    def handle(self, *args, **options):
+        viewer = self.pick_viewer(options['user'])
+        samples = self.build_samples(viewer)
+
+        client = APIClient(raise_request_exception=False)  # ✅ 예외도 500 응답으로 기록
+        client.force_authenticate(viewer)
+
+        results = []
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            for pattern in iter_patterns(get_resolver().url_patterns):
+                result = self.bench_pattern(client, pattern, samples, options['iterations'])
+                if result:
+                    results.append(result)
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, ensure_ascii=False, indent=2))
+        else:
+            self.print_table(results)
+
+        errors = [r for r in results if r.get('status', 0) >= 500]
+        if options['fail_on_error'] and errors:
+            raise CommandError(f"5xx 응답 {len(errors)}건: " + ", ".join(r['name'] for r in errors))
+
+    def pick_viewer(self, user_id):
+        if user_id:
+            try:
+                return CustomUser.objects.get(id=user_id)
+            except CustomUser.DoesNotExist:
+                raise CommandError(f"사용자 '{user_id}'가 없습니다.")
+
+        viewer = (
+            CustomUser.objects.filter(posts__isnull=False)
+            .annotate(n=Count('sent_neighbor_requests', distinct=True) + Count('received_neighbor_requests', distinct=True))
+            .order_by('-n', 'id')
+            .first()
+        )
+        if viewer is None:
+            raise CommandError("게시물이 있는 사용자가 없습니다. 먼저 seed_data를 실행하세요.")
+        return viewer
+
+    def build_samples(self, viewer):
+        """ ✅ 경로/쿼리 파라미터에 넣을 샘플 값 (요청 사용자 기준으로 접근 가능한 데이터) """
+        neighbor_ids = neighbors_of(viewer)
+        target = CustomUser.objects.filter(id__in=neighbor_ids, posts__isnull=False).order_by('id').first() or viewer
+        target_posts = Post.objects.filter(user=target, status='published')
+
+        public_post = target_posts.filter(visibility='everyone').order_by('-comment_count', '-id').first()
+        comment = Comment.objects.filter(post=public_post, is_private=False).order_by('id').first() if public_post else None
+
+        def pk(obj):
+            return obj.pk if obj else 0
+
+        return {
+            'urlname': target.profile.urlname,
+            'public_post': pk(public_post),
+            'mutual_post': pk(target_posts.filter(visibility='mutual').first() or public_post),
+            'my_post': pk(Post.objects.filter(user=viewer, status='published').first()),
+            'my_draft': pk(Post.objects.filter(user=viewer, status='draft').first()),
+            'my_category': pk(Category.objects.filter(user=viewer).first()),
+            'target_category': pk(Category.objects.filter(user=target).first()),
+            'comment': pk(comment),
+        }
+
+    def build_url(self, pattern, samples):
+        name = pattern.name
+        kwargs = {}
+        for key in pattern.pattern.converters:
+            if key == 'pk':
+                kwargs[key] = samples[PK_SAMPLES.get(name, 'public_post')]
+            elif key == 'post_id':
+                kwargs[key] = samples['public_post']
+            elif key == 'comment_id':
+                kwargs[key] = samples['comment']
+            elif key.endswith('urlname'):
+                kwargs[key] = samples['urlname']
+            else:
+                return None
+        return reverse(name, kwargs=kwargs)
+
+    def bench_pattern(self, client, pattern, samples, iterations):
+        name = pattern.name
+        view_class = getattr(pattern.callback, 'view_class', None)
+        if not name or name.startswith('schema-') or view_class is None:
+            return None
+
+        if name in TOGGLE_ENDPOINTS:
+            method = 'post'
+        elif hasattr(view_class, 'get'):
+            method = 'get'
+        else:
+            return {'name': name, 'method': '-', 'skipped': "쓰기 전용 API"}
+
+        url = self.build_url(pattern, samples)
+        if url is None:
+            return {'name': name, 'method': method.upper(), 'skipped': "샘플 파라미터 없음"}
+        params = QUERY_SAMPLES.get(name, lambda s: {})(samples)
+        call = getattr(client, method)
+
+        # ✅ 토글은 짝수 번 호출해 데이터가 원래 상태로 돌아가도록
+        runs = iterations + iterations % 2 if name in TOGGLE_ENDPOINTS else iterations
+        call(url, params)  # ✅ 워밍업 (캐시 채우기)
+        if name in TOGGLE_ENDPOINTS:
+            call(url, params)
+
+        timings, query_counts, status = [], [], None
+        for _ in range(runs):
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                response = call(url, params)
+                timings.append((time.perf_counter() - started) * 1000)
+            query_counts.append(len(ctx.captured_queries))
+            status = response.status_code
+
+        return {
+            'name': name,
+            'method': method.upper(),
+            'url': url,
+            'status': status,
+            'p50_ms': round(statistics.median(timings), 2),
+            'p95_ms': round(percentile(timings, 95), 2),
+            'queries': max(query_counts),
+        }
+
+    def print_table(self, results):
+        self.stdout.write(f"{'endpoint':<28} {'method':<6} {'status':>6} {'p50 ms':>9} {'p95 ms':>9} {'queries':>8}")
+        for r in results:
+            if 'skipped' in r:
+                self.stdout.write(f"{r['name']:<28} {r['method']:<6} {'-':>6}  (건너뜀: {r['skipped']})")
+                continue
+            line = (
+                f"{r['name']:<28} {r['method']:<6} {r['status']:>6} "
+                f"{r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['queries']:>8}"
+            )
+            self.stdout.write(self.style.ERROR(line) if r['status'] >= 500 else line)
@@ -0,0 +1,85 @@
+import threading
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import override_settings
+
+from main.models.category import Category
+from main.models.customuser import CustomUser
+from main.models.heart import Heart
+from main.models.post import Post
+from main.utils.counters import BufferedCounter, get_like_count, increment_like_count
+
+
+class Command(BaseCommand):
+    help = "인기 게시물 하나에 동시 하트 토글을 보내 write-behind 버퍼 사용 전/후 처리량을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8, help="동시에 토글하는 사용자(스레드) 수")
+        parser.add_argument('--toggles', type=int, default=200, help="스레드당 토글 횟수")
+
+    def handle(self, *args, **options):
+        threads, toggles = options['threads'], options['toggles']
+        prefix = f"bench-{uuid.uuid4().hex[:8]}"
+
+        # ✅ 벤치마크 전용 사용자/게시물 생성 (끝나면 사용자 삭제 → CASCADE로 함께 정리)
+        owner = CustomUser.objects.create_user(id=f"{prefix}-owner", password=uuid.uuid4().hex)
+        category = Category.objects.create(user=owner, name="게시판")
+        post = Post.objects.create(user=owner, category=category, title="bench", content="bench", status="published")
+        users = [
+            CustomUser.objects.create_user(id=f"{prefix}-{i}", password=uuid.uuid4().hex)
+            for i in range(threads)
+        ]
+
+        try:
+            for label, enabled in (("direct (F() UPDATE)", False), ("buffered (sharded)", True)):
+                buffer_settings = {'ENABLED': enabled, 'SHARDS': 16, 'FLUSH_INTERVAL': 0.5}
+                # ✅ 모듈의 like_counter는 import 시점 설정으로 만들어지므로 라운드마다 설정대로 새로 생성
+                counter = BufferedCounter(
+                    shards=buffer_settings['SHARDS'], flush_interval=buffer_settings['FLUSH_INTERVAL'],
+                )
+                with override_settings(LIKE_COUNTER_BUFFER=buffer_settings):
+                    elapsed, errors = self.run_round(post, users, toggles, counter)
+                    counter.stop()
+                    post.refresh_from_db()
+                    total = threads * toggles
+                    hearts = Heart.objects.filter(post=post).count()
+                    self.stdout.write(
+                        f"{label:<22} {total} toggles in {elapsed:.2f}s "
+                        f"→ {total / elapsed:,.0f} toggles/s, errors={errors}, "
+                        f"like_count={get_like_count(post, counter=counter)} (hearts={hearts})"
+                    )
+                    # ✅ 다음 라운드를 같은 조건에서 시작하도록 정리
+                    Heart.objects.filter(post=post).delete()
+                    Post.objects.filter(pk=post.pk).update(like_count=0)
+        finally:
+            CustomUser.objects.filter(id__startswith=prefix).delete()
+
+    def run_round(self, post, users, toggles, counter):
+        errors = []
+        barrier = threading.Barrier(len(users))
+
+        def worker(user):
+            barrier.wait()
+            try:
+                for _ in range(toggles):
+                    # ✅ ToggleHeartView와 같은 경로: 하트 추가/삭제 + like_count 증감을 한 트랜잭션으로
+                    with transaction.atomic():
+                        heart, created = Heart.objects.get_or_create(post=post, user=user)
+                        if not created:
+                            heart.delete()
+                        increment_like_count(post, 1 if created else -1, counter=counter)
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=worker, args=(user,)) for user in users]
+        started = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        return time.perf_counter() - started, len(errors)
@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from main.utils.media_store import MEDIA_PREFIXES, all_referenced_files, walk_files
+
+
+class Command(BaseCommand):
+    help = "어떤 게시물 이미지/프로필도 참조하지 않는 미디어 파일(원본 + 변형)을 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="삭제하지 않고 대상만 출력")
+        parser.add_argument(
+            '--grace-minutes', type=int, default=60,
+            help="최근 이 시간(분) 안에 저장된 파일은 건너뜀 (저장 직후 아직 행에 기록되기 전인 파일 보호)",
+        )
+
+    def handle(self, *args, **options):
+        referenced = all_referenced_files()
+        cutoff = timezone.now() - timedelta(minutes=options['grace_minutes'])
+        removed = freed = 0
+
+        for prefix in MEDIA_PREFIXES:
+            for name in walk_files(prefix):
+                if name in referenced or default_storage.get_modified_time(name) > cutoff:
+                    continue
+                size = default_storage.size(name)
+                if options['dry_run']:
+                    self.stdout.write(f"  {name} ({size} bytes)")
+                else:
+                    default_storage.delete(name)
+                removed += 1
+                freed += size
+
+        action = "삭제 대상" if options['dry_run'] else "삭제"
+        self.stdout.write(self.style.SUCCESS(f"✅ 참조되지 않는 파일 {removed}개 {action} ({freed / 1024 / 1024:.1f} MB)"))
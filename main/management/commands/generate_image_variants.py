@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from main.models.post import PostImage
+from main.models.profile import Profile
+from main.utils.image_pipeline import process_field_variants
+
+
+class Command(BaseCommand):
+    help = "변형 이미지(thumb/medium + WebP)가 없는 게시물 이미지와 블로그/프로필 사진의 변형을 일괄 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help="이미 변형이 있는 이미지도 다시 생성")
+        parser.add_argument('--dry-run', action='store_true', help="대상 개수만 출력")
+
+    def handle(self, *args, **options):
+        targets = [
+            (PostImage.objects.filter(status=PostImage.STATUS_READY), 'image', 'variants'),
+            (Profile.objects.exclude(blog_pic__in=['', Profile.DEFAULT_PICS['blog_pic']]).exclude(blog_pic=None),
+             'blog_pic', 'blog_pic_variants'),
+            (Profile.objects.exclude(user_pic__in=['', Profile.DEFAULT_PICS['user_pic']]).exclude(user_pic=None),
+             'user_pic', 'user_pic_variants'),
+        ]
+
+        for queryset, field, variants_field in targets:
+            if not options['all']:
+                queryset = queryset.filter(**{variants_field: {}})
+            pks = list(queryset.values_list('pk', flat=True))
+            label = f"{queryset.model.__name__}.{field}"
+            self.stdout.write(f"{label}: {len(pks)}개")
+            if options['dry_run']:
+                continue
+
+            # ✅ 요청 처리와 같은 함수로 한 건씩 생성 (원본이 그 사이 바뀌었으면 건너뜀)
+            for index, pk in enumerate(pks, start=1):
+                process_field_variants(queryset.model._meta.label, pk, field, variants_field)
+                if index % 100 == 0:
+                    self.stdout.write(f"  {label}: {index}/{len(pks)}")
+
+        self.stdout.write(self.style.SUCCESS("✅ 변형 이미지 생성 완료"))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from main.models.post import Post
+from main.utils.search_index import rebuild_index
+
+
+class Command(BaseCommand):
+    help = "게시물 검색 색인(PostSearchTerm)을 처음부터 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--post', type=int, action='append', dest='post_ids',
+                            help="특정 게시물 id만 다시 색인 (여러 번 지정 가능)")
+
+    def handle(self, *args, **options):
+        posts = Post.objects.all()
+        if options['post_ids']:
+            posts = posts.filter(id__in=options['post_ids'])
+
+        rebuild_index(posts.order_by('id'))
+        self.stdout.write(self.style.SUCCESS(f"✅ 게시물 {posts.count()}개 색인 완료"))
@@ -0,0 +1,72 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from main.models.comment import Comment
+from main.models.commentHeart import CommentHeart
+from main.models.heart import Heart
+from main.models.customuser import CustomUser
+from main.models.post import Post
+from main.models.postCount import PostCount
+
+
+def count_subquery(model, fk, ref='pk', **filters):
+    """ ✅ 외부 행(ref)을 참조하는 model 행 개수를 세는 서브쿼리 (없으면 0) """
+    counts = (
+        model.objects.filter(**{fk: OuterRef(ref)}, **filters)
+        .order_by()
+        .values(fk)
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+class Command(BaseCommand):
+    help = "게시물 like_count / comment_count, 댓글 like_count, 사용자별 게시물 수 카운터를 실제 행 개수로 일괄 재계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="어긋난 행 개수만 출력하고 수정하지 않음")
+
+    def handle(self, *args, **options):
+        post_likes = count_subquery(Heart, 'post')
+        post_comments = count_subquery(Comment, 'post')
+        comment_likes = count_subquery(CommentHeart, 'comment')
+
+        drifted_posts = Post.objects.annotate(
+            actual_likes=post_likes, actual_comments=post_comments
+        ).filter(~Q(like_count=F('actual_likes')) | ~Q(comment_count=F('actual_comments'))).count()
+        drifted_comments = Comment.objects.annotate(
+            actual_likes=comment_likes
+        ).filter(~Q(like_count=F('actual_likes'))).count()
+
+        # ✅ 사용자별 게시물 수 (공개 범위 × 상태) - 카운터 행이 없는 사용자는 새로 만듦
+        post_counts = {
+            column: count_subquery(Post, 'user', ref='user', visibility=visibility, status=post_status)
+            for (visibility, post_status), column in PostCount.COLUMNS.items()
+        }
+        drifted_post_counts = PostCount.objects.annotate(
+            **{f"actual_{column}": expression for column, expression in post_counts.items()}
+        ).filter(
+            Q(*[~Q(**{column: F(f"actual_{column}")}) for column in post_counts], _connector=Q.OR)
+        ).count()
+        missing_post_counts = CustomUser.objects.filter(post_counts__isnull=True).values_list('pk', flat=True)
+
+        self.stdout.write(
+            f"어긋난 게시물 {drifted_posts}개, 댓글 {drifted_comments}개, "
+            f"게시물 수 카운터 {drifted_post_counts}개 (없음 {missing_post_counts.count()}개)"
+        )
+        if options['dry_run']:
+            return
+
+        # ✅ 행마다 저장하지 않고 UPDATE ... SET = (SELECT COUNT(*) ...) 한 번씩으로 처리
+        with transaction.atomic():
+            Post.objects.update(like_count=post_likes, comment_count=post_comments)
+            Comment.objects.update(like_count=comment_likes)
+            PostCount.objects.bulk_create(
+                [PostCount(user_id=user_id) for user_id in missing_post_counts], ignore_conflicts=True
+            )
+            PostCount.objects.update(**post_counts)
+
+        self.stdout.write(self.style.SUCCESS("✅ 카운터 재계산 완료"))
@@ -0,0 +1,136 @@
+import io
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from PIL import Image
+
+from main.models.category import Category
+from main.models.comment import Comment
+from main.models.customuser import CustomUser
+from main.models.heart import Heart
+from main.models.neighbor import Neighbor
+from main.models.post import Post, PostImage
+
+SEED_PASSWORD = "seed-password"  # ✅ 시드 사용자 공통 비밀번호 (로그인 테스트용)
+
+WORDS = [
+    "여행", "맛집", "카페", "일상", "독서", "영화", "음악", "사진", "운동", "요리",
+    "개발", "파이썬", "장고", "블로그", "주말", "산책", "바다", "캠핑", "리뷰", "후기",
+]
+
+
+class Command(BaseCommand):
+    help = "부하 테스트/벤치마크용 합성 데이터(사용자·서로이웃·게시물·이미지·댓글·하트)를 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=50, help="생성할 사용자 수")
+        parser.add_argument('--neighbors', type=int, default=5, help="사용자당 서로이웃 수 (평균)")
+        parser.add_argument('--posts', type=int, default=20, help="사용자당 게시물 수")
+        parser.add_argument('--images', type=int, default=1, help="게시물당 이미지 수")
+        parser.add_argument('--comments', type=int, default=5, help="게시물당 댓글 수 (절반은 대댓글)")
+        parser.add_argument('--hearts', type=int, default=5, help="게시물당 하트 수")
+        parser.add_argument('--prefix', default="seed", help="생성할 사용자 id 접두사")
+        parser.add_argument('--random-seed', type=int, default=42, help="난수 시드 (같은 값이면 같은 데이터)")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['random_seed'])
+        prefix = options['prefix']
+
+        if CustomUser.objects.filter(id__startswith=f"{prefix}-").exists():
+            raise CommandError(f"'{prefix}-' 사용자가 이미 있습니다. --prefix를 바꾸거나 기존 데이터를 지우세요.")
+
+        # ✅ 시그널(프로필·색인·카운터·소식/활동)이 실제 요청과 같은 경로로 동작하도록 ORM create 사용
+        with transaction.atomic():
+            users = self.create_users(prefix, options['users'])
+            self.create_neighbors(rng, users, options['neighbors'])
+            posts = self.create_posts(rng, users, options['posts'], options['images'])
+            comments = self.create_comments(rng, users, posts, options['comments'])
+            hearts = self.create_hearts(rng, users, posts, options['hearts'])
+            call_command('reconcile_counts', stdout=self.stdout)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"사용자 {len(users)}명, 게시물 {len(posts)}개, 댓글 {comments}개, 하트 {hearts}개 생성 완료 "
+            f"(비밀번호: {SEED_PASSWORD})"
+        ))
+
+    def create_users(self, prefix, count):
+        password = make_password(SEED_PASSWORD)  # ✅ 해시는 한 번만 계산
+        users = []
+        for i in range(count):
+            user = CustomUser(id=f"{prefix}-{i:05d}", password=password)
+            user.save()  # ✅ create_profile 시그널로 Profile 생성
+            Category.objects.get_or_create(name="게시판", user=user)
+            users.append(user)
+        return users
+
+    def create_neighbors(self, rng, users, degree):
+        pairs = set()
+        for user in users:
+            others = [other for other in users if other.pk != user.pk]
+            for other in rng.sample(others, min(degree, len(others))):
+                if (other.pk, user.pk) not in pairs:
+                    pairs.add((user.pk, other.pk))
+        for from_id, to_id in sorted(pairs):
+            # ✅ Neighbor.save()에서 Profile.neighbors도 함께 반영되도록 개별 생성
+            Neighbor.objects.create(from_user_id=from_id, to_user_id=to_id, status="accepted")
+
+    def create_posts(self, rng, users, per_user, images_per_post):
+        image_bytes = self.sample_image()
+        categories = dict(Category.objects.filter(user__in=users, name="게시판").values_list("user_id", "id"))
+        subjects = [choice[0] for choice in Post.SUBJECT_CHOICES]
+
+        posts = []
+        for user in users:
+            for _ in range(per_user):
+                words = rng.sample(WORDS, 4)
+                post = Post.objects.create(
+                    user=user,
+                    category_id=categories[user.pk],
+                    title=" ".join(words[:2]),
+                    content="<p>" + " ".join(rng.choices(WORDS, k=40)) + "</p>",
+                    subject=rng.choice(subjects),
+                    status=rng.choices(["published", "draft"], weights=[9, 1])[0],
+                    visibility=rng.choices(["everyone", "mutual", "me"], weights=[7, 2, 1])[0],
+                )
+                for index in range(images_per_post):
+                    image = PostImage(post=post, caption=" ".join(rng.sample(WORDS, 2)), is_representative=index == 0)
+                    image.image.save(f"seed_{index}.png", ContentFile(image_bytes), save=True)
+                posts.append(post)
+        return posts
+
+    def create_comments(self, rng, users, posts, per_post):
+        profiles = {user.pk: user.profile for user in users}
+        count = 0
+        for post in posts:
+            parents = []
+            for index in range(per_post):
+                author = profiles[rng.choice(users).pk]
+                parent = rng.choice(parents) if parents and index % 2 else None
+                comment = Comment.objects.create(
+                    post=post, author=author, author_name=author.username,
+                    content=" ".join(rng.choices(WORDS, k=8)),
+                    parent=parent, is_parent=parent is None,
+                    is_private=rng.random() < 0.1,
+                )
+                if parent is None:
+                    parents.append(comment)
+                count += 1
+        return count
+
+    def create_hearts(self, rng, users, posts, per_post):
+        count = 0
+        for post in posts:
+            for user in rng.sample(users, min(per_post, len(users))):
+                Heart.objects.create(post=post, user=user)  # ✅ like_count는 생성 후 reconcile_counts로 맞춤
+                count += 1
+        return count
+
+    @staticmethod
+    def sample_image():
+        buffer = io.BytesIO()
+        Image.new("RGB", (64, 64), (3, 199, 90)).save(buffer, format="PNG")
+        return buffer.getvalue()
@@ -0,0 +1,73 @@
+import logging
+import time
+from contextlib import ExitStack
+
+from django.db import connections
+
+from main.utils.profiling import QueryBudgetExceeded, profile_request, profiling_settings, request_stats
+
+logger = logging.getLogger(__name__)
+
+
+class RequestProfilingMiddleware:
+    """
+    ✅ 요청별 쿼리 수 / DB 시간 / Serializer 시간 / 응답 크기 측정
+    - Server-Timing 헤더로 노출 (브라우저 개발자 도구 Network 탭에서 확인 가능)
+    - 엔드포인트별 최근 측정값은 request_stats에 누적 → /profiling/stats/ (관리자 전용)
+    - 뷰 클래스에 query_budget을 선언하면 초과 시
+      QUERY_BUDGET_STRICT(테스트)에서는 예외, 운영에서는 경고 로그
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        config = profiling_settings()
+        if not config['ENABLED']:
+            return self.get_response(request)
+
+        started = time.perf_counter()
+        with profile_request() as profile, ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(profile.execute_wrapper))
+            response = self.get_response(request)
+        total_ms = (time.perf_counter() - started) * 1000
+
+        sample = {
+            'total_ms': total_ms,
+            'queries': profile.queries,
+            'serializer_queries': profile.serializer_queries,
+            'db_ms': profile.db_time * 1000,
+            'serializer_ms': profile.serializer_time * 1000,
+            'bytes': 0 if response.streaming else len(response.content),
+        }
+
+        if config['SERVER_TIMING']:
+            response['Server-Timing'] = ", ".join([
+                f'db;dur={sample["db_ms"]:.1f};desc="{profile.queries} queries"',
+                f'ser;dur={sample["serializer_ms"]:.1f};desc="{profile.serializer_queries} queries"',
+                f'total;dur={total_ms:.1f}',
+            ])
+
+        match = request.resolver_match
+        if match is not None:
+            endpoint = f"{request.method} {match.view_name}"
+            request_stats.record(endpoint, sample, config['WINDOW'])
+            self.check_query_budget(match.func, request.method, endpoint, profile.queries, config)
+
+        return response
+
+    @staticmethod
+    def check_query_budget(view_func, method, endpoint, queries, config):
+        """ ✅ query_budget = 5 (모든 메서드) 또는 {'GET': 5, 'POST': 12} (메서드별) """
+        view_class = getattr(view_func, 'view_class', None)
+        budget = getattr(view_class, 'query_budget', None)
+        if isinstance(budget, dict):
+            budget = budget.get(method)
+        if budget is None or queries <= budget:
+            return
+
+        message = f"{endpoint}: 쿼리 {queries}개 실행 (query_budget={budget})"
+        if config['QUERY_BUDGET_STRICT']:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
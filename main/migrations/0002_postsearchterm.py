@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('field', models.CharField(choices=[('title', '제목'), ('content', '본문'), ('caption', '사진 설명')], max_length=10)),
+                ('term', models.CharField(max_length=10)),
+                ('frequency', models.PositiveIntegerField(default=1)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='main.post')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'post'], name='main_search_term_post_idx')],
+                'unique_together': {('post', 'field', 'term')},
+            },
+        ),
+    ]
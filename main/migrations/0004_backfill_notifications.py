@@ -0,0 +1,48 @@
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+
+def backfill_notifications(apps, schema_editor):
+    """ ✅ 기존 미확인 댓글/대댓글/하트로 '내 소식' 수신함 채우기 """
+    Comment = apps.get_model('main', 'Comment')
+    Heart = apps.get_model('main', 'Heart')
+    Notification = apps.get_model('main', 'Notification')
+
+    batch = []
+
+    def add(**fields):
+        batch.append(Notification(**fields))
+        if len(batch) >= BATCH_SIZE:
+            Notification.objects.bulk_create(batch)
+            batch.clear()
+
+    comments = Comment.objects.filter(is_read=False).values_list(
+        'id', 'post_id', 'post__user_id', 'author__user_id', 'parent__author__user_id', 'created_at'
+    )
+    for comment_id, post_id, owner_id, actor_id, parent_author_id, created_at in comments.iterator():
+        common = dict(actor_id=actor_id, post_id=post_id, comment_id=comment_id, created_at=created_at)
+        if owner_id != actor_id:
+            add(recipient_id=owner_id, type='post_comment', **common)
+        if parent_author_id and parent_author_id not in (actor_id, owner_id):
+            add(recipient_id=parent_author_id, type='comment_reply', **common)
+
+    hearts = Heart.objects.filter(is_read=False).values_list('id', 'post_id', 'post__user_id', 'user_id', 'created_at')
+    for heart_id, post_id, owner_id, actor_id, created_at in hearts.iterator():
+        if owner_id != actor_id:
+            add(recipient_id=owner_id, actor_id=actor_id, type='post_like',
+                post_id=post_id, heart_id=heart_id, created_at=created_at)
+
+    if batch:
+        Notification.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0003_notification'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_notifications, migrations.RunPython.noop),
+    ]
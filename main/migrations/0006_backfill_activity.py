@@ -0,0 +1,51 @@
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+
+def backfill_activity(apps, schema_editor):
+    """ ✅ 기존 미확인 하트/댓글 좋아요/댓글/대댓글로 '내 활동' 기록 채우기 """
+    Comment = apps.get_model('main', 'Comment')
+    Heart = apps.get_model('main', 'Heart')
+    CommentHeart = apps.get_model('main', 'CommentHeart')
+    Activity = apps.get_model('main', 'Activity')
+
+    batch = []
+
+    def add(**fields):
+        batch.append(Activity(**fields))
+        if len(batch) >= BATCH_SIZE:
+            Activity.objects.bulk_create(batch)
+            batch.clear()
+
+    hearts = Heart.objects.filter(is_read=False).values_list('id', 'user_id', 'post_id', 'created_at')
+    for heart_id, user_id, post_id, created_at in hearts.iterator():
+        add(user_id=user_id, type='liked_post', post_id=post_id, heart_id=heart_id, created_at=created_at)
+
+    comment_hearts = CommentHeart.objects.filter(is_read=False).values_list(
+        'id', 'user_id', 'comment_id', 'comment__post_id', 'created_at'
+    )
+    for comment_heart_id, user_id, comment_id, post_id, created_at in comment_hearts.iterator():
+        add(user_id=user_id, type='liked_comment', post_id=post_id, comment_id=comment_id,
+            comment_heart_id=comment_heart_id, created_at=created_at)
+
+    comments = Comment.objects.filter(is_read=False).values_list(
+        'id', 'author__user_id', 'post_id', 'is_parent', 'created_at'
+    )
+    for comment_id, user_id, post_id, is_parent, created_at in comments.iterator():
+        add(user_id=user_id, type='written_comment' if is_parent else 'written_reply',
+            post_id=post_id, comment_id=comment_id, created_at=created_at)
+
+    if batch:
+        Activity.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0005_activity'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_activity, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0006_backfill_activity'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='blog_name',
+            field=models.CharField(db_index=True, max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='profile',
+            name='username',
+            field=models.CharField(db_index=True, default='Unnamed', max_length=15),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'parent', 'created_at'], name='main_comment_thread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['user', 'status', '-created_at'], name='main_post_user_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['visibility', 'status', '-created_at'], name='main_post_vis_status_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0007_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postimage',
+            name='status',
+            field=models.CharField(choices=[('pending', '처리 중'), ('ready', '처리 완료'), ('failed', '처리 실패')], default='ready', max_length=10),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:18
+
+from django.db import migrations, models
+
+from main.models.post import make_excerpt
+
+BATCH_SIZE = 1000
+
+
+def backfill_excerpt(apps, schema_editor):
+    """ ✅ 기존 게시물의 본문 요약 채우기 """
+    Post = apps.get_model('main', 'Post')
+
+    batch = []
+    for post in Post.objects.only('id', 'content').iterator(chunk_size=BATCH_SIZE):
+        post.excerpt = make_excerpt(post.content)
+        batch.append(post)
+        if len(batch) >= BATCH_SIZE:
+            Post.objects.bulk_update(batch, ['excerpt'])
+            batch.clear()
+
+    if batch:
+        Post.objects.bulk_update(batch, ['excerpt'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0009_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='excerpt',
+            field=models.CharField(blank=True, default='', max_length=153),
+        ),
+        migrations.RunPython(backfill_excerpt, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+BATCH_SIZE = 1000
+
+
+def backfill_post_counts(apps, schema_editor):
+    """ ✅ 기존 사용자의 게시물 수 카운터 채우기 (공개 범위 × 상태별로 GROUP BY 한 번) """
+    Post = apps.get_model('main', 'Post')
+    PostCount = apps.get_model('main', 'PostCount')
+    CustomUser = apps.get_model('main', 'CustomUser')
+
+    columns = {
+        f"{visibility}_{post_status}": Count('id', filter=Q(visibility=visibility, status=post_status))
+        for visibility in ('everyone', 'mutual', 'me')
+        for post_status in ('published', 'draft')
+    }
+    counts = {
+        row.pop('user_id'): row
+        for row in Post.objects.order_by().values('user_id').annotate(**columns)
+    }
+    rows = [PostCount(user_id=user_id, **counts.get(user_id, {})) for user_id in CustomUser.objects.values_list('pk', flat=True)]
+    PostCount.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0013_postimage_content_hash_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostCount',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='post_counts', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('everyone_published', models.PositiveIntegerField(default=0)),
+                ('mutual_published', models.PositiveIntegerField(default=0)),
+                ('me_published', models.PositiveIntegerField(default=0)),
+                ('everyone_draft', models.PositiveIntegerField(default=0)),
+                ('mutual_draft', models.PositiveIntegerField(default=0)),
+                ('me_draft', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_post_counts, migrations.RunPython.noop),
+    ]
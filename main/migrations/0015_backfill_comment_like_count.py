@@ -0,0 +1,29 @@
+from django.db import migrations
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_comment_like_count(apps, schema_editor):
+    """ ✅ 이전에는 갱신되지 않던 댓글 like_count를 기존 댓글 좋아요 수로 채우기 (UPDATE 한 번) """
+    Comment = apps.get_model('main', 'Comment')
+    CommentHeart = apps.get_model('main', 'CommentHeart')
+
+    likes = (
+        CommentHeart.objects.filter(comment=OuterRef('pk'))
+        .order_by()
+        .values('comment')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    Comment.objects.update(like_count=Coalesce(Subquery(likes, output_field=IntegerField()), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0014_postcount'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_comment_like_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+from collections import Counter, defaultdict
+
+from django.db import migrations
+
+from main.utils.search_index import tokenize
+
+BATCH_SIZE = 1000
+
+
+def backfill_search_index(apps, schema_editor):
+    """
+    ✅ 기존 게시물 전체의 검색 색인 다시 만들기
+    - 0002 이전에 작성된 게시물은 색인이 없고, 이전 토큰 방식(1글자 토큰 없음)으로 만든 색인도 새 방식으로 교체
+    """
+    Post = apps.get_model('main', 'Post')
+    PostImage = apps.get_model('main', 'PostImage')
+    PostSearchTerm = apps.get_model('main', 'PostSearchTerm')
+
+    captions = defaultdict(list)
+    for post_id, caption in PostImage.objects.exclude(caption__isnull=True).values_list('post_id', 'caption').iterator():
+        captions[post_id].append(caption)
+
+    PostSearchTerm.objects.all().delete()
+    batch = []
+    for post_id, title, content in Post.objects.order_by('id').values_list('id', 'title', 'content').iterator():
+        for field, text in (('title', title), ('content', content), ('caption', " ".join(captions[post_id]))):
+            batch.extend(
+                PostSearchTerm(post_id=post_id, field=field, term=term, frequency=freq)
+                for term, freq in Counter(tokenize(text)).items()
+            )
+        if len(batch) >= BATCH_SIZE:
+            PostSearchTerm.objects.bulk_create(batch, batch_size=BATCH_SIZE)
+            batch.clear()
+
+    if batch:
+        PostSearchTerm.objects.bulk_create(batch, batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0015_backfill_comment_like_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_search_index, migrations.RunPython.noop),
+    ]
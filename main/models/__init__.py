@@ -5,4 +5,8 @@ from .comment import Comment
 from .heart import Heart
 from .commentHeart import CommentHeart
 from .neighbor import Neighbor
-from .category import Category
\ No newline at end of file
+from .category import Category
+from .postSearchTerm import PostSearchTerm
+from .postCount import PostCount
+from .notification import Notification
+from .activity import Activity
\ No newline at end of file
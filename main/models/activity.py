@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from main.models.post import Post
+from main.models.comment import Comment
+from main.models.heart import Heart
+from main.models.commentHeart import CommentHeart
+
+
+class Activity(models.Model):
+    """
+    ✅ 사용자별 '내 활동' 기록 (생성 시 한 행씩 추가되는 로그)
+    - 하트/댓글 좋아요/댓글/대댓글이 생성될 때 signals에서 기록
+    - 조회는 (user, is_read, created_at) 인덱스 한 번으로 최신순 페이지를 가져옴
+    - 원본 하트/댓글이 삭제되면 CASCADE로 함께 삭제 (좋아요 취소 시 활동도 사라짐)
+    """
+    TYPE_CHOICES = [
+        ('liked_post', '좋아요 누른 게시글'),
+        ('liked_comment', '좋아요 누른 댓글'),
+        ('written_comment', '작성한 댓글'),
+        ('written_reply', '작성한 대댓글'),
+    ]
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="activities")
+    type = models.CharField(max_length=20, choices=TYPE_CHOICES)
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="+")
+    comment = models.ForeignKey(Comment, on_delete=models.CASCADE, null=True, blank=True, related_name="+")
+    heart = models.ForeignKey(Heart, on_delete=models.CASCADE, null=True, blank=True, related_name="+")
+    comment_heart = models.ForeignKey(CommentHeart, on_delete=models.CASCADE, null=True, blank=True, related_name="+")
+    is_read = models.BooleanField(default=False)
+    created_at = models.DateTimeField(default=timezone.now)  # ✅ 원본 하트/댓글의 생성 시각
+
+    class Meta:
+        verbose_name_plural = "Activities"
+        indexes = [
+            models.Index(fields=['user', 'is_read', '-created_at'], name='main_activity_feed_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.type}"
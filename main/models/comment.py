@@ -1,8 +1,10 @@
 from django.db import models
 from main.models.post import Post
 from main.models.profile import Profile
+from main.models.tracking import FieldTrackerMixin
+from main.utils.neighbors import is_mutual
 
-class Comment(models.Model):
+class Comment(FieldTrackerMixin, models.Model):
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='comments')
     author = models.ForeignKey(Profile, on_delete=models.CASCADE)
     author_name = models.CharField(max_length=15)
@@ -16,12 +18,15 @@ class Comment(models.Model):
     updated_at = models.DateTimeField(auto_now=True)  # ✅ 새로 추가된 필드
     is_read = models.BooleanField(default=False)  # ✅ 읽음 상태 필드 추가
 
+    tracked_fields = ('post', 'author', 'content', 'is_private')
+
     def save(self, *args, **kwargs):
-        """ ✅ 게시글 작성자 여부 자동 설정 """
-        if hasattr(self.post.user, 'profile'):  # ✅ post.author → post.user 변경
-            self.is_post_author = self.author == self.post.user.profile  # ✅ Profile과 Profile 비교
-        else:
-            self.is_post_author = False  # ✅ 예외 처리
+        """ ✅ 게시글 작성자 여부 자동 설정 (작성 시 / 게시글·작성자가 바뀐 경우에만 조회) """
+        if self.has_changed('post', 'author'):
+            if hasattr(self.post.user, 'profile'):  # ✅ post.author → post.user 변경
+                self.is_post_author = self.author == self.post.user.profile  # ✅ Profile과 Profile 비교
+            else:
+                self.is_post_author = False  # ✅ 예외 처리
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -32,7 +37,7 @@ class Comment(models.Model):
         if self.post.visibility == 'everyone':
             return True  # ✅ 모두 공개 게시물
         elif self.post.visibility == 'mutual':
-            return self.post.user.profile.is_mutual(user.profile)  # ✅ 서로 이웃 여부 확인
+            return is_mutual(self.post.user_id, user)  # ✅ 서로 이웃 여부 확인
         elif self.post.visibility == 'me':
             return self.post.user.profile == user.profile  # ✅ Profile과 Profile 비교
         return False
@@ -41,6 +46,10 @@ class Comment(models.Model):
     class Meta:
         verbose_name = "Comment"
         verbose_name_plural = "Comments"
+        indexes = [
+            # ✅ 게시글의 최상위 댓글 / 대댓글 스레드 조회 (작성순)
+            models.Index(fields=['post', 'parent', 'created_at'], name='main_comment_thread_idx'),
+        ]
 
 
 
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from main.models.post import Post
+from main.models.comment import Comment
+from main.models.heart import Heart
+
+
+class Notification(models.Model):
+    """
+    ✅ 사용자별 '내 소식' 수신함 (쓰기 시 팬아웃)
+    - 댓글/대댓글/하트가 생성될 때 signals에서 받는 사람마다 한 행씩 미리 만들어 둠
+    - 조회는 (recipient, is_read, created_at) 인덱스 한 번으로 최신순 페이지를 가져옴
+    - 원본 댓글/하트가 삭제되면 CASCADE로 함께 삭제 (좋아요 취소 시 소식도 사라짐)
+    """
+    TYPE_CHOICES = [
+        ('post_comment', '내 게시글에 달린 댓글'),
+        ('post_like', '내 게시글에 달린 좋아요'),
+        ('comment_reply', '내 댓글에 달린 대댓글'),
+    ]
+
+    recipient = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="notifications")
+    actor = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+    type = models.CharField(max_length=20, choices=TYPE_CHOICES)
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="+")
+    comment = models.ForeignKey(Comment, on_delete=models.CASCADE, null=True, blank=True, related_name="+")
+    heart = models.ForeignKey(Heart, on_delete=models.CASCADE, null=True, blank=True, related_name="+")
+    is_read = models.BooleanField(default=False)
+    created_at = models.DateTimeField(default=timezone.now)  # ✅ 원본 댓글/하트의 생성 시각
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['recipient', 'is_read', '-created_at'], name='main_notification_inbox_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.type} → {self.recipient_id}"
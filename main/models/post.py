@@ -1,8 +1,12 @@
+import html
+import re
 import uuid
 import os
-from django.db import models
+from django.db import models, transaction
+from django.utils.html import strip_tags
 from django.conf import settings
 from ..models.category import Category
+from ..models.tracking import FieldTrackerMixin
 
 # ✅ UUID 기반 이미지 경로 생성 함수
 def image_upload_path(instance, filename):
@@ -11,7 +15,16 @@ def image_upload_path(instance, filename):
     return os.path.join("post_pics", str(instance.post.id), f"{unique_name}.{ext}")
 
 
-class Post(models.Model):
+EXCERPT_LENGTH = 150
+
+
+def make_excerpt(content, length=EXCERPT_LENGTH):
+    """ ✅ 목록 카드용 본문 요약 (태그 제거 → 공백 정리 → 앞부분 length자) """
+    text = re.sub(r'\s+', ' ', html.unescape(strip_tags(content or ''))).strip()
+    return text if len(text) <= length else text[:length].rstrip() + "..."
+
+
+class Post(FieldTrackerMixin, models.Model):
     VISIBILITY_CHOICES = [
         ('everyone', '전체 공개'),
         ('mutual', '서로 이웃만 공개'),
@@ -58,6 +71,7 @@ class Post(models.Model):
     keyword = models.CharField(max_length=50, choices=KEYWORD_CHOICES, default="default")
     title = models.CharField(max_length=100)
     content = models.TextField(blank=True, null=True)
+    excerpt = models.CharField(max_length=EXCERPT_LENGTH + 3, blank=True, default="")  # ✅ 저장 시 content에서 계산 (목록 카드용)
     status = models.CharField(max_length=10, choices=POST_CHOICES, default='draft')
     visibility = models.CharField(max_length=10, choices=VISIBILITY_CHOICES, default='everyone')
     like_count = models.PositiveIntegerField(default=0)
@@ -66,8 +80,21 @@ class Post(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     is_read = models.BooleanField(default=False)
 
+    tracked_fields = ('user', 'category', 'title', 'content', 'status', 'visibility')
+
+    class Meta:
+        indexes = [
+            # ✅ 내 게시물 / 특정 블로그 목록 (user + status 필터, 최신순)
+            models.Index(fields=['user', 'status', '-created_at'], name='main_post_user_status_idx'),
+            # ✅ 전체 공개 글 목록·검색 (visibility + status 필터, 최신순)
+            models.Index(fields=['visibility', 'status', '-created_at'], name='main_post_vis_status_idx'),
+        ]
+
     def save(self, *args, **kwargs):
-        if not self.category or not Category.objects.filter(id=self.category.id).exists():
+        # ✅ 카테고리가 바뀐 경우에만 존재 여부 확인 (카운터 등만 저장할 때는 조회 생략)
+        if not self.category_id or (
+            self.has_changed('category') and not Category.objects.filter(id=self.category_id).exists()
+        ):
             self.category, _ = Category.objects.get_or_create(id=1, name="게시판")
 
         keyword_mapping = {
@@ -78,7 +105,17 @@ class Post(models.Model):
             "default": ["주제 선택 안 함"],
         }
         self.keyword = next((key for key, values in keyword_mapping.items() if self.subject in values), "default")
-        super().save(*args, **kwargs)
+
+        # ✅ 본문 요약은 content가 바뀔 때만 다시 계산해 함께 저장
+        if self.has_changed('content'):
+            self.excerpt = make_excerpt(self.content)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'content' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'excerpt'}
+
+        # ✅ 게시물 수 카운터(post_save signal)가 게시물 저장과 같은 트랜잭션에서 반영되도록
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
     @property
     def absolute_url(self):
@@ -96,10 +133,22 @@ class PostImage(models.Model):
     """
     ✅ 게시물에 포함된 이미지 저장 모델
     """
+    STATUS_PENDING = 'pending'
+    STATUS_READY = 'ready'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '처리 중'),
+        (STATUS_READY, '처리 완료'),
+        (STATUS_FAILED, '처리 실패'),
+    ]
+
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="images")
     image = models.ImageField(upload_to=image_upload_path)
     caption = models.CharField(max_length=255, blank=True, null=True)
     is_representative = models.BooleanField(default=False)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_READY)  # ✅ 업로드 이미지 처리(워커) 상태
+    variants = models.JSONField(default=dict, blank=True)  # ✅ thumb/medium(+WebP) 변형 파일 경로 (main/utils/image_variants.py)
+    content_hash = models.CharField(max_length=64, blank=True, default="", db_index=True)  # ✅ 업로드 원본의 SHA-256 (같은 이미지 재사용)
 
     @property
     def absolute_url(self):
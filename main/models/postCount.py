@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.db import models
+from main.models.post import Post
+
+
+class PostCount(models.Model):
+    """
+    ✅ 사용자별 게시물 수 카운터 (공개 범위 × 상태)
+    - Post 생성/수정/삭제 시 signals에서 같은 트랜잭션 안에서 증감 (main/utils/post_counts.py)
+    - 블로그 헤더의 글 개수는 COUNT 없이 이 행 하나로 계산
+    - 어긋나면 `python manage.py reconcile_counts`로 실제 게시물 수에 맞춤
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="post_counts"
+    )
+    everyone_published = models.PositiveIntegerField(default=0)
+    mutual_published = models.PositiveIntegerField(default=0)
+    me_published = models.PositiveIntegerField(default=0)
+    everyone_draft = models.PositiveIntegerField(default=0)
+    mutual_draft = models.PositiveIntegerField(default=0)
+    me_draft = models.PositiveIntegerField(default=0)
+
+    # ✅ (visibility, status) → 카운터 컬럼 이름
+    COLUMNS = {
+        (visibility, post_status): f"{visibility}_{post_status}"
+        for visibility, _ in Post.VISIBILITY_CHOICES
+        for post_status, _ in Post.POST_CHOICES
+    }
+
+    @classmethod
+    def column(cls, visibility, post_status):
+        return cls.COLUMNS[(visibility, post_status)]
+
+    def published(self, visibilities):
+        """ ✅ 주어진 공개 범위의 발행 글 수 합계 """
+        return sum(getattr(self, self.column(visibility, 'published')) for visibility in visibilities)
+
+    def __str__(self):
+        return f"{self.user_id} 게시물 수"
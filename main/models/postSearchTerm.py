@@ -0,0 +1,29 @@
+from django.db import models
+from main.models.post import Post
+
+
+class PostSearchTerm(models.Model):
+    """
+    ✅ 게시물 검색용 역색인 (n-gram 토큰 → 게시물)
+    - 제목 / 본문 / 사진 설명을 2-gram으로 쪼개 저장 (한국어는 띄어쓰기만으로 검색이 어려워 n-gram 사용)
+    - Post / PostImage 저장·삭제 시 signals에서 해당 게시물만 다시 색인
+    """
+    FIELD_CHOICES = [
+        ('title', '제목'),
+        ('content', '본문'),
+        ('caption', '사진 설명'),
+    ]
+
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="search_terms")
+    field = models.CharField(max_length=10, choices=FIELD_CHOICES)
+    term = models.CharField(max_length=10)
+    frequency = models.PositiveIntegerField(default=1)  # ✅ 해당 필드 안에서 토큰이 등장한 횟수
+
+    class Meta:
+        unique_together = ('post', 'field', 'term')
+        indexes = [
+            models.Index(fields=['term', 'post'], name='main_search_term_post_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.term} → {self.post_id} ({self.field})"
@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from main.models.tracking import FieldTrackerMixin
 import os
 
 
@@ -12,18 +13,20 @@ def user_pic_upload_path(instance, filename):
     return f"user_pics/{instance.user.id}/{filename}"
 
 
-class Profile(models.Model):
+class Profile(FieldTrackerMixin, models.Model):
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         related_name='profile'
     )
-    blog_name = models.CharField(max_length=20)
+    blog_name = models.CharField(max_length=20, db_index=True)
     blog_pic = models.ImageField(upload_to=blog_pic_upload_path, null=True, blank=True,
                                  default='default/blog_default.jpg')
-    username = models.CharField(max_length=15, null=False, blank=False, default="Unnamed")
+    username = models.CharField(max_length=15, null=False, blank=False, default="Unnamed", db_index=True)
     user_pic = models.ImageField(upload_to=user_pic_upload_path, null=True, blank=True,
                                  default='default/user_default.jpg')
+    blog_pic_variants = models.JSONField(default=dict, blank=True)  # ✅ blog_pic의 thumb/medium(+WebP) 변형 경로
+    user_pic_variants = models.JSONField(default=dict, blank=True)  # ✅ user_pic의 thumb/medium(+WebP) 변형 경로
     intro = models.CharField(max_length=100, null=True, blank=True, help_text="간단한 자기소개를 입력해주세요 (최대 100자)")
 
     # ✅ URL 이름 (한 번만 변경 가능)
@@ -33,30 +36,45 @@ class Profile(models.Model):
     # ✅ 서로이웃 관계
     neighbors = models.ManyToManyField("self", symmetrical=True, blank=True)
     neighbor_visibility = models.BooleanField(default=True, help_text="서로이웃 목록을 공개할지 여부")
+    updated_at = models.DateTimeField(auto_now=True)  # ✅ 조건부 GET(ETag / Last-Modified) 기준
+
+    DEFAULT_PICS = {'blog_pic': 'default/blog_default.jpg', 'user_pic': 'default/user_default.jpg'}  # ✅ 기본 사진 (삭제/변형 생성 제외)
+    PIC_PREFIXES = {'blog_pic': 'blog_pics', 'user_pic': 'user_pics'}  # ✅ 내용 주소 저장 경로의 최상위 디렉터리
+    tracked_fields = ('username', 'urlname', 'blog_pic', 'user_pic', 'blog_pic_variants', 'user_pic_variants')
 
     def __str__(self):
         return f"{self.user.id} - {self.urlname}"
 
     def save(self, *args, **kwargs):
         """
-        ✅ 프로필 사진 변경 시 기존 파일 삭제 (중복 저장 방지)
+        ✅ 새로 올린 사진은 내용 주소 경로(SHA-256)에 저장 → 같은 사진은 한 번만 저장
+        ✅ 사진 변경 시 다른 행이 참조하지 않는 기존 파일과 변형 이미지를 커밋 후 삭제
+        ✅ 바뀐 사진 필드는 `_changed_pics`에 기록 → post_save 시그널에서 변형 이미지 생성 예약
+        - 기존 값은 불러올 때 기록해 둔 값(FieldTrackerMixin)으로 비교 → 저장 전 SELECT 없음
         """
-        if self.pk:
-            old_instance = Profile.objects.get(pk=self.pk)
-
-            # ✅ 기존 블로그 프로필 사진 삭제
-            if old_instance.blog_pic and old_instance.blog_pic != self.blog_pic:
-                if old_instance.blog_pic.name != 'default/blog_default.jpg':
-                    if os.path.isfile(old_instance.blog_pic.path):
-                        os.remove(old_instance.blog_pic.path)
-
-            # ✅ 기존 사용자 프로필 사진 삭제
-            if old_instance.user_pic and old_instance.user_pic != self.user_pic:
-                if old_instance.user_pic.name != 'default/user_default.jpg':
-                    if os.path.isfile(old_instance.user_pic.path):
-                        os.remove(old_instance.user_pic.path)
+        from main.utils.media_store import blob_name, file_digest, save_blob
+        from main.utils.image_pipeline import enqueue_release  # ✅ image_pipeline → media_store가 Profile을 import하므로 지연 import
+
+        self._changed_pics = []
+        released = []
+        for field in ('blog_pic', 'user_pic'):
+            new_pic = getattr(self, field)
+            if new_pic and not new_pic._committed:
+                ext = os.path.splitext(new_pic.name)[1] or '.jpg'
+                name = blob_name(self.PIC_PREFIXES[field], file_digest(new_pic.file), ext)
+                setattr(self, field, save_blob(name, new_pic.file, new_pic.storage))
+
+            if not self.has_changed(field):
+                continue
+
+            released.append((self.original(field), self.original(f"{field}_variants")))
+            setattr(self, f"{field}_variants", {})
+            new_pic = getattr(self, field)
+            if new_pic and new_pic.name != self.DEFAULT_PICS[field]:
+                self._changed_pics.append(field)
 
         super().save(*args, **kwargs)
+        enqueue_release(released)  # ✅ 커밋 후 정리해야 이 행의 참조가 빠진 상태로 확인됨 (롤백 시 파일 유지)
 
     def delete(self, *args, **kwargs):
         """
@@ -0,0 +1,83 @@
+import copy
+
+from django.db import models
+
+
+class FieldTrackerMixin(models.Model):
+    """
+    ✅ DB에서 불러온 시점의 필드 값을 인스턴스에 기록해 저장 전후 변경 여부를 판단
+    - 값은 from_db()에서 한 번만 기록 → 저장 전에 기존 행을 다시 SELECT하지 않음
+    - 인스턴스 속성에만 보관하므로 스레드/프로세스 간에 공유되는 상태 없음
+    - post_save 시그널까지는 저장 전 값(original)이 유지되고, save()가 끝나면 현재 값으로 갱신
+    - tracked_fields: 추적할 필드 이름 (FK는 `post`처럼 필드 이름으로 지정)
+    """
+    tracked_fields = ()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._reset_tracking()
+        return instance
+
+    def _tracked_value(self, name):
+        """ ✅ 비교용 값 (파일 필드는 경로 문자열, 불러오지 않은(defer) 필드는 KeyError) """
+        field = self._meta.get_field(name)
+        value = self.__dict__[field.attname]
+        if isinstance(field, models.FileField):
+            return getattr(self, field.attname).name or None  # ✅ 업로드 파일도 FieldFile로 감싸서 경로 비교
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+    def _reset_tracking(self, fields=None):
+        if not hasattr(self, '_original'):
+            self._original = {}
+        for name in self.tracked_fields if fields is None else fields:
+            try:
+                self._original[name] = self._tracked_value(name)
+            except KeyError:  # ✅ defer된 필드는 필요할 때 original()에서 조회
+                self._original.pop(name, None)
+
+    def _is_new(self):
+        """ ✅ 아직 저장 전이거나, 처음 저장하는 중(post_save signal 안)인 인스턴스 """
+        return self._state.adding or self.pk is None or self.__dict__.get('_creating', False)
+
+    def original(self, name):
+        """ ✅ 마지막으로 DB와 일치했던 값 (새 인스턴스면 None) """
+        if self._is_new():
+            return None
+        if name not in self.__dict__.get('_original', {}):
+            attname = self._meta.get_field(name).attname
+            value = type(self)._base_manager.filter(pk=self.pk).values_list(attname, flat=True).first()
+            self.__dict__.setdefault('_original', {})[name] = value
+        return self._original[name]
+
+    def has_changed(self, *names):
+        """ ✅ 지정한 필드 중 하나라도 바뀌었는지 (새 인스턴스는 항상 True, 불러오지 않은 필드는 변경 없음) """
+        if self._is_new():
+            return True
+        for name in names:
+            try:
+                current = self._tracked_value(name)
+            except KeyError:
+                continue
+            if current != self.original(name):
+                return True
+        return False
+
+    def changed_fields(self):
+        """ ✅ 바뀐 추적 필드 이름 집합 """
+        return {name for name in self.tracked_fields if self.has_changed(name)}
+
+    def save(self, *args, **kwargs):
+        # ✅ post_save 시점에는 _state.adding이 이미 False → 첫 저장 중임을 따로 표시
+        self._creating = self._state.adding
+        try:
+            super().save(*args, **kwargs)
+        finally:
+            self._creating = False
+        update_fields = kwargs.get('update_fields')
+        self._reset_tracking(
+            None if update_fields is None else [name for name in self.tracked_fields if name in update_fields]
+        )
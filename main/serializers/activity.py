@@ -1,10 +1,11 @@
 from rest_framework import serializers
-from main.models.post import Post
-from main.models.comment import Comment
-from main.models.heart import Heart
-from main.models.commentHeart import CommentHeart
+
 
 class ActivitySerializer(serializers.Serializer):
+    """
+    ✅ '내 활동' 기록(Activity) Serializer
+    - post__user__profile, comment를 select_related 한 queryset 기준 (추가 쿼리 없음)
+    """
     activity_id = serializers.SerializerMethodField()
     type = serializers.CharField()
     content = serializers.CharField(allow_null=True)
@@ -15,48 +16,30 @@ class ActivitySerializer(serializers.Serializer):
     post_urlname = serializers.CharField(read_only=True)  # ✅ post의 urlname 추가
 
     def get_activity_id(self, obj):
-        if isinstance(obj, Heart):
-            return f"heart_{obj.id}"
-        elif isinstance(obj, CommentHeart):
-            return f"comment_heart_{obj.id}"
-        elif isinstance(obj, Comment):
-            return f"comment_{obj.id}"
-        return f"unknown_{obj.id}"
+        if obj.type == 'liked_post':
+            return f"heart_{obj.heart_id}"
+        elif obj.type == 'liked_comment':
+            return f"comment_heart_{obj.comment_heart_id}"
+        return f"comment_{obj.comment_id}"
 
     def get_is_parent(self, obj):
-        return obj.is_parent if isinstance(obj, Comment) else None
-
-    def to_representation(self, instance):
-        username = None
-        content = None
-        post_id = None
-        post_urlname = None
+        return obj.comment.is_parent if obj.type in ('written_comment', 'written_reply') else None
 
-        if isinstance(instance, Comment):
-            username = instance.author.username
-            content = instance.content
-            post_id = instance.post.id
-            post_urlname = instance.post.user.profile.urlname  # ✅ post의 urlname
-        elif isinstance(instance, Heart):
-            username = instance.user.profile.username
-            content = f"{instance.post.title} 글을 좋아합니다."
-            post_id = instance.post.id
-            post_urlname = instance.post.user.profile.urlname  # ✅ post의 urlname
-        elif isinstance(instance, CommentHeart):
-            username = instance.user.profile.username
-            content = f"{instance.comment.content} 댓글을 좋아합니다."
-            post_id = instance.comment.post.id
-            post_urlname = instance.comment.post.user.profile.urlname  # ✅ post의 urlname
+    def get_content(self, obj):
+        if obj.type == 'liked_post':
+            return f"{obj.post.title} 글을 좋아합니다."
+        elif obj.type == 'liked_comment':
+            return f"{obj.comment.content} 댓글을 좋아합니다."
+        return obj.comment.content
 
+    def to_representation(self, instance):
         return {
             "activity_id": self.get_activity_id(instance),
-            "type": "liked_post" if isinstance(instance, Heart) else
-                    "liked_comment" if isinstance(instance, CommentHeart) else
-                    ("written_comment" if instance.is_parent else "written_reply"),
-            "content": content,
+            "type": instance.type,
+            "content": self.get_content(instance),
             "created_at": instance.created_at,
             "is_read": instance.is_read,  # ✅ 이제 그대로 사용 가능!
             "is_parent": self.get_is_parent(instance),
-            "post_id": post_id,
-            "post_urlname": post_urlname,
+            "post_id": instance.post_id,
+            "post_urlname": instance.post.user.profile.urlname,  # ✅ post의 urlname
         }
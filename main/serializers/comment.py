@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from main.models.comment import Comment
+from main.utils.profiling import ProfiledSerializerMixin
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
     author_name = serializers.SerializerMethodField()
     is_post_author = serializers.SerializerMethodField()
     parent = serializers.PrimaryKeyRelatedField(queryset=Comment.objects.all(), required=False, allow_null=True)
@@ -18,13 +19,18 @@ class CommentSerializer(serializers.ModelSerializer):
         return None
 
     def get_is_post_author(self, obj):
-        """ ✅ 게시글 작성자인지 여부 """
-        return obj.author == obj.post.user.profile  # ✅ post.author → post.user로 변경
+        """ ✅ 게시글 작성자인지 여부 (id 비교 → post.user.profile 조회 없음) """
+        return obj.author.user_id == obj.post.user_id  # ✅ post.author → post.user로 변경
 
     def get_replies(self, obj):
-        """ ✅ 대댓글을 가져오기 위한 메소드 """
+        """
+        ✅ 대댓글을 가져오기 위한 메소드
+        - load_comment_thread로 불러온 댓글이면 메모리의 thread_replies 사용 (추가 쿼리 없음)
+        """
         if obj.is_parent:
-            replies = Comment.objects.filter(parent=obj)
+            replies = getattr(obj, 'thread_replies', None)
+            if replies is None:
+                replies = obj.replies.select_related('author').order_by('created_at', 'id')
             return CommentSerializer(replies, many=True, context=self.context).data
         return []
 
@@ -47,28 +53,21 @@ class CommentSerializer(serializers.ModelSerializer):
         user = self.context['request'].user
         data = super().to_representation(instance)
 
-        is_authenticated = user.is_authenticated
-        is_author = is_authenticated and user.profile == instance.author
-        is_post_author = is_authenticated and user.profile == instance.post.user.profile
-        is_parent_author = is_authenticated and instance.parent and user.profile == instance.parent.author
-
-        # ✅ 비밀 댓글 필터링
-        if instance.is_private and not (is_author or is_post_author or is_parent_author):
+        # ✅ 비밀 댓글 필터링 (작성자 / 게시글 작성자 / 부모 댓글 작성자만 내용 확인 가능)
+        # ✅ 대댓글은 각자의 to_representation에서 같은 규칙으로 필터링됨
+        if instance.is_private and not self.can_read_private(instance, user):
             data['content'] = "비밀 댓글입니다."
 
-        # ✅ 대댓글 필터링
-        if instance.is_parent:
-            serialized_replies = data.get('replies', [])
-            for reply in serialized_replies:
-                reply_obj = Comment.objects.get(id=reply['id'])  # 대댓글 객체 가져오기
-                is_reply_author = is_authenticated and user.profile == reply_obj.author
-                is_reply_post_author = is_authenticated and user.profile == reply_obj.post.user.profile
-                is_reply_parent_author = is_authenticated and user.profile == instance.author
-
-                if reply_obj.is_private and not (is_reply_author or is_reply_post_author or is_reply_parent_author):
-                    reply['content'] = "비밀 댓글입니다."
-
         return data
 
-
-
+    @staticmethod
+    def can_read_private(instance, user):
+        """ ✅ id 비교만 사용 (post / parent는 load_comment_thread가 연결한 객체 사용) """
+        if not user.is_authenticated:
+            return False
+        profile_id = user.profile.pk
+        return (
+            instance.author_id == profile_id
+            or instance.post.user_id == user.pk
+            or (instance.parent_id is not None and instance.parent.author_id == profile_id)
+        )
@@ -1,9 +1,20 @@
 from rest_framework import serializers
-from main.models.post import Post
-from main.models.comment import Comment
-from main.models.heart import Heart
-
-class NewsSerializer(serializers.Serializer):
+from main.utils.profiling import ProfiledSerializerMixin
+
+# ✅ 알림 종류별 문구
+NEWS_MESSAGES = {
+    "post_comment": "{username}님이 {title} 글에 댓글을 남겼습니다.",
+    "comment_reply": "{username}님이 {title} 글에 대댓글을 남겼습니다.",
+    "post_like": "{username}님이 {title} 글을 좋아합니다.",
+}
+
+
+class NewsSerializer(ProfiledSerializerMixin, serializers.Serializer):
+    """
+    ✅ '내 소식' 알림(Notification) Serializer
+    - actor__profile, post__user__profile, comment를 select_related 한 queryset 기준 (추가 쿼리 없음)
+    """
+    id = serializers.IntegerField(read_only=True)  # ✅ 읽음 처리용 알림 id
     activity_id = serializers.CharField(read_only=True)  # ✅ `activity_id` 추가
     type = serializers.CharField()  # "post_comment", "post_like", "comment_reply"
     content = serializers.CharField(read_only=True)
@@ -14,54 +25,23 @@ class NewsSerializer(serializers.Serializer):
     post_urlname = serializers.CharField(read_only=True)  # ✅ post의 urlname 추가
 
     def to_representation(self, instance):
-        user = self.context['request'].user  # ✅ 현재 로그인된 사용자
-        activity_id = None
-        activity_type = None
-        content = None
-        is_parent = None
-        post_id = None
-        post_urlname = None
-
-        if isinstance(instance, Comment):
-            username = instance.author.username  # ✅ `Profile`의 `username` 사용
-            post_id = instance.post.id
-            post_urlname = instance.post.user.profile.urlname  # ✅ post의 urlname
-
-            if instance.post.user == user:  # ✅ 내가 작성한 게시글에 달린 댓글
-                activity_id = f"comment_{instance.id}"
-                activity_type = "post_comment"
-                content = f"{username}님이 {instance.post.title} 글에 댓글을 남겼습니다."
-                is_parent = instance.is_parent  # ✅ 댓글/대댓글 여부 저장
-
-            elif instance.parent and instance.parent.author == user.profile:  # ✅ 내가 작성한 댓글에 달린 대댓글
-                activity_id = f"comment_{instance.id}"
-                activity_type = "comment_reply"
-                content = f"{username}님이 {instance.post.title} 글에 대댓글을 남겼습니다."
-                is_parent = instance.is_parent
-                post_id = instance.post.id  # ✅ 대댓글이 속한 post의 id 추가
-                post_urlname = instance.post.user.profile.urlname  # ✅ 대댓글이 속한 post의 urlname 추가
-
-        elif isinstance(instance, Heart):
-            username = instance.user.profile.username  # ✅ `Profile`을 통해 `username` 가져오기
-            post_id = instance.post.id
-            post_urlname = instance.post.user.profile.urlname  # ✅ post의 urlname
-
-            if instance.post.user == user:  # ✅ 내가 작성한 게시글에 달린 좋아요
-                activity_id = f"heart_{instance.id}"
-                activity_type = "post_like"
-                content = f"{username}님이 {instance.post.title} 글을 좋아합니다."
+        if instance.heart_id:
+            activity_id = f"heart_{instance.heart_id}"
+            is_parent = None
+        else:
+            activity_id = f"comment_{instance.comment_id}"
+            is_parent = instance.comment.is_parent  # ✅ 댓글/대댓글 여부
 
         return {
+            "id": instance.id,
             "activity_id": activity_id,
-            "type": activity_type,
-            "content": content,
+            "type": instance.type,
+            "content": NEWS_MESSAGES[instance.type].format(
+                username=instance.actor.profile.username, title=instance.post.title
+            ),
             "created_at": instance.created_at,
             "is_read": instance.is_read,
             "is_parent": is_parent,
-            "post_id": post_id,
-            "post_urlname": post_urlname,
+            "post_id": instance.post_id,
+            "post_urlname": instance.post.user.profile.urlname,
         }
-
-
-
-
@@ -1,9 +1,11 @@
-import re
 from rest_framework import serializers
-from django.utils.html import escape
 from django.utils.safestring import mark_safe
 from main.models.post import Post, PostImage
 from main.models.category import Category
+from main.utils.content_render import render_post_content
+from main.utils.counters import get_like_count
+from main.utils.image_variants import thumbnail_url, variant_urls
+from main.utils.profiling import ProfiledSerializerMixin
 
 
 class PostImageSerializer(serializers.ModelSerializer):
@@ -11,10 +13,11 @@ class PostImageSerializer(serializers.ModelSerializer):
     ✅ 게시물 이미지 정보 반환 Serializer
     """
     image_url = serializers.SerializerMethodField()  # 절대 URL 반환
+    variants = serializers.SerializerMethodField()  # thumb / medium (+WebP) 변형 URL
 
     class Meta:
         model = PostImage
-        fields = ['id', 'image', 'image_url', 'caption', 'is_representative']
+        fields = ['id', 'image', 'image_url', 'variants', 'caption', 'is_representative', 'status']
 
     def get_image_url(self, obj):
         """
@@ -25,8 +28,14 @@ class PostImageSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.image.url)
         return obj.image.url if obj.image else ""
 
+    def get_variants(self, obj):
+        """
+        ✅ 카드/목록용 변형 이미지 URL (아직 생성 전이면 원본 URL)
+        """
+        return variant_urls(obj.image, obj.variants, self.context.get("request"))
+
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
     """
     ✅ 게시물 정보 반환 Serializer
     """
@@ -34,7 +43,7 @@ class PostSerializer(serializers.ModelSerializer):
     visibility = serializers.ChoiceField(choices=Post.VISIBILITY_CHOICES, required=False)
     keyword = serializers.CharField(read_only=True)
     subject = serializers.ChoiceField(choices=Post.SUBJECT_CHOICES, required=False, default="주제 선택 안 함")
-    total_likes = serializers.IntegerField(source="like_count", read_only=True)
+    total_likes = serializers.SerializerMethodField()  # ✅ like_count + 아직 반영되지 않은 버퍼 증감값
     total_comments = serializers.IntegerField(source="comment_count", read_only=True)
     category_name = serializers.SerializerMethodField()
     images = PostImageSerializer(many=True, read_only=True)
@@ -50,6 +59,12 @@ class PostSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'user_name', 'url_name', 'created_at', 'updated_at', 'keyword', 'images']
 
+    def get_total_likes(self, obj):
+        """
+        ✅ 좋아요 수 반환 (write-behind 버퍼 사용 시 미반영 증감값 합산)
+        """
+        return get_like_count(obj)
+
     def get_category_name(self, obj):
         """
         ✅ 게시물이 속한 카테고리 이름 반환
@@ -69,23 +84,9 @@ class PostSerializer(serializers.ModelSerializer):
         """
         ✅ `content` 내 `<input>` 태그를 제거하고 `caption`을 적용한 최종 HTML 반환
         ✅ `content` 내 `<img>` 태그 URL을 절대 URL로 변경
+        ✅ 렌더링 결과는 캐시 (main/utils/content_render.py)
         """
-        request = self.context.get("request")
-        content = obj.content
-        images = obj.images.all()  # 게시물의 모든 이미지 가져오기
-
-        for image in images:
-            # 🔥 <figcaption> 내부의 <input> 태그를 이미지의 실제 캡션으로 변환
-            input_pattern = f'<input[^>]*id="caption_{image.id}"[^>]*>'
-            caption_text = escape(image.caption) if image.caption else ""
-            content = re.sub(input_pattern, caption_text, content)
-
-            # 🔥 content 내 <img> 태그 URL을 절대 URL로 변경
-            if request and image.image:
-                absolute_url = request.build_absolute_uri(image.image.url)
-                content = content.replace(image.image.url, absolute_url)
-
-        return mark_safe(content)  # HTML 코드 그대로 유지
+        return mark_safe(render_post_content(obj, self.context.get("request")))  # HTML 코드 그대로 유지
 
     def create(self, validated_data):
         """
@@ -102,7 +103,7 @@ class PostSerializer(serializers.ModelSerializer):
         validated_data['category'] = category
         post = Post.objects.create(**validated_data)
 
-        from main.utils import save_images_from_request
+        from main.utils.utils import save_images_from_request
         save_images_from_request(post, request)
 
         return post
@@ -125,4 +126,53 @@ class PostSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError(f"'{category_name}'은(는) 유효한 카테고리가 아닙니다.")
 
         instance.save()
-        return instance
\ No newline at end of file
+        return instance
+
+
+class PostCardSerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
+    """
+    ✅ 목록(피드) 카드용 경량 Serializer (`?view=card`)
+    - 본문 HTML / 전체 이미지 대신 요약(excerpt)과 대표 이미지 썸네일만 반환
+    - 본문 전체는 상세 조회 API에서 PostSerializer로 제공
+    """
+    user_name = serializers.CharField(source='user.profile.username', read_only=True)
+    url_name = serializers.CharField(source='user.profile.urlname', read_only=True)
+    category_name = serializers.SerializerMethodField()
+    thumbnail = serializers.SerializerMethodField()
+    total_likes = serializers.SerializerMethodField()
+    total_comments = serializers.IntegerField(source="comment_count", read_only=True)
+    absolute_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Post
+        fields = [
+            'id', 'user_name', 'url_name', 'title', 'excerpt', 'thumbnail', 'status', 'category_name', 'keyword',
+            'visibility', 'absolute_url', 'created_at', 'updated_at', 'total_likes', 'total_comments'
+        ]
+        read_only_fields = fields
+
+    def get_category_name(self, obj):
+        return obj.category.name if obj.category else "게시판"
+
+    def get_absolute_url(self, obj):
+        request = self.context.get("request")
+        if request:
+            return request.build_absolute_uri(f"/posts/{obj.id}/")
+        return f"/posts/{obj.id}/"
+
+    def get_total_likes(self, obj):
+        return get_like_count(obj)
+
+    def get_thumbnail(self, obj):
+        """
+        ✅ 대표 이미지의 thumb 변형 URL (card_queryset의 `representative_images` prefetch 사용)
+        """
+        images = getattr(obj, 'representative_images', None)
+        if images is None:
+            images = [image for image in obj.images.all() if image.is_representative]
+        if not images:
+            return None
+
+        url = thumbnail_url(images[0].image, images[0].variants)
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request and url else url
@@ -1,20 +1,20 @@
 from rest_framework import serializers
 from ..models.profile import Profile
-from PIL import Image
-import io
+from ..utils.image_variants import variant_urls
+from ..utils.image_pipeline import convert_to_jpeg, probe_image
 
-try:
-    import pillow_heif  # HEIC 지원을 위한 라이브러리
-    pillow_heif.register_heif_opener()
-except ImportError:
-    pillow_heif = None
+# ✅ 헤더로 확인한 실제 형식 (Content-Type만 믿지 않음)
+ALLOWED_IMAGE_FORMATS = {"JPEG", "PNG", "GIF", "WEBP", "BMP", "HEIF"}
 
 
 class ProfileSerializer(serializers.ModelSerializer):
+    blog_pic_variants = serializers.SerializerMethodField()  # ✅ blog_pic의 thumb / medium (+WebP) URL
+    user_pic_variants = serializers.SerializerMethodField()  # ✅ user_pic의 thumb / medium (+WebP) URL
+
     class Meta:
         model = Profile
         fields = [
-            'blog_name', 'blog_pic', 'username', 'user_pic', 'intro',
+            'blog_name', 'blog_pic', 'blog_pic_variants', 'username', 'user_pic', 'user_pic_variants', 'intro',
             'neighbor_visibility', 'urlname', 'urlname_edit_count'
         ]
         read_only_fields = ['urlname']
@@ -25,6 +25,12 @@ class ProfileSerializer(serializers.ModelSerializer):
             'urlname_edit_count': {'read_only': True},  # ✅ 변경 횟수는 클라이언트가 수정 불가
         }
 
+    def get_blog_pic_variants(self, obj):
+        return variant_urls(obj.blog_pic, obj.blog_pic_variants, self.context.get('request'))
+
+    def get_user_pic_variants(self, obj):
+        return variant_urls(obj.user_pic, obj.user_pic_variants, self.context.get('request'))
+
     def get_neighbors(self, obj):
         return [
             {"username": neighbor.username, "user_pic": neighbor.user_pic.url if neighbor.user_pic else None}
@@ -71,41 +77,38 @@ class ProfileSerializer(serializers.ModelSerializer):
                     f"{image_type}은 {', '.join([ext.split('/')[-1].upper() for ext in allowed_content_types])} 형식만 지원됩니다."
                 )
 
-            # HEIC 파일이면 JPEG으로 변환
-            if value.content_type in ["image/heic", "image/heif"] and pillow_heif:
-                try:
-                    heif_image = pillow_heif.open_heif(value)
-                    image = Image.frombytes(heif_image.mode, heif_image.size, heif_image.data)
-
-                    # 변환 후 다시 저장
-                    output = io.BytesIO()
-                    image.save(output, format="JPEG")
-                    output.seek(0)
-                    value.file = output
-                    value.content_type = "image/jpeg"
-                except Exception:
-                    raise serializers.ValidationError(f"{image_type} 파일 변환 중 오류가 발생했습니다.")
-
-            # 이미지 해상도 검증 (10x10 이상, 5000x5000 이하)
+            # ✅ 헤더만 읽어 실제 형식과 해상도 확인 (픽셀 데이터는 디코딩하지 않음)
             try:
-                image = Image.open(value)
-                min_width, min_height = 10, 10
-                max_width, max_height = 5000, 5000
-
-                if image.width < min_width or image.height < min_height:
-                    raise serializers.ValidationError(
-                        f"{image_type}의 크기는 최소 {min_width}x{min_height} 픽셀이어야 합니다. "
-                        f"(현재 크기: {image.width}x{image.height})"
-                    )
-
-                if image.width > max_width or image.height > max_height:
-                    raise serializers.ValidationError(
-                        f"{image_type}의 크기는 최대 {max_width}x{max_height} 픽셀까지만 가능합니다. "
-                        f"(현재 크기: {image.width}x{image.height})"
-                    )
+                image_format, width, height = probe_image(value)
             except Exception:
                 raise serializers.ValidationError(f"{image_type}은 올바른 이미지 파일이 아닙니다.")
 
+            if image_format not in ALLOWED_IMAGE_FORMATS:
+                raise serializers.ValidationError(f"{image_type}은 올바른 이미지 파일이 아닙니다.")
+
+            # 이미지 해상도 검증 (10x10 이상, 5000x5000 이하)
+            min_width, min_height = 10, 10
+            max_width, max_height = 5000, 5000
+
+            if width < min_width or height < min_height:
+                raise serializers.ValidationError(
+                    f"{image_type}의 크기는 최소 {min_width}x{min_height} 픽셀이어야 합니다. "
+                    f"(현재 크기: {width}x{height})"
+                )
+
+            if width > max_width or height > max_height:
+                raise serializers.ValidationError(
+                    f"{image_type}의 크기는 최대 {max_width}x{max_height} 픽셀까지만 가능합니다. "
+                    f"(현재 크기: {width}x{height})"
+                )
+
+            # HEIC 파일이면 JPEG으로 변환 (변환 워커에서 메모리 예산 안에서 처리, 결과는 임시 파일)
+            if image_format == "HEIF":
+                try:
+                    value = convert_to_jpeg(value, width, height)
+                except Exception:
+                    raise serializers.ValidationError(f"{image_type} 파일 변환 중 오류가 발생했습니다.")
+
         return value
 
     def validate_intro(self, value):  # ✅ intro 유효성 검사
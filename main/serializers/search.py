@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from ..models import Post, PostImage  # 🔹 PostImage 추가
+from ..utils.image_variants import thumbnail_url
 
 
 class PostSearchSerializer(serializers.ModelSerializer):
@@ -12,10 +13,10 @@ class PostSearchSerializer(serializers.ModelSerializer):
 
     def get_thumbnail(self, obj):
         """
-        대표 이미지를 반환. 없으면 None 반환
+        대표 이미지의 썸네일 변형 URL 반환. 없으면 None 반환
         """
         thumbnail = obj.images.filter(is_representative=True).first()
-        return thumbnail.image.url if thumbnail else None
+        return thumbnail_url(thumbnail.image, thumbnail.variants) if thumbnail else None
 
     def get_excerpt(self, obj):
         """
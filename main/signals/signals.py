@@ -1,12 +1,26 @@
-from django.db.models.signals import post_save, post_delete, pre_save
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.conf import settings
 from main.models.profile import Profile
 from main.models.comment import Comment
-from main.models.post import Post
+from main.models.post import Post, PostImage
+from main.models.postCount import PostCount
 from main.models.category import Category
+from main.models.neighbor import Neighbor
+from main.models.heart import Heart
+from main.models.notification import Notification
+from main.models.commentHeart import CommentHeart
+from main.models.activity import Activity
+from main.utils.search_index import index_post, index_post_captions
+from main.utils.neighbors import invalidate_neighbors, neighbors_of
+from main.utils.notifications import notifications_for_comment, notifications_for_heart
+from main.utils.image_pipeline import enqueue_variants
+from main.utils.response_cache import bump_response_version
+from main.utils.deletion import in_post_cascade
+from main.utils.post_counts import adjust_post_counts
 
-# 🛠 새로운 사용자가 생성될 때 자동으로 Profile 생성
+# 🛠 새로운 사용자가 생성될 때 자동으로 Profile(+ 게시물 수 카운터) 생성
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def create_profile(sender, instance, created, **kwargs):
     if created:
@@ -16,46 +30,172 @@ def create_profile(sender, instance, created, **kwargs):
             username=instance.id,  # ✅ username 기본값
             urlname=str(instance.id),
         )
+        PostCount.objects.create(user=instance)  # ✅ 게시물 수 카운터 (main/utils/post_counts.py)
 
 
-# ✅ 프로필 변경 전에 기존 값을 저장하는 딕셔너리
-old_usernames = {}
+@receiver(post_save, sender=Profile)
+def update_comment_author_name(sender, instance, created, update_fields=None, **kwargs):
+    """
+    ✅ 프로필의 username이 변경되었을 경우, 기존 댓글의 author_name을 업데이트
+    - 이전 username은 프로필을 불러올 때 기록한 값과 비교 (FieldTrackerMixin, 저장 전 SELECT 없음)
+    """
+    if created or (update_fields is not None and 'username' not in update_fields):
+        return
 
-@receiver(pre_save, sender=Profile)
-def store_old_username(sender, instance, **kwargs):
-    """ ✅ 프로필이 변경되기 전에 기존 username 저장 """
-    try:
-        old_instance = Profile.objects.get(pk=instance.pk)
-        old_usernames[instance.pk] = old_instance.username  # ✅ 기존 username 저장
-    except Profile.DoesNotExist:
-        old_usernames[instance.pk] = None  # 새 프로필인 경우
+    if instance.has_changed('username'):
+        # ✅ 기존 댓글의 author_name을 UPDATE 한 번으로 변경
+        # - 댓글별 save()는 Comment.save의 작성자 확인 조회와 댓글 signal(댓글 수/알림/활동)을 매번 실행함
+        Comment.objects.filter(author=instance).exclude(author_name=instance.username).update(
+            author_name=instance.username
+        )
 
 @receiver(post_save, sender=Profile)
-def update_comment_author_name(sender, instance, **kwargs):
-    """ ✅ 프로필의 username이 변경되었을 경우, 기존 댓글의 author_name을 업데이트 """
-    old_username = old_usernames.get(instance.pk)
+def schedule_profile_pic_variants(sender, instance, **kwargs):
+    """ ✅ 새로 올린 블로그/프로필 사진의 thumb/medium(+WebP) 변형 생성을 워커에 예약 """
+    for field in getattr(instance, '_changed_pics', ()):
+        enqueue_variants(instance, field, f"{field}_variants")
+    instance._changed_pics = []
+
+@receiver(post_save, sender=Comment)
+def update_comment_count_on_save(sender, instance, created, **kwargs):
+    """ ✅ 댓글이 추가될 때 comment_count 증가 (수정 시에는 변화 없음) """
+    if not created:
+        return
+    Post.objects.filter(pk=instance.post_id).update(comment_count=F("comment_count") + 1)
+
+@receiver(post_delete, sender=Comment)
+def update_comment_count_on_delete(sender, instance, **kwargs):
+    """ ✅ 댓글이 삭제될 때 comment_count 감소 (게시물 삭제로 함께 지워지는 경우는 건너뜀) """
+    if in_post_cascade(instance.post_id):
+        return
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(comment_count=F("comment_count") - 1)
+
+
+# ✅ 사용자별 게시물 수 카운터 (공개 범위 × 상태) - main/utils/post_counts.py
+POST_COUNT_FIELDS = {"user", "status", "visibility"}
 
-    if old_username and old_username != instance.username:
-        # ✅ 기존 댓글을 찾아 author_name을 업데이트
-        comments = Comment.objects.filter(author=instance)
-        for comment in comments:
-            comment.author_name = instance.username
-            comment.save()  # ✅ 개별 저장
+@receiver(post_save, sender=Post)
+def update_post_counts_on_save(sender, instance, created, update_fields=None, **kwargs):
+    """ ✅ 게시물 생성 → +1, 작성자/상태/공개 범위 변경 → 이전 칸 -1, 새 칸 +1 """
+    if created:
+        adjust_post_counts({(instance.user_id, instance.visibility, instance.status): 1})
+        return
+    if update_fields and not POST_COUNT_FIELDS & set(update_fields):
+        return
+    if not instance.has_changed(*POST_COUNT_FIELDS):
+        return
+    old = (instance.original('user'), instance.original('visibility'), instance.original('status'))
+    new = (instance.user_id, instance.visibility, instance.status)
+    adjust_post_counts({old: -1, new: 1})
+
+@receiver(post_delete, sender=Post)
+def update_post_counts_on_delete(sender, instance, **kwargs):
+    """ ✅ 게시물 삭제 → -1 (delete_posts로 일괄 삭제하는 경우는 한 번에 차감) """
+    if in_post_cascade(instance.id):
+        return
+    adjust_post_counts({(instance.user_id, instance.visibility, instance.status): -1})
+
+
+# ✅ 검색 색인 갱신 (제목/본문이 바뀔 수 있는 저장에서만)
+SEARCH_INDEXED_FIELDS = {"title", "content"}
+
+@receiver(post_save, sender=Post)
+def update_post_search_index(sender, instance, update_fields=None, **kwargs):
+    """ ✅ 게시물 저장 시 제목/본문 색인 갱신 (like_count 등 카운터만 저장하는 경우는 건너뜀) """
+    if update_fields and not SEARCH_INDEXED_FIELDS & set(update_fields):
+        return
+    if not instance.has_changed(*SEARCH_INDEXED_FIELDS):  # ✅ 제목/본문이 그대로면 색인 유지
+        return
+    index_post(instance)
 
-        # ✅ 업데이트 후 기존 데이터 삭제
-        del old_usernames[instance.pk]
+@receiver(post_save, sender=PostImage)
+@receiver(post_delete, sender=PostImage)
+def update_caption_search_index(sender, instance, **kwargs):
+    """ ✅ 이미지 추가/수정/삭제 시 해당 게시물의 사진 설명 색인 갱신 """
+    if in_post_cascade(instance.post_id):
+        return
+    index_post_captions(instance.post_id)
 
+
+@receiver(post_save, sender=Neighbor)
+@receiver(post_delete, sender=Neighbor)
+def invalidate_neighbor_cache(sender, instance, **kwargs):
+    """ ✅ 서로이웃 신청/수락/삭제 시 양쪽 사용자의 서로이웃 캐시 무효화 """
+    invalidate_neighbors(instance.from_user_id, instance.to_user_id)
+
+
+# ✅ '내 소식' 수신함 팬아웃 (댓글/하트 생성 시 받는 사람별로 알림 행 생성)
 @receiver(post_save, sender=Comment)
-def update_comment_count_on_save(sender, instance, **kwargs):
-    """ ✅ 댓글이 추가될 때 comment_count 증가 """
-    post = instance.post
-    post.comment_count = Comment.objects.filter(post=post).count()
-    post.save(update_fields=["comment_count"])
+def create_comment_notifications(sender, instance, created, **kwargs):
+    """ ✅ 댓글 → 게시글 작성자, 대댓글 → 부모 댓글 작성자에게 알림 """
+    if not created:
+        return
+    Notification.objects.bulk_create(
+        notifications_for_comment(instance, instance.post.user_id, instance.author.user_id)
+    )
+
+@receiver(post_save, sender=Heart)
+def create_heart_notification(sender, instance, created, **kwargs):
+    """ ✅ 하트 → 게시글 작성자에게 알림 (하트 취소 시 CASCADE로 삭제) """
+    if not created:
+        return
+    Notification.objects.bulk_create(notifications_for_heart(instance, instance.post.user_id))
 
+
+# ✅ '내 활동' 기록 (하트/댓글 좋아요/댓글/대댓글 생성 시 한 행씩 추가)
+@receiver(post_save, sender=Heart)
+def record_heart_activity(sender, instance, created, **kwargs):
+    if created:
+        Activity.objects.create(
+            user_id=instance.user_id, type='liked_post', post_id=instance.post_id,
+            heart=instance, created_at=instance.created_at,
+        )
+
+@receiver(post_save, sender=CommentHeart)
+def record_comment_heart_activity(sender, instance, created, **kwargs):
+    if created:
+        Activity.objects.create(
+            user_id=instance.user_id, type='liked_comment', post_id=instance.comment.post_id,
+            comment_id=instance.comment_id, comment_heart=instance, created_at=instance.created_at,
+        )
+
+@receiver(post_save, sender=Comment)
+def record_comment_activity(sender, instance, created, **kwargs):
+    if created:
+        Activity.objects.create(
+            user_id=instance.author.user_id,
+            type='written_comment' if instance.is_parent else 'written_reply',
+            post_id=instance.post_id, comment=instance, created_at=instance.created_at,
+        )
+
+
+# ✅ 블로그 응답 캐시 무효화 (main/utils/response_cache.py) - 해당 블로그 주인의 응답 버전 증가
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def bump_profile_response_version(sender, instance, **kwargs):
+    """ ✅ 프로필 변경 → 본인 블로그 + 서로이웃 목록에 이 프로필이 보이는 이웃들의 블로그 """
+    bump_response_version(instance.user_id, *neighbors_of(instance.user_id))
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def bump_owner_response_version(sender, instance, **kwargs):
+    bump_response_version(instance.user_id)
+
+@receiver(post_save, sender=PostImage)
+@receiver(post_delete, sender=PostImage)
+@receiver(post_save, sender=Heart)
+@receiver(post_delete, sender=Heart)
+@receiver(post_save, sender=Comment)
 @receiver(post_delete, sender=Comment)
-def update_comment_count_on_delete(sender, instance, **kwargs):
-    """ ✅ 댓글이 삭제될 때 comment_count 감소 """
-    post = instance.post
-    post.comment_count = Comment.objects.filter(post=post).count()
-    post.save(update_fields=["comment_count"])
+def bump_post_owner_response_version(sender, instance, **kwargs):
+    """ ✅ 이미지/하트/댓글 수는 최신 글 목록에 포함되므로 게시물 주인의 블로그 무효화 """
+    if in_post_cascade(instance.post_id):
+        return  # ✅ 게시물 삭제 signal에서 한 번만 무효화
+    bump_response_version(instance.post.user_id)  # ✅ 알림/활동 signal에서 이미 불러온 post 재사용
 
+@receiver(post_save, sender=Neighbor)
+@receiver(post_delete, sender=Neighbor)
+def bump_neighbor_response_version(sender, instance, **kwargs):
+    bump_response_version(instance.from_user_id, instance.to_user_id)
@@ -0,0 +1,52 @@
+"""
+✅ '내 활동' 기록 테스트 (하트 / 댓글 좋아요 / 댓글 / 대댓글 → 최신순 목록)
+
+    python manage.py test main.tests.test_activity --settings=naver_blog.settings_test
+"""
+from rest_framework.test import APITestCase
+
+from main.models import Category, CustomUser, Post
+
+
+class ActivityFeedTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.writer = CustomUser.objects.create_user(id='writer', password='password')
+        cls.reader = CustomUser.objects.create_user(id='reader', password='password')
+        category, _ = Category.objects.get_or_create(user=cls.writer, name='게시판')
+        cls.post = Post.objects.create(user=cls.writer, category=category, title="여행기", status='published')
+
+    def test_activities_listed_newest_first(self):
+        comments_url = f'/posts/{self.post.id}/comments/'
+        self.client.force_authenticate(self.writer)
+        writer_comment = self.client.post(comments_url, {'content': '작성자 댓글'}, format='json').json()['id']
+
+        self.client.force_authenticate(self.reader)
+        self.client.post(f'/posts/{self.post.id}/heart/')
+        self.client.post(f'{comments_url}{writer_comment}/heart/')
+        comment = self.client.post(comments_url, {'content': '좋은 글'}, format='json').json()['id']
+        reply = self.client.post(comments_url, {'content': '답글', 'parent': writer_comment}, format='json').json()['id']
+
+        items = self.client.get('/activity/list/').json()
+        self.assertEqual(
+            [(item['type'], item['content'], item['is_parent']) for item in items],
+            [
+                ('written_reply', '답글', False),
+                ('written_comment', '좋은 글', True),
+                ('liked_comment', '작성자 댓글 댓글을 좋아합니다.', None),
+                ('liked_post', '여행기 글을 좋아합니다.', None),
+            ]
+        )
+        self.assertEqual(items[0]['activity_id'], f'comment_{reply}')
+        self.assertEqual(items[1]['activity_id'], f'comment_{comment}')
+        self.assertTrue(items[2]['activity_id'].startswith('comment_heart_'))
+        self.assertTrue(all(item['post_urlname'] == 'writer' for item in items))
+
+        # ✅ 좋아요 취소 시 활동도 함께 사라짐
+        self.client.post(f'/posts/{self.post.id}/heart/')
+        self.assertEqual(len(self.client.get('/activity/list/').json()), 3)
+
+        # ✅ 작성자 본인의 활동은 본인 목록에만
+        self.client.force_authenticate(self.writer)
+        self.assertEqual([item['type'] for item in self.client.get('/activity/list/').json()], ['written_comment'])
@@ -0,0 +1,54 @@
+"""
+✅ seed_data + bench_api 스모크 테스트
+- 작은 합성 데이터로 모든 API를 한 번씩 호출해 5xx 응답이 없는지 확인 (SQLite에서 실행)
+
+    python manage.py test main.tests.test_bench_api --settings=naver_blog.settings_test
+"""
+import json
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from main.models import Comment, CustomUser, Heart, Post
+
+
+class BenchApiSmokeTests(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.media_root = tempfile.mkdtemp()
+        cls.media_override = override_settings(MEDIA_ROOT=cls.media_root)
+        cls.media_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.media_override.disable()
+        shutil.rmtree(cls.media_root, ignore_errors=True)
+        super().tearDownClass()
+
+    def test_seed_data_creates_configured_dataset(self):
+        call_command('seed_data', users=4, neighbors=2, posts=3, comments=4, hearts=2, stdout=StringIO())
+
+        self.assertEqual(CustomUser.objects.filter(id__startswith='seed-').count(), 4)
+        self.assertEqual(Post.objects.count(), 12)
+        self.assertEqual(Comment.objects.count(), 48)
+        self.assertEqual(Heart.objects.count(), 24)
+        # ✅ like_count가 실제 하트 수와 일치 (seed_data 마지막에 reconcile_counts 실행)
+        self.assertEqual(sum(Post.objects.values_list('like_count', flat=True)), 24)
+
+    def test_bench_api_reports_every_endpoint_without_server_errors(self):
+        call_command('seed_data', users=4, neighbors=2, posts=3, comments=4, hearts=2, stdout=StringIO())
+
+        out = StringIO()
+        call_command('bench_api', iterations=1, json=True, fail_on_error=True, stdout=out)
+        results = json.loads(out.getvalue())
+
+        measured = [r for r in results if 'skipped' not in r]
+        self.assertTrue(measured)
+        for result in measured:
+            self.assertLess(result['status'], 500, result)
+            self.assertGreaterEqual(result['queries'], 0)
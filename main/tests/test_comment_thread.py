@@ -0,0 +1,93 @@
+"""
+✅ 댓글 스레드 조회 테스트 (대댓글 수와 무관한 쿼리 수, 비밀 댓글 마스킹, 정렬, 최상위 댓글 단위 페이지)
+
+    python manage.py test main.tests.test_comment_thread --settings=naver_blog.settings_test
+"""
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from main.models import Category, Comment, CustomUser, Post, Profile
+
+
+class CommentThreadTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.writer = CustomUser.objects.create_user(id='writer', password='password')
+        cls.commenter = CustomUser.objects.create_user(id='commenter', password='password')
+        cls.viewer = CustomUser.objects.create_user(id='viewer', password='password')
+        category, _ = Category.objects.get_or_create(user=cls.writer, name='게시판')
+        cls.post = Post.objects.create(user=cls.writer, category=category, title="글", status='published')
+        cls.url = f'/posts/{cls.post.id}/comments/'
+
+    def setUp(self):
+        cache.clear()
+
+    def comment(self, user, content, parent=None, is_private=False):
+        return Comment.objects.create(
+            post=self.post, author=Profile.objects.get(user=user), content=content,
+            parent=parent, is_parent=parent is None, is_private=is_private,
+        )
+
+    def get(self, viewer, **params):
+        self.client.force_authenticate(viewer)
+        with CaptureQueriesContext(connection) as ctx:
+            data = self.client.get(self.url, params).json()
+        return data, len(ctx.captured_queries)
+
+    def test_query_count_independent_of_reply_count(self):
+        parent = self.comment(self.commenter, '댓글')
+        self.comment(self.viewer, '답글', parent=parent)
+        _, few = self.get(self.viewer)
+        for i in range(20):
+            self.comment(self.writer if i % 2 else self.viewer, f'답글 {i}', parent=parent)
+        data, many = self.get(self.viewer)
+        self.assertEqual(len(data[0]['replies']), 21)
+        self.assertEqual(few, many)
+
+    def test_private_comments_masked_for_other_viewers(self):
+        secret = self.comment(self.commenter, '비밀 내용', is_private=True)
+        self.comment(self.writer, '비밀 답글', parent=secret, is_private=True)
+
+        def contents(viewer):
+            data, _ = self.get(viewer)
+            return [data[0]['content'], data[0]['replies'][0]['content']]
+
+        self.assertEqual(contents(self.viewer), ['비밀 댓글입니다.', '비밀 댓글입니다.'])
+        self.assertEqual(contents(None), ['비밀 댓글입니다.', '비밀 댓글입니다.'])
+        self.assertEqual(contents(self.writer), ['비밀 내용', '비밀 답글'])
+        self.assertEqual(contents(self.commenter), ['비밀 내용', '비밀 답글'])  # ✅ 부모 댓글 작성자는 답글도 확인
+
+    def test_replies_nested_in_created_order(self):
+        first = self.comment(self.commenter, '첫 댓글')
+        second = self.comment(self.viewer, '둘째 댓글')
+        self.comment(self.writer, '답글 1', parent=first)
+        self.comment(self.viewer, '답글 2', parent=first)
+        self.comment(self.commenter, '둘째의 답글', parent=second)
+
+        data, _ = self.get(self.viewer)
+        self.assertEqual(
+            [(c['content'], [r['content'] for r in c['replies']]) for c in data],
+            [('첫 댓글', ['답글 1', '답글 2']), ('둘째 댓글', ['둘째의 답글'])]
+        )
+        self.assertTrue(data[0]['replies'][0]['is_post_author'])
+        self.assertEqual(data[0]['replies'][0]['parent'], first.id)
+
+    def test_cursor_pages_by_top_level_comment(self):
+        threads = []
+        for i in range(5):
+            parent = self.comment(self.commenter, f'댓글 {i}')
+            self.comment(self.viewer, f'답글 {i}', parent=parent)
+            threads.append(parent.id)
+
+        seen, cursor = [], None
+        while True:
+            data, _ = self.get(self.viewer, page_size=2, **({'cursor': cursor} if cursor else {}))
+            self.assertTrue(all(len(c['replies']) == 1 for c in data['results']))
+            seen += [c['id'] for c in data['results']]
+            if not data['has_more']:
+                break
+            cursor = data['next_cursor']
+        self.assertEqual(seen, threads)
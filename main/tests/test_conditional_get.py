@@ -0,0 +1,62 @@
+"""
+✅ 조건부 GET(ETag / If-None-Match → 304) 테스트
+
+    python manage.py test main.tests.test_conditional_get --settings=naver_blog.settings_test
+"""
+from rest_framework.test import APITestCase
+
+from main.models import Category, CustomUser, Neighbor, Post, PostImage
+
+
+class ConditionalGetTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = CustomUser.objects.create_user(id='owner', password='password')
+        cls.reader = CustomUser.objects.create_user(id='reader', password='password')
+        Neighbor.objects.create(from_user=cls.owner, to_user=cls.reader, status='accepted')
+        category, _ = Category.objects.get_or_create(user=cls.owner, name='게시판')
+        cls.post = Post.objects.create(user=cls.owner, category=category, title="글", content="<p>본문</p>", status='published')
+        cls.image = PostImage.objects.create(post=cls.post, image=f'post_pics/{cls.post.id}/a.jpg', caption='설명')
+
+    def setUp(self):
+        self.client.force_authenticate(self.reader)
+
+    def revalidate(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_post_detail_not_modified_until_changed(self):
+        url = f'/posts/{self.post.id}/'
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Last-Modified', response)
+
+        with self.assertNumQueries(2):  # ✅ 게시물 + 이미지 한 번씩 (직렬화 없음)
+            response = self.revalidate(url, etag)
+        self.assertEqual(response.status_code, 304)
+
+        # ✅ 하트 / 이미지 캡션 변경은 updated_at이 그대로여도 ETag가 바뀜
+        self.client.post(f'/posts/{self.post.id}/heart/')
+        response = self.revalidate(url, etag)
+        self.assertEqual(response.status_code, 200)
+
+        etag = response['ETag']
+        PostImage.objects.filter(pk=self.image.pk).update(caption='바뀐 설명')
+        self.assertEqual(self.revalidate(url, etag).status_code, 200)
+
+    def test_counters_and_profile(self):
+        for url in (
+            f'/posts/{self.post.id}/heart/count/', '/posts/count/owner/', '/neighbors/count/owner/', '/profile/owner/',
+        ):
+            etag = self.client.get(url)['ETag']
+            self.assertEqual(self.revalidate(url, etag).status_code, 304, url)
+
+        etag = self.client.get('/posts/count/owner/')['ETag']
+        Post.objects.create(user=self.owner, category=self.post.category, title="새 글", status='published')
+        self.assertEqual(self.revalidate('/posts/count/owner/', etag).status_code, 200)
+
+    def test_profile_etag_depends_on_viewer(self):
+        reader_etag = self.client.get('/profile/owner/')['ETag']
+        self.client.force_authenticate(None)
+        self.assertEqual(self.revalidate('/profile/owner/', reader_etag).status_code, 200)
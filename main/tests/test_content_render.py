@@ -0,0 +1,47 @@
+"""
+✅ 게시물 본문 렌더링 캐시 테스트 (캡션 치환, 절대 URL, 수정/이미지 변경 시 무효화)
+
+    python manage.py test main.tests.test_content_render --settings=naver_blog.settings_test
+"""
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from main.models import Category, CustomUser, Post, PostImage
+
+
+class ContentRenderTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(id='writer', password='password')
+        category, _ = Category.objects.get_or_create(user=cls.user, name='게시판')
+        cls.post = Post.objects.create(user=cls.user, category=category, title="사진 글", content="", status="published")
+        cls.image = PostImage.objects.create(post=cls.post, image=f'post_pics/{cls.post.id}/a.jpg', caption='<첫 사진>')
+        cls.post.content = (
+            f'<img src="/media/post_pics/{cls.post.id}/a.jpg">'
+            f'<figcaption><input id="caption_{cls.image.id}" type="text"></figcaption>'
+            '<img src="http://cdn.example.com/media/post_pics/other.jpg">'
+        )
+        cls.post.save()
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def get_content(self):
+        return self.client.get(f'/posts/me/{self.post.id}/').json()['content']
+
+    def test_caption_and_absolute_url_in_one_pass(self):
+        content = self.get_content()
+        self.assertIn(f'src="http://testserver/media/post_pics/{self.post.id}/a.jpg"', content)
+        self.assertIn('<figcaption>&lt;첫 사진&gt;</figcaption>', content)
+        self.assertIn('src="http://cdn.example.com/media/post_pics/other.jpg"', content)  # ✅ 이미 절대 URL이면 그대로
+
+    def test_cache_follows_caption_and_patch(self):
+        self.get_content()
+        PostImage.objects.filter(pk=self.image.pk).update(caption='바뀐 설명')
+        self.assertIn('바뀐 설명', self.get_content())
+
+        response = self.client.patch(f'/posts/me/{self.post.id}/manage/', {'content': '<p>새 본문</p>'}, format='multipart')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_content(), '<p>새 본문</p>')
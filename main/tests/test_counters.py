@@ -0,0 +1,104 @@
+"""
+✅ 좋아요 / 댓글 카운터 테스트 (생성·삭제·토글 시 증감, 0 미만 방지, reconcile_counts)
+
+    python manage.py test main.tests.test_counters --settings=naver_blog.settings_test
+"""
+import io
+from importlib import import_module
+
+from django.apps import apps
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from main.models import Category, Comment, CommentHeart, CustomUser, Heart, Post, Profile
+from main.utils.counters import BufferedCounter, get_like_count, increment_like_count, like_counter
+
+
+class CounterTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.writer = CustomUser.objects.create_user(id='writer', password='password')
+        cls.reader = CustomUser.objects.create_user(id='reader', password='password')
+        cls.category, _ = Category.objects.get_or_create(user=cls.writer, name='게시판')
+
+    def setUp(self):
+        self.post = Post.objects.create(user=self.writer, category=self.category, title="글", status='published')
+        self.client.force_authenticate(self.reader)
+
+    def counts(self, instance):
+        instance.refresh_from_db()
+        return instance.like_count, getattr(instance, 'comment_count', None)
+
+    def test_heart_toggle_updates_like_count(self):
+        url = f'/posts/{self.post.id}/heart/'
+        self.assertEqual(self.client.post(url).json()['like_count'], 1)
+        self.assertEqual(self.counts(self.post), (1, 0))
+        self.assertEqual(self.client.post(url).json()['like_count'], 0)
+        self.assertEqual(self.counts(self.post), (0, 0))
+        self.assertFalse(Heart.objects.exists())
+
+    def test_comment_create_and_delete_update_comment_count(self):
+        url = f'/posts/{self.post.id}/comments/'
+        parent_id = self.client.post(url, {'content': '댓글'}, format='json').json()['id']
+        reply_id = self.client.post(url, {'content': '답글', 'parent': parent_id}, format='json').json()['id']
+        self.assertEqual(self.counts(self.post), (0, 2))
+
+        self.client.delete(f'{url}{reply_id}/')
+        self.assertEqual(self.counts(self.post), (0, 1))
+
+        # ✅ 댓글 수정은 카운터에 영향 없음
+        comment = Comment.objects.get(pk=parent_id)
+        comment.content = '수정'
+        comment.save()
+        self.assertEqual(self.counts(self.post), (0, 1))
+
+    def test_decrement_never_goes_below_zero(self):
+        increment_like_count(self.post, -1)
+        self.assertEqual(self.counts(self.post), (0, 0))
+
+        comment = Comment.objects.create(post=self.post, author=Profile.objects.get(user=self.reader), content='댓글')
+        Post.objects.filter(pk=self.post.pk).update(comment_count=0)
+        comment.delete()
+        self.assertEqual(self.counts(self.post), (0, 0))
+
+    def test_reconcile_counts_repairs_corrupted_counters(self):
+        Heart.objects.create(post=self.post, user=self.reader)
+        comment = Comment.objects.create(post=self.post, author=Profile.objects.get(user=self.reader), content='댓글')
+        Post.objects.filter(pk=self.post.pk).update(like_count=7, comment_count=0)
+        Comment.objects.filter(pk=comment.pk).update(like_count=5)
+
+        call_command('reconcile_counts', '--dry-run', stdout=io.StringIO())
+        self.assertEqual(self.counts(self.post), (7, 0))
+
+        call_command('reconcile_counts', stdout=io.StringIO())
+        self.assertEqual(self.counts(self.post), (1, 1))
+        self.assertEqual(self.counts(comment)[0], 0)
+
+    def test_buffered_increment_uses_given_counter(self):
+        counter = BufferedCounter(shards=4, flush_interval=60)
+        with override_settings(LIKE_COUNTER_BUFFER={'ENABLED': True}):
+            with self.captureOnCommitCallbacks(execute=True):
+                increment_like_count(self.post, 1, counter=counter)
+            self.assertEqual(get_like_count(self.post, counter=counter), 1)
+            self.assertEqual(like_counter.pending(Post, 'like_count', self.post.pk), 0)
+            counter.stop()
+        self.assertEqual(self.counts(self.post), (1, 0))
+
+    def test_migration_backfills_comment_like_count(self):
+        comment = Comment.objects.create(post=self.post, author=Profile.objects.get(user=self.reader), content='댓글')
+        CommentHeart.objects.create(comment=comment, user=self.writer)
+        CommentHeart.objects.create(comment=comment, user=self.reader)
+        untouched = Comment.objects.create(post=self.post, author=Profile.objects.get(user=self.writer), content='댓글')
+        Comment.objects.filter(pk=untouched.pk).update(like_count=3)
+
+        migration = import_module('main.migrations.0015_backfill_comment_like_count')
+        migration.backfill_comment_like_count(apps, None)
+        self.assertEqual(self.counts(comment)[0], 2)
+        self.assertEqual(self.counts(untouched)[0], 0)
+
+        # ✅ 채운 값에서 좋아요 취소가 0으로 눌리지 않음
+        self.client.force_authenticate(self.writer)
+        response = self.client.post(f'/posts/{self.post.id}/comments/{comment.id}/heart/')
+        self.assertEqual(response.json()['like_count'], 1)
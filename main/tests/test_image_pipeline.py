@@ -0,0 +1,165 @@
+"""
+✅ 게시물 이미지 처리 파이프라인 테스트 (임시 파일 → 워커 → ready/failed, 변형 이미지)
+- settings_test는 IMAGE_PIPELINE ASYNC=False라 워커 작업이 요청 안에서 바로 실행됨
+
+    python manage.py test main.tests.test_image_pipeline --settings=naver_blog.settings_test
+"""
+import base64
+import io
+import shutil
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from PIL import Image
+from rest_framework.test import APITestCase
+
+from main.models import Category, CustomUser, Post, PostImage, Profile
+from main.utils.image_pipeline import MemoryBudget, convert_to_jpeg, probe_image
+
+
+def image_bytes(size, image_format='PNG'):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, (3, 199, 90)).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+class ImagePipelineTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(id='writer', password='password')
+        Category.objects.get_or_create(user=cls.user, name='게시판')
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.client.force_authenticate(self.user)
+
+    def create_post(self, content='', images=()):
+        return self.client.post('/posts/me/create/', {
+            'title': '이미지 글', 'content': content, 'captions': '["첫 사진", "본문 사진"]', 'images': list(images),
+        }, format='multipart')
+
+    def test_upload_and_base64_images(self):
+        encoded = base64.b64encode(image_bytes((40, 40))).decode()
+        response = self.create_post(
+            content=f'<p>본문</p><img src="data:image/png;base64,{encoded}">',
+            images=[SimpleUploadedFile('large.jpg', image_bytes((3000, 1500), 'JPEG'), content_type='image/jpeg')],
+        )
+        self.assertEqual(response.status_code, 201)
+
+        post = Post.objects.get()
+        upload, inline = post.images.order_by('id')
+        self.assertEqual([upload.status, inline.status], [PostImage.STATUS_READY, PostImage.STATUS_READY])
+        self.assertEqual([upload.caption, inline.caption], ['첫 사진', '본문 사진'])
+        self.assertTrue(upload.is_representative)
+
+        # ✅ 본문의 Base64는 미리 정한 최종 URL로 치환
+        self.assertNotIn('base64', post.content)
+        self.assertIn(inline.image.url, post.content)
+
+        # ✅ 긴 변이 MAX_DIMENSION을 넘으면 축소
+        with Image.open(upload.image.path) as stored:
+            self.assertEqual(max(stored.size), 2560)
+
+    def test_broken_image_marked_failed(self):
+        response = self.create_post(images=[SimpleUploadedFile('broken.png', b'not an image')])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(PostImage.objects.get().status, PostImage.STATUS_FAILED)
+
+    def test_invalid_base64_left_untouched(self):
+        content = '<img src="data:image/png;base64,@@@">'
+        self.create_post(content=content)
+        self.assertEqual(Post.objects.get().content, content)
+        self.assertFalse(PostImage.objects.exists())
+
+    def test_post_image_variants(self):
+        self.create_post(images=[SimpleUploadedFile('photo.jpg', image_bytes((2000, 1000), 'JPEG'))])
+        image = PostImage.objects.get()
+        self.assertEqual(set(image.variants), {'thumb', 'thumb_webp', 'medium', 'medium_webp'})
+        with Image.open(image.image.storage.path(image.variants['thumb_webp'])) as thumb:
+            self.assertEqual((thumb.format, thumb.size), ('WEBP', (320, 160)))
+
+        response = self.client.get(f'/posts/me/{image.post_id}/')
+        variants = response.json()['images'][0]['variants']
+        self.assertTrue(variants['thumb'].endswith(image.variants['thumb']))
+
+    def test_profile_pic_variants_replaced(self):
+        upload = SimpleUploadedFile('me.jpg', image_bytes((800, 800), 'JPEG'), content_type='image/jpeg')
+        self.client.patch('/profile/me/', {'user_pic': upload}, format='multipart')
+        first = Profile.objects.get(user=self.user).user_pic_variants
+        self.assertIn('thumb', first)
+
+        upload = SimpleUploadedFile('me2.png', image_bytes((600, 600)), content_type='image/png')
+        with self.captureOnCommitCallbacks(execute=True):  # ✅ 기존 파일은 커밋 후 삭제
+            response = self.client.patch('/profile/me/', {'user_pic': upload}, format='multipart')
+        profile = Profile.objects.get(user=self.user)
+        self.assertNotEqual(profile.user_pic_variants, first)
+        self.assertFalse(any(profile.user_pic.storage.exists(path) for path in first.values()))
+        self.assertEqual(response.status_code, 200)
+
+    def test_profile_pic_dimension_checked_from_header(self):
+        upload = SimpleUploadedFile('wide.png', image_bytes((6000, 20)), content_type='image/png')
+        response = self.client.patch('/profile/me/', {'user_pic': upload}, format='multipart')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('6000x20', response.json()['user_pic'][0])
+
+    def test_convert_to_jpeg_writes_temp_file(self):
+        upload = SimpleUploadedFile('camera.png', image_bytes((1200, 900)), content_type='image/png')
+        self.assertEqual(probe_image(upload), ('PNG', 1200, 900))
+        self.assertEqual(upload.tell(), 0)
+
+        converted = convert_to_jpeg(upload, 1200, 900)
+        self.assertEqual((converted.name, converted.content_type), ('camera.jpg', 'image/jpeg'))
+        self.assertEqual(probe_image(converted), ('JPEG', 1200, 900))
+        converted.close()
+
+    def test_memory_budget_waits_for_release(self):
+        budget = MemoryBudget(100)
+        budget.reserve(80)
+        with self.assertRaises(TimeoutError):
+            budget.reserve(30, timeout=0.01)
+        budget.release(80)
+        self.assertEqual(budget.reserve(500), 100)  # ✅ 상한보다 큰 요청은 상한만큼 예약
+
+    def test_patch_diffs_images_by_content_hash(self):
+        first, second = image_bytes((50, 50)), image_bytes((60, 60))
+        self.create_post(images=[SimpleUploadedFile('a.png', first), SimpleUploadedFile('b.png', second)])
+        post = Post.objects.get()
+        kept, removed = post.images.order_by('id')
+        url = f'/posts/me/{post.id}/manage/'
+
+        # ✅ 제목만 수정하면 이미지 유지
+        self.client.patch(url, {'title': '제목만'}, format='multipart')
+        self.assertEqual(post.images.count(), 2)
+
+        # ✅ 같은 이미지는 행/파일 재사용(캡션만 갱신), 빠진 이미지는 파일까지 삭제, 새 이미지만 추가
+        with self.captureOnCommitCallbacks(execute=True):  # ✅ 빠진 이미지 파일은 커밋 후 삭제
+            response = self.client.patch(url, {
+                'captions': '["바뀐 설명", "새 사진"]',
+                'images': [SimpleUploadedFile('a.png', first), SimpleUploadedFile('c.png', image_bytes((70, 70)))],
+            }, format='multipart')
+        self.assertEqual(response.status_code, 200)
+
+        images = list(post.images.order_by('id'))
+        self.assertEqual(images[0].pk, kept.pk)
+        self.assertEqual(images[0].image.name, kept.image.name)
+        self.assertEqual([img.caption for img in images], ['바뀐 설명', '새 사진'])
+        self.assertFalse(PostImage.objects.filter(pk=removed.pk).exists())
+        self.assertFalse(removed.image.storage.exists(removed.image.name))
+
+    def test_patch_images_when_content_is_null(self):
+        self.create_post(images=[SimpleUploadedFile('a.png', image_bytes((50, 50)))])
+        post = Post.objects.get()
+        Post.objects.filter(pk=post.pk).update(content=None)
+
+        response = self.client.patch(f'/posts/me/{post.id}/manage/', {
+            'captions': '["설명만"]', 'images': [SimpleUploadedFile('b.png', image_bytes((55, 55)))],
+        }, format='multipart')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(post.images.values_list('caption', flat=True)), ['설명만'])
+        self.assertIsNone(Post.objects.get().content)  # ✅ 본문을 보내지 않았으면 그대로
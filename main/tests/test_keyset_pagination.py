@@ -0,0 +1,93 @@
+"""
+✅ 키셋 커서 페이지네이션 테스트 (created_at 동률 시 id 정렬, 잘못된 cursor, 마지막 페이지, 페이지당 쿼리 수)
+
+    python manage.py test main.tests.test_keyset_pagination --settings=naver_blog.settings_test
+"""
+import base64
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from main.models import Category, CustomUser, Post
+
+
+def encode(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip('=')
+
+
+class KeysetPaginationTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(id='writer', password='password')
+        cls.reader = CustomUser.objects.create_user(id='reader', password='password')
+        category, _ = Category.objects.get_or_create(user=cls.user, name='게시판')
+        cls.posts = [
+            Post.objects.create(user=cls.user, category=category, title=f"글 {i}", status='published')
+            for i in range(7)
+        ]
+        # ✅ 절반은 같은 시각에 작성된 것으로 (id로 순서 결정)
+        Post.objects.filter(id__in=[post.id for post in cls.posts[2:6]]).update(created_at=timezone.now())
+
+    def setUp(self):
+        self.client.force_authenticate(self.reader)  # ✅ 전체 글 목록은 본인 글을 제외하므로 다른 사용자로 조회
+
+    def page(self, **params):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/posts/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json(), len(ctx.captured_queries)
+
+    def test_ties_on_created_at_ordered_by_id_without_gaps(self):
+        expected = list(Post.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        seen, cursor, queries = [], None, set()
+        while True:
+            data, count = self.page(page_size=2, **({'cursor': cursor} if cursor else {}))
+            seen += [post['id'] for post in data['results']]
+            queries.add(count)
+            if not data['has_more']:
+                break
+            cursor = data['next_cursor']
+        self.assertEqual(seen, expected)
+        self.assertEqual(len(queries), 1)  # ✅ 첫 페이지든 cursor 페이지든 쿼리 수 동일
+
+    def test_has_more_false_on_last_page(self):
+        data, _ = self.page(page_size=7)
+        self.assertEqual((len(data['results']), data['has_more'], data['next_cursor']), (7, False, None))
+        data, _ = self.page(page_size=6)
+        self.assertTrue(data['has_more'])
+        data, _ = self.page(page_size=6, cursor=data['next_cursor'])
+        self.assertEqual((len(data['results']), data['has_more']), (1, False))
+
+    def test_query_count_independent_of_page_size(self):
+        _, small = self.page(page_size=1)
+        _, large = self.page(page_size=7)
+        self.assertEqual(small, large)
+
+    def test_malformed_or_tampered_cursor_is_400(self):
+        cursors = [
+            '!!!', 'abc', encode({'a': 1}), encode([1]), encode(['x', 1]),
+            encode([[1], [2]]), encode([None, None]), encode(['2024-01-01T00:00:00+00:00', {'a': 1}]),
+        ]
+        for cursor in cursors:
+            with self.subTest(cursor=cursor):
+                self.assertEqual(self.client.get('/posts/', {'cursor': cursor}).status_code, 400)
+        self.assertEqual(self.client.get('/posts/', {'page_size': 0}).status_code, 400)
+        self.assertEqual(self.client.get('/posts/', {'page_size': 'x'}).status_code, 400)
+
+    def test_keyword_filter_returns_matching_posts_newest_first(self):
+        travel = [
+            Post.objects.create(user=self.user, category=self.posts[0].category, title=f"여행 {i}",
+                                subject="국내여행", status='published')
+            for i in range(3)
+        ]
+        data = self.client.get('/posts/', {'keyword': '취미/여가/여행'}).json()
+        self.assertEqual([post['id'] for post in data], [post.id for post in reversed(travel)])
+
+        data, _ = self.page(keyword='취미/여가/여행', page_size=2)
+        self.assertEqual(([post['id'] for post in data['results']], data['has_more']), ([travel[2].id, travel[1].id], True))
+        self.assertEqual(self.client.get('/posts/', {'keyword': 'x'}).status_code, 400)
+        self.assertEqual(self.client.get('/posts/', {'keyword': 'default', 'pk': 1}).status_code, 400)
@@ -0,0 +1,122 @@
+"""
+✅ 내용 주소 미디어 저장소 테스트 (같은 이미지 한 번만 저장, 참조가 없을 때만 삭제, gc_media)
+
+    python manage.py test main.tests.test_media_store --settings=naver_blog.settings_test
+"""
+import io
+import shutil
+import tempfile
+
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import transaction
+from django.test import override_settings
+from PIL import Image
+from rest_framework.test import APITestCase
+
+from main.models import Category, CustomUser, Post, PostImage, Profile
+from main.utils.media_store import walk_files
+
+
+def image_bytes(size, color=(3, 199, 90)):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+class MediaStoreTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(id='writer', password='password')
+        cls.other = CustomUser.objects.create_user(id='other', password='password')
+        Category.objects.get_or_create(user=cls.user, name='게시판')
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.client.force_authenticate(self.user)
+
+    def create_post(self, data):
+        self.client.post('/posts/me/create/', {
+            'title': '글', 'content': '', 'images': [SimpleUploadedFile('photo.png', data)],
+        }, format='multipart')
+        return Post.objects.latest('id')
+
+    def test_same_image_stored_once_and_released_with_last_reference(self):
+        data = image_bytes((80, 60))
+        first, second = self.create_post(data), self.create_post(data)
+        first_image, second_image = first.images.get(), second.images.get()
+
+        self.assertEqual(first_image.image.name, second_image.image.name)
+        self.assertTrue(first_image.image.name.startswith(f"post_pics/{first_image.content_hash[:2]}/"))
+        self.assertEqual(second_image.variants, first_image.variants)
+        self.assertEqual(len(list(walk_files('post_pics'))), 1 + len(first_image.variants))
+
+        # ✅ 다른 게시물이 참조하는 동안에는 파일 유지, 마지막 참조가 사라지면 삭제
+        with self.captureOnCommitCallbacks(execute=True):  # ✅ 파일 정리는 커밋 후
+            self.client.delete(f'/posts/me/{first.id}/manage/')
+        self.assertTrue(default_storage.exists(second_image.image.name))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f'/posts/me/{second.id}/manage/')
+        self.assertEqual(list(walk_files('post_pics')), [])
+
+    def test_profile_pics_share_blob(self):
+        data = image_bytes((300, 300), (10, 20, 30))
+        for user in (self.user, self.other):
+            self.client.force_authenticate(user)
+            self.client.patch('/profile/me/', {'user_pic': SimpleUploadedFile('me.png', data)}, format='multipart')
+        names = set(Profile.objects.values_list('user_pic', flat=True))
+        self.assertEqual(len(names), 1)
+        self.assertTrue(default_storage.exists(names.pop()))
+
+    def test_gc_media_removes_unreferenced_files(self):
+        post = self.create_post(image_bytes((40, 40)))
+        orphan = default_storage.save('post_pics/1/orphan.png', SimpleUploadedFile('orphan.png', b'x'))
+
+        call_command('gc_media', '--dry-run', '--grace-minutes=0', stdout=io.StringIO())
+        self.assertTrue(default_storage.exists(orphan))
+
+        call_command('gc_media', '--grace-minutes=0', stdout=io.StringIO())
+        self.assertFalse(default_storage.exists(orphan))
+        image = PostImage.objects.get(post=post)
+        self.assertTrue(default_storage.exists(image.image.name))
+        self.assertTrue(all(default_storage.exists(path) for path in image.variants.values()))
+
+    def test_profile_pic_kept_when_transaction_rolls_back(self):
+        self.client.patch('/profile/me/', {'user_pic': SimpleUploadedFile('a.png', image_bytes((50, 50)))}, format='multipart')
+        old_name = Profile.objects.get(user=self.user).user_pic.name
+
+        class Rollback(Exception):
+            pass
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    profile = Profile.objects.get(user=self.user)
+                    profile.user_pic = SimpleUploadedFile('b.png', image_bytes((60, 60)))
+                    profile.save()
+                    raise Rollback
+            except Rollback:
+                pass
+
+        self.assertEqual(Profile.objects.get(user=self.user).user_pic.name, old_name)
+        self.assertTrue(default_storage.exists(old_name))
+
+    def test_reused_blob_restored_if_released_before_commit(self):
+        data = image_bytes((90, 90))
+        first_image = self.create_post(data).images.get()
+        # ✅ 원래 행 삭제의 커밋 후 정리가 새 행 커밋보다 먼저 실행된 상황 (파일만 사라짐)
+        default_storage.delete(first_image.image.name)
+        for path in first_image.variants.values():
+            default_storage.delete(path)
+
+        second_image = self.create_post(data).images.get()
+        self.assertEqual(second_image.status, PostImage.STATUS_READY)
+        self.assertEqual(second_image.image.name, first_image.image.name)
+        self.assertTrue(default_storage.exists(second_image.image.name))
+        self.assertTrue(all(default_storage.exists(path) for path in second_image.variants.values()))
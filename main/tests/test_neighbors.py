@@ -0,0 +1,33 @@
+"""
+✅ 서로이웃 캐시 테스트 (프로세스별 캐시에서는 짧게 유지, 관계 변경 시 무효화)
+
+    python manage.py test main.tests.test_neighbors --settings=naver_blog.settings_test
+"""
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from main.models import CustomUser, Neighbor
+from main.utils.neighbors import (
+    NEIGHBOR_CACHE_TIMEOUT, NEIGHBOR_LOCAL_CACHE_TIMEOUT, is_mutual, neighbor_cache_timeout,
+)
+
+
+class NeighborCacheTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.owner = CustomUser.objects.create_user(id='owner', password='password')
+        self.friend = CustomUser.objects.create_user(id='friend', password='password')
+
+    def test_local_memory_cache_keeps_neighbors_briefly(self):
+        self.assertEqual(neighbor_cache_timeout(), NEIGHBOR_LOCAL_CACHE_TIMEOUT)
+        redis = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://x'}}
+        with override_settings(CACHES=redis):
+            self.assertEqual(neighbor_cache_timeout(), NEIGHBOR_CACHE_TIMEOUT)
+
+    def test_unfriend_revokes_mutual_access(self):
+        relation = Neighbor.objects.create(from_user=self.owner, to_user=self.friend, status='accepted')
+        self.assertTrue(is_mutual(self.friend, self.owner))
+        relation.delete()
+        self.assertFalse(is_mutual(self.friend, self.owner))
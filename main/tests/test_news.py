@@ -0,0 +1,80 @@
+"""
+✅ '내 소식' 수신함 테스트 (받는 사람 팬아웃, 본인 알림 제외, 하트 취소, 읽음 처리, 응답 형태)
+
+    python manage.py test main.tests.test_news --settings=naver_blog.settings_test
+"""
+from rest_framework.test import APITestCase
+
+from main.models import Category, CustomUser, Notification, Post
+
+# ✅ 기존(Comment/Heart를 합쳐 만들던) 응답의 필드 - 읽음 처리용 id만 추가됨
+BASELINE_FIELDS = {
+    'activity_id', 'type', 'content', 'created_at', 'is_read', 'is_parent', 'post_id', 'post_urlname',
+}
+
+
+class NewsInboxTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.writer = CustomUser.objects.create_user(id='writer', password='password')
+        cls.reader = CustomUser.objects.create_user(id='reader', password='password')
+        cls.other = CustomUser.objects.create_user(id='other', password='password')
+        cls.category, _ = Category.objects.get_or_create(user=cls.writer, name='게시판')
+
+    def setUp(self):
+        self.post = Post.objects.create(user=self.writer, category=self.category, title="글", status='published')
+
+    def comment(self, user, content, parent=None):
+        self.client.force_authenticate(user)
+        data = {'content': content, **({'parent': parent} if parent else {})}
+        return self.client.post(f'/posts/{self.post.id}/comments/', data, format='json').json()['id']
+
+    def inbox(self, user):
+        return list(Notification.objects.filter(recipient=user).values_list('type', 'actor_id'))
+
+    def news(self, user):
+        self.client.force_authenticate(user)
+        return self.client.get('/news/list/').json()
+
+    def test_comment_and_reply_recipients(self):
+        parent = self.comment(self.reader, '댓글')
+        self.comment(self.writer, '내 글에 내가 쓴 댓글')  # ✅ 본인에게는 알림 없음
+        self.comment(self.other, '답글', parent=parent)
+        self.comment(self.writer, '작성자 답글', parent=parent)
+
+        self.assertEqual(sorted(self.inbox(self.writer)), [('post_comment', 'other'), ('post_comment', 'reader')])
+        self.assertEqual(sorted(self.inbox(self.reader)), [('comment_reply', 'other'), ('comment_reply', 'writer')])
+        self.assertEqual(self.inbox(self.other), [])
+
+    def test_heart_notification_removed_on_unlike(self):
+        url = f'/posts/{self.post.id}/heart/'
+        self.client.force_authenticate(self.writer)
+        self.client.post(url)  # ✅ 본인 글 좋아요는 알림 없음
+        self.client.force_authenticate(self.reader)
+        self.client.post(url)
+        self.assertEqual(self.inbox(self.writer), [('post_like', 'reader')])
+
+        self.client.post(url)
+        self.assertEqual(self.inbox(self.writer), [])
+
+    def test_list_shape_and_mark_read(self):
+        comment_id = self.comment(self.reader, '댓글')
+        self.client.force_authenticate(self.reader)
+        self.client.post(f'/posts/{self.post.id}/heart/')
+
+        news = self.news(self.writer)
+        self.assertEqual([item['type'] for item in news], ['post_like', 'post_comment'])
+        self.assertTrue(all(set(item) == BASELINE_FIELDS | {'id'} for item in news))
+        self.assertEqual(news[1]['activity_id'], f'comment_{comment_id}')
+        self.assertEqual(news[1]['content'], 'reader님이 글 글에 댓글을 남겼습니다.')
+        self.assertEqual((news[1]['is_parent'], news[1]['post_id'], news[1]['post_urlname']), (True, self.post.id, 'writer'))
+        self.assertIsNone(news[0]['is_parent'])
+
+        response = self.client.post('/news/read/', {'ids': [news[0]['id']]}, format='json')
+        self.assertEqual(response.json(), {'updated': 1})
+        self.assertEqual([item['type'] for item in self.news(self.writer)], ['post_comment'])
+
+        self.client.post('/news/read/', {}, format='json')
+        self.assertEqual(self.news(self.writer), [])
+        self.assertEqual(self.client.post('/news/read/', {'ids': 'all'}, format='json').status_code, 400)
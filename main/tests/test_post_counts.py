@@ -0,0 +1,93 @@
+"""
+✅ 사용자별 게시물 수 카운터 테스트 (생성/수정/삭제 시 증감, 조회자별 개수, reconcile_counts)
+
+    python manage.py test main.tests.test_post_counts --settings=naver_blog.settings_test
+"""
+import io
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from main.models import Category, CustomUser, Neighbor, Post, PostCount
+from main.utils.post_counts import count_expressions
+
+
+class PostCountTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = CustomUser.objects.create_user(id='writer', password='password')
+        cls.neighbor = CustomUser.objects.create_user(id='neighbor', password='password')
+        cls.stranger = CustomUser.objects.create_user(id='stranger', password='password')
+        Neighbor.objects.create(from_user=cls.owner, to_user=cls.neighbor, status='accepted')
+        cls.category, _ = Category.objects.get_or_create(user=cls.owner, name='게시판')
+
+    def create_post(self, visibility='everyone', status='published'):
+        return Post.objects.create(
+            user=self.owner, category=self.category, title="글", visibility=visibility, status=status
+        )
+
+    def assertCountersMatch(self):
+        counters = PostCount.objects.get(user=self.owner)
+        actual = Post.objects.filter(user=self.owner).aggregate(**count_expressions())
+        self.assertEqual({column: getattr(counters, column) for column in actual}, actual)
+
+    def test_counters_follow_create_update_delete(self):
+        posts = [self.create_post(visibility) for visibility in ('everyone', 'mutual', 'me')]
+        draft = self.create_post(status='draft')
+        self.assertCountersMatch()
+
+        draft.status, draft.visibility = 'published', 'mutual'
+        draft.save()
+        posts[0].title = "제목만 수정"
+        posts[0].save()
+        self.assertCountersMatch()
+
+        posts[1].delete()
+        self.client.force_authenticate(self.owner)
+        self.client.post('/posts/me/delete/', {'ids': [posts[0].id, posts[2].id]}, format='json')
+        self.assertCountersMatch()
+        self.assertEqual(PostCount.objects.get(user=self.owner).mutual_published, 1)
+
+    def test_count_view_by_viewer_without_count_query(self):
+        for visibility in ('everyone', 'everyone', 'mutual', 'me'):
+            self.create_post(visibility)
+        self.create_post(status='draft')
+
+        expected = {self.owner: 4, self.neighbor: 3, self.stranger: 2, None: 2}
+        for viewer, post_count in expected.items():
+            self.client.force_authenticate(viewer)
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get('/posts/count/writer/')
+            self.assertEqual(response.json()['post_count'], post_count)
+            self.assertFalse(any('COUNT(' in q['sql'].upper() for q in ctx.captured_queries))
+
+    def test_reconcile_counts_repairs_drift(self):
+        self.create_post()
+        PostCount.objects.filter(user=self.owner).update(everyone_published=9, me_draft=3)
+        PostCount.objects.filter(user=self.stranger).delete()
+
+        call_command('reconcile_counts', stdout=io.StringIO())
+        self.assertCountersMatch()
+        self.assertTrue(PostCount.objects.filter(user=self.stranger).exists())
+
+    def test_invalid_status_or_visibility_rejected_before_save(self):
+        self.client.force_authenticate(self.owner)
+        for data in ({'status': 'archived'}, {'visibility': 'friends'}):
+            with self.subTest(data=data):
+                response = self.client.post('/posts/me/create/', {'title': "글", **data})
+                self.assertEqual(response.status_code, 400)
+        self.assertFalse(Post.objects.exists())
+
+        post = self.create_post()
+        response = self.client.patch(f'/posts/me/{post.id}/manage/', {'visibility': 'friends'})
+        self.assertEqual(response.status_code, 400)
+        post.refresh_from_db()
+        self.assertEqual(post.visibility, 'everyone')
+        self.assertCountersMatch()
+
+        # ✅ 뷰를 거치지 않은 저장도 카운터 때문에 실패하지는 않음
+        Post.objects.create(user=self.owner, category=self.category, title="글", status='archived')
+        self.assertCountersMatch()
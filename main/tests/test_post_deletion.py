@@ -0,0 +1,63 @@
+"""
+✅ 게시물 삭제 테스트 (CASCADE 행 단위 signal 생략, 파일 정리, 일괄 삭제)
+
+    python manage.py test main.tests.test_post_deletion --settings=naver_blog.settings_test
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from main.models import Category, Comment, CustomUser, Heart, Post, PostImage, Profile
+from main.utils.deletion import in_post_cascade, post_cascade
+
+
+class PostDeletionTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(id='writer', password='password')
+        cls.reader = CustomUser.objects.create_user(id='reader', password='password')
+        cls.category, _ = Category.objects.get_or_create(user=cls.user, name='게시판')
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def popular_post(self, size):
+        post = Post.objects.create(user=self.user, category=self.category, title="인기 글", status='published')
+        author = Profile.objects.get(user=self.reader)
+        for i in range(size):
+            Comment.objects.create(post=post, author=author, author_name='reader', content=f"댓글 {i}")
+        Heart.objects.create(post=post, user=self.reader)
+        PostImage.objects.bulk_create([PostImage(post=post, image=f'post_pics/x/{i}.jpg') for i in range(size)])
+        return post
+
+    def delete_queries(self, post):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.delete(f'/posts/me/{post.id}/manage/')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Post.objects.filter(pk=post.pk).exists())
+        return len(ctx.captured_queries)
+
+    def test_delete_cost_independent_of_comment_and_image_count(self):
+        small = self.delete_queries(self.popular_post(2))
+        large = self.delete_queries(self.popular_post(20))
+        self.assertEqual(small, large)
+        self.assertFalse(Comment.objects.exists())
+
+    def test_bulk_delete_only_own_posts(self):
+        mine = [self.popular_post(1) for _ in range(3)]
+        other = Post.objects.create(user=self.reader, category=self.category, title="남의 글")
+
+        response = self.client.post('/posts/me/delete/', {'ids': [p.id for p in mine] + [other.id]}, format='json')
+        self.assertEqual(response.json(), {'deleted': 3})
+        self.assertEqual(list(Post.objects.values_list('id', flat=True)), [other.id])
+
+        response = self.client.post('/posts/me/delete/', {'ids': 'all'}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_cascade_scope_is_restored(self):
+        with post_cascade([1, 2]):
+            with post_cascade([2, 3]):
+                self.assertTrue(in_post_cascade(3))
+            self.assertTrue(in_post_cascade(2))  # ✅ 바깥 구간이 등록한 id는 안쪽 구간이 끝나도 유지
+        self.assertFalse(in_post_cascade(1))
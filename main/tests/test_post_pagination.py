@@ -0,0 +1,87 @@
+"""
+✅ 게시물 목록 키셋 페이지네이션 테스트 (내 글 / 임시 저장 / 최신 글 / 블로그 글, COUNT 없는 has_more)
+
+    python manage.py test main.tests.test_post_pagination --settings=naver_blog.settings_test
+"""
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from main.models import Category, CustomUser, Post, Profile
+
+
+class PostPaginationTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(id='writer', password='password')
+        cls.category, _ = Category.objects.get_or_create(user=cls.user, name='게시판')
+        cls.published = [
+            Post.objects.create(user=cls.user, category=cls.category, title=f"글 {i}", status='published')
+            for i in range(12)
+        ]
+        cls.drafts = [
+            Post.objects.create(user=cls.user, category=cls.category, title=f"임시 {i}") for i in range(4)
+        ]
+        cls.urlname = Profile.objects.get(user=cls.user).urlname
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def walk(self, url, page_size):
+        """ ✅ next_cursor를 따라가며 모든 페이지의 id 수집 """
+        ids, cursor = [], None
+        while True:
+            params = {'page_size': page_size, **({'cursor': cursor} if cursor else {})}
+            with CaptureQueriesContext(connection) as ctx:
+                data = self.client.get(url, params).json()
+            self.assertFalse(any('COUNT(' in q['sql'].upper() for q in ctx.captured_queries))
+            ids += [post['id'] for post in data['results']]
+            if not data['has_more']:
+                self.assertIsNone(data['next_cursor'])
+                return ids
+            cursor = data['next_cursor']
+
+    def test_pages_cover_list_newest_first_without_count(self):
+        newest_first = [post.id for post in reversed(self.published)]
+        self.assertEqual(self.walk('/posts/me/', 5), newest_first)
+        self.assertEqual(self.walk('/posts/me/current/', 5), newest_first)
+        self.assertEqual(self.walk(f'/posts/{self.urlname}/current/', 5), newest_first)
+        self.assertEqual(self.walk('/posts/drafts/', 3), [post.id for post in reversed(self.drafts)])
+
+    def test_without_cursor_keeps_plain_list(self):
+        self.assertEqual(len(self.client.get('/posts/me/').json()), 12)
+        self.assertEqual(len(self.client.get('/posts/drafts/').json()), 4)
+        recent = self.client.get('/posts/me/current/').json()
+        self.assertEqual([post['id'] for post in recent], [post.id for post in reversed(self.published[-5:])])
+
+    def test_query_count_independent_of_page_size(self):
+        def count(page_size):
+            with CaptureQueriesContext(connection) as ctx:
+                self.client.get('/posts/me/', {'page_size': page_size})
+            return len(ctx.captured_queries)
+        self.assertEqual(count(2), count(10))
+
+    def test_nth_recent_post(self):
+        response = self.client.get('/posts/me/recent/', {'n': 3})
+        self.assertEqual(response.json()['id'], self.published[-3].id)
+        self.assertEqual(self.client.get('/posts/me/recent/', {'n': 13}).status_code, 404)
+
+    def test_nth_recent_post_seeks_from_cursor(self):
+        newest_first = [post.id for post in reversed(self.published)]
+        seen, cursor = [], None
+        while True:
+            response = self.client.get('/posts/me/recent/', {'n': 2, **({'cursor': cursor} if cursor else {})})
+            if response.status_code == 404:
+                break
+            seen.append(response.json()['id'])
+            cursor = response['X-Next-Cursor']
+        self.assertEqual(seen, newest_first[1::2])  # ✅ cursor 다음부터 두 번째씩
+
+        # ✅ cursor가 있으면 OFFSET 없이 LIMIT 1로 바로 이동
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get('/posts/me/recent/', {'cursor': cursor})
+        self.assertFalse(any('OFFSET' in q['sql'].upper() for q in ctx.captured_queries))
+        self.assertEqual(self.client.get('/posts/me/recent/', {'cursor': '!!!'}).status_code, 400)
@@ -0,0 +1,72 @@
+"""
+✅ 프로필 저장 시 실행되는 후속 처리 테스트 (댓글 작성자 이름 동기화 등)
+
+    python manage.py test main.tests.test_profile_signals --settings=naver_blog.settings_test
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from main.models import Category, Comment, CustomUser, Post, PostSearchTerm, Profile
+
+
+class ProfileSignalTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.writer = CustomUser.objects.create_user(id='writer', password='password')
+        cls.commenter = CustomUser.objects.create_user(id='commenter', password='password')
+        category, _ = Category.objects.get_or_create(user=cls.writer, name='게시판')
+        post = Post.objects.create(user=cls.writer, category=category, title="글", status='published')
+        author = Profile.objects.get(user=cls.commenter)
+        Comment.objects.bulk_create([
+            Comment(post=post, author=author, author_name=author.username, content=f"댓글 {i}") for i in range(30)
+        ])
+
+    def test_username_change_rewrites_comments_in_one_update(self):
+        profile = Profile.objects.get(user=self.commenter)
+        profile.username = '새이름'
+        with CaptureQueriesContext(connection) as ctx:
+            profile.save()
+
+        updates = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('UPDATE "main_comment"')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(set(Comment.objects.values_list('author_name', flat=True)), {'새이름'})
+        self.assertLess(len(ctx), 10)  # ✅ 댓글 수(30개)와 무관 - 댓글별 save()/signal 없음
+
+    def test_profile_save_does_not_reload_row(self):
+        profile = Profile.objects.get(user=self.commenter)
+        profile.intro = '소개'
+        with CaptureQueriesContext(connection) as ctx:
+            profile.save()
+
+        selects = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('SELECT "main_profile"')]
+        self.assertEqual(selects, [])  # ✅ 이전 값은 불러올 때 기록한 값으로 비교
+        self.assertFalse(Comment.objects.exclude(author_name='commenter').exists())
+
+    def test_changes_tracked_per_instance(self):
+        first = Profile.objects.get(user=self.commenter)
+        second = Profile.objects.get(user=self.commenter)
+        first.username = '첫째'
+        self.assertTrue(first.has_changed('username'))
+        self.assertFalse(second.has_changed('username'))  # ✅ 인스턴스마다 따로 기록 (전역 상태 없음)
+
+        first.save()
+        self.assertFalse(first.has_changed('username'))
+        self.assertEqual(first.original('username'), '첫째')
+
+    def test_post_save_skips_unchanged_work(self):
+        post = Post.objects.get()
+        post.comment_count = 3
+        with CaptureQueriesContext(connection) as ctx:
+            post.save(update_fields=['comment_count'])
+        self.assertFalse(any('main_category' in q['sql'] for q in ctx.captured_queries))
+
+        post.content = '<p>바뀐 본문</p>'
+        post.save()
+        self.assertEqual(Post.objects.get().excerpt, '바뀐 본문')
+
+    def test_new_post_counts_as_changed_in_post_save(self):
+        post = Post.objects.create(user=self.writer, title="새 글 제목", content="본문", status='published')
+        self.assertTrue(PostSearchTerm.objects.filter(post=post, field='title').exists())  # ✅ 첫 저장에서 색인
+        self.assertFalse(post.has_changed('title'))
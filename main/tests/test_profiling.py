@@ -0,0 +1,90 @@
+"""
+✅ 요청 프로파일링 미들웨어 테스트 (Server-Timing, 통계, query_budget)
+
+    python manage.py test main.tests.test_profiling --settings=naver_blog.settings_test
+"""
+from unittest import mock
+
+from rest_framework.test import APITestCase
+
+from main.models import Category, Comment, CustomUser, Heart, Post
+from main.utils.profiling import QueryBudgetExceeded, request_stats
+from main.views.post import PostListView
+
+
+class RequestProfilingTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = CustomUser.objects.create_user(id='owner', password='password')
+        cls.reader = CustomUser.objects.create_user(id='reader', password='password')
+        cls.admin = CustomUser.objects.create_superuser(id='admin', password='password')
+        category, _ = Category.objects.get_or_create(user=cls.owner, name='게시판')
+
+        for i in range(5):
+            post = Post.objects.create(user=cls.owner, category=category, title=f"글 {i}", status='published')
+            parent = Comment.objects.create(post=post, author=cls.reader.profile, author_name='reader', content="댓글")
+            Comment.objects.create(
+                post=post, author=cls.owner.profile, author_name='owner', content="대댓글",
+                parent=parent, is_parent=False, is_private=True,
+            )
+            Heart.objects.create(post=post, user=cls.reader)
+        cls.post = post
+
+    def setUp(self):
+        request_stats.clear()
+
+    def test_server_timing_header(self):
+        self.client.force_authenticate(self.reader)
+        response = self.client.get('/posts/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('db;dur=', response['Server-Timing'])
+        self.assertIn('ser;dur=', response['Server-Timing'])
+        self.assertIn('total;dur=', response['Server-Timing'])
+
+    def test_serializers_run_without_queries(self):
+        """ ✅ PostSerializer / CommentSerializer / NewsSerializer 직렬화 중 추가 쿼리(N+1)가 없어야 함 """
+        self.client.force_authenticate(self.reader)
+        self.client.get('/posts/')
+        self.client.get(f'/posts/{self.post.id}/comments/')
+        self.client.force_authenticate(self.owner)
+        self.client.get('/news/list/')
+
+        self.client.force_authenticate(self.admin)
+        stats = self.client.get('/profiling/stats/').json()
+
+        for endpoint in ('GET post-list', 'GET comment-list', 'GET my-news-list'):
+            self.assertEqual(stats[endpoint]['count'], 1, endpoint)
+            self.assertEqual(stats[endpoint]['max_serializer_queries'], 0, endpoint)
+
+    def test_stats_endpoint_is_admin_only(self):
+        self.client.force_authenticate(self.reader)
+        self.assertEqual(self.client.get('/profiling/stats/').status_code, 403)
+
+    def test_query_budget_raises_when_strict(self):
+        self.client.force_authenticate(self.reader)
+        with mock.patch.object(PostListView, 'query_budget', {'GET': 0}):
+            with self.assertRaises(QueryBudgetExceeded):
+                self.client.get('/posts/')
+
+    def test_query_budget_logs_when_not_strict(self):
+        self.client.force_authenticate(self.reader)
+        with mock.patch.object(PostListView, 'query_budget', {'GET': 0}), \
+                self.settings(REQUEST_PROFILING={'QUERY_BUDGET_STRICT': False}), \
+                self.assertLogs('main.middleware.profiling', level='WARNING'):
+            response = self.client.get('/posts/')
+        self.assertEqual(response.status_code, 200)
+
+    def test_card_view_runs_without_queries(self):
+        """ ✅ `?view=card` 카드 응답은 피드 / 블로그 최근 글 모두 직렬화 중 추가 쿼리가 없어야 함 """
+        self.client.force_authenticate(self.reader)
+        posts = self.client.get('/posts/?view=card').json()
+        self.client.get('/posts/owner/current/?view=card')
+        self.assertNotIn('content', posts[0])
+        self.assertIn('excerpt', posts[0])
+
+        self.client.force_authenticate(self.admin)
+        stats = self.client.get('/profiling/stats/').json()
+        for endpoint in ('GET post-list', 'GET post-public-recent'):
+            self.assertEqual(stats[endpoint]['max_serializer_queries'], 0, endpoint)
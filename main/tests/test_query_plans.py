@@ -0,0 +1,113 @@
+"""
+✅ 목록 / 검색 API 쿼리 플랜 회귀 테스트
+- 시드 데이터를 만든 뒤 각 API가 실행한 SELECT마다 EXPLAIN QUERY PLAN을 확인
+- 테이블 전체를 훑는 "SCAN <table>"(인덱스 전체를 훑는 "SCAN <table> USING [COVERING] INDEX" 포함)이 나오면 실패
+
+    python manage.py test main.tests.test_query_plans --settings=naver_blog.settings_test
+"""
+import re
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from main.models import Category, Comment, CustomUser, Heart, Neighbor, Post
+
+FULL_SCAN = re.compile(r'^SCAN (\w+)(?: USING (?:COVERING )?INDEX \w+)?$')
+
+
+class QueryPlanTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = cls.create_user('owner')
+        cls.friend = cls.create_user('friend')
+        cls.stranger = cls.create_user('stranger')
+        Neighbor.objects.create(from_user=cls.owner, to_user=cls.friend, status='accepted')
+
+        for user in (cls.owner, cls.friend, cls.stranger):
+            category = Category.objects.get(user=user, name='게시판')
+            for visibility in ('everyone', 'mutual', 'me'):
+                for status in ('published', 'draft'):
+                    for i in range(3):
+                        Post.objects.create(
+                            user=user, category=category, title=f"검색 테스트 {visibility} {i}",
+                            content=f"<p>검색 본문 {i}</p>", visibility=visibility, status=status,
+                        )
+
+        cls.post = Post.objects.filter(user=cls.owner, visibility='everyone', status='published').first()
+        for author in (cls.friend, cls.stranger):
+            parent = Comment.objects.create(post=cls.post, author=author.profile, author_name=author.profile.username, content="댓글")
+            Comment.objects.create(
+                post=cls.post, author=cls.owner.profile, author_name=cls.owner.profile.username,
+                content="대댓글", parent=parent, is_parent=False,
+            )
+            Heart.objects.create(post=cls.post, user=author)
+
+    @staticmethod
+    def create_user(user_id):
+        user = CustomUser.objects.create_user(id=user_id, password='password')
+        Category.objects.get_or_create(user=user, name='게시판')
+        return user
+
+    def full_scans(self, queries, allow=()):
+        """ ✅ 캡처한 SELECT들의 실행 계획에서 허용 목록 밖의 전체 테이블 스캔 찾기 """
+        scans = []
+        with connection.cursor() as cursor:
+            for query in queries:
+                sql = query['sql']
+                if not sql.startswith('SELECT'):
+                    continue
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+                for row in cursor.fetchall():
+                    match = FULL_SCAN.match(row[-1])
+                    if match and match.group(1) not in allow:
+                        scans.append(f"{row[-1]}\n    ← {sql}")
+        return scans
+
+    def assertNoFullScan(self, url, user=None, allow=()):
+        self.client.force_authenticate(user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        scans = self.full_scans(ctx.captured_queries, allow)
+        self.assertFalse(scans, f"{url} 에서 전체 테이블 스캔 발생:\n" + "\n".join(scans))
+
+    def test_post_lists(self):
+        self.assertNoFullScan('/posts/', self.friend)
+        self.assertNoFullScan('/posts/?page_size=5', self.friend)
+        self.assertNoFullScan('/posts/?view=card', self.friend)
+        self.assertNoFullScan('/posts/?urlname=owner', self.friend)
+        self.assertNoFullScan('/posts/?keyword=default', self.friend)
+        self.assertNoFullScan('/posts/owner/current/', self.friend)
+        self.assertNoFullScan('/posts/me/', self.owner)
+        self.assertNoFullScan('/posts/me/?view=card', self.owner)
+        self.assertNoFullScan('/posts/me/current/', self.owner)
+        self.assertNoFullScan('/posts/drafts/', self.owner)
+        self.assertNoFullScan('/posts/mutual/recentweekly/', self.owner)
+        self.assertNoFullScan('/posts/count/owner/', self.friend)
+
+    def test_comment_and_heart_lists(self):
+        self.assertNoFullScan(f'/posts/{self.post.id}/comments/', self.friend)
+        self.assertNoFullScan(f'/posts/{self.post.id}/comments/?page_size=1', self.friend)
+        self.assertNoFullScan(f'/posts/{self.post.id}/heart/users/', self.friend)
+
+    def test_news_and_activity(self):
+        self.assertNoFullScan('/news/list/', self.owner)
+        self.assertNoFullScan('/news/list/?page_size=2', self.owner)
+        self.assertNoFullScan('/activity/list/', self.friend)
+
+    def test_neighbor_and_category_lists(self):
+        self.assertNoFullScan('/profile/me/neighbors/', self.owner)
+        self.assertNoFullScan('/profile/owner/neighbors/', self.friend)
+        self.assertNoFullScan('/neighbors/requests/me', self.friend)
+        self.assertNoFullScan('/category/?urlname=owner', self.friend)
+
+    def test_post_search(self):
+        self.assertNoFullScan('/search/blog/?urlname=owner&q=검색', self.friend)
+        self.assertNoFullScan('/search/global-post/?q=검색', self.friend)
+
+    def test_profile_search(self):
+        # ✅ 닉네임/블로그 이름 부분 일치 검색은 LIKE '%...%'라 인덱스를 쓸 수 없음 → profile 스캔만 허용
+        self.assertNoFullScan('/search/global-blog/?q=owner', self.friend, allow=('main_profile',))
+        self.assertNoFullScan('/search/global-nickandid/?q=owner', self.friend, allow=('main_profile',))
@@ -0,0 +1,85 @@
+"""
+✅ 블로그 응답 캐시 테스트 ((urlname, 조회자 구분) 단위 캐시 + 블로그 버전 무효화)
+
+    python manage.py test main.tests.test_response_cache --settings=naver_blog.settings_test
+"""
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from main.models import Category, CustomUser, Neighbor, Post, Profile
+
+
+class ResponseCacheTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = CustomUser.objects.create_user(id='owner', password='password')
+        cls.friend = CustomUser.objects.create_user(id='friend', password='password')
+        cls.stranger = CustomUser.objects.create_user(id='stranger', password='password')
+        Neighbor.objects.create(from_user=cls.owner, to_user=cls.friend, status='accepted')
+        cls.category, _ = Category.objects.get_or_create(user=cls.owner, name='게시판')
+        for visibility in ('everyone', 'mutual', 'me'):
+            Post.objects.create(
+                user=cls.owner, category=cls.category, title=visibility, status='published', visibility=visibility,
+            )
+
+    def setUp(self):
+        cache.clear()  # ✅ 테스트마다 DB가 되돌아가므로 이전 테스트의 캐시된 응답 제거
+
+    def titles(self, viewer):
+        self.client.force_authenticate(viewer)
+        return sorted(post['title'] for post in self.client.get('/posts/owner/current/').json())
+
+    def test_recent_posts_cached_per_viewer_class(self):
+        self.assertEqual(self.titles(self.owner), ['everyone', 'me', 'mutual'])
+        self.assertEqual(self.titles(self.friend), ['everyone', 'mutual'])
+        self.assertEqual(self.titles(self.stranger), ['everyone'])
+        self.assertEqual(self.titles(None), ['everyone'])
+
+        # ✅ 두 번째 조회는 프로필 조회 한 번으로 응답
+        self.client.force_authenticate(self.stranger)
+        with self.assertNumQueries(1):
+            self.client.get('/posts/owner/current/')
+
+        # ✅ 글 작성 / 서로이웃 수락 → 블로그 버전이 올라가 새 목록
+        Post.objects.create(user=self.owner, category=self.category, title='new', status='published')
+        Neighbor.objects.create(from_user=self.stranger, to_user=self.owner, status='accepted')
+        self.assertEqual(self.titles(self.stranger), ['everyone', 'mutual', 'new'])
+
+    def test_profile_and_categories_invalidated_on_change(self):
+        self.client.force_authenticate(self.stranger)
+        self.assertEqual(self.client.get('/profile/owner/').json()['blog_name'], 'owner님의 블로그')
+        self.assertEqual([c['name'] for c in self.client.get('/category/?urlname=owner').json()], ['게시판'])
+
+        profile = Profile.objects.get(user=self.owner)
+        profile.blog_name = '새 이름'
+        profile.save()
+        Category.objects.create(user=self.owner, name='여행')
+
+        self.assertEqual(self.client.get('/profile/owner/').json()['blog_name'], '새 이름')
+        self.assertEqual(
+            sorted(c['name'] for c in self.client.get('/category/?urlname=owner').json()), ['게시판', '여행']
+        )
+
+    def test_neighbor_list_follows_neighbor_profile(self):
+        response = self.client.get('/profile/owner/neighbors/')
+        self.assertEqual([n['username'] for n in response.json()['neighbors']], ['friend'])
+
+        # ✅ 이웃이 이름을 바꾸면 그 이웃이 보이는 목록도 무효화
+        profile = Profile.objects.get(user=self.friend)
+        profile.username = '친구'
+        profile.save()
+        response = self.client.get('/profile/owner/neighbors/')
+        self.assertEqual([n['username'] for n in response.json()['neighbors']], ['친구'])
+
+    def test_neighbor_list_refreshed_after_accept(self):
+        Neighbor.objects.create(from_user=self.stranger, to_user=self.owner, status='pending')
+        response = self.client.get('/profile/owner/neighbors/')
+        self.assertEqual([n['username'] for n in response.json()['neighbors']], ['friend'])
+
+        # ✅ 수락은 update()로 처리되어 signal이 없음 → 뷰에서 직접 무효화
+        self.client.force_authenticate(self.owner)
+        self.assertEqual(self.client.put('/neighbors/accept/stranger/').status_code, 200)
+        self.client.force_authenticate(None)
+        response = self.client.get('/profile/owner/neighbors/')
+        self.assertEqual(sorted(n['username'] for n in response.json()['neighbors']), ['friend', 'stranger'])
@@ -0,0 +1,135 @@
+"""
+✅ 게시물 검색 색인 테스트 (n-gram 매칭, 점수순 정렬/페이지, 재색인, 공개 범위)
+
+    python manage.py test main.tests.test_search --settings=naver_blog.settings_test
+"""
+from importlib import import_module
+
+from django.apps import apps
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from main.models import Category, CustomUser, Neighbor, Post, PostImage, PostSearchTerm
+from main.utils.search_index import NGRAM_SIZE, query_terms, search_post_ids, tokenize
+
+
+class SearchIndexTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = CustomUser.objects.create_user(id='owner', password='password')
+        cls.friend = CustomUser.objects.create_user(id='friend', password='password')
+        cls.stranger = CustomUser.objects.create_user(id='stranger', password='password')
+        Neighbor.objects.create(from_user=cls.owner, to_user=cls.friend, status='accepted')
+        cls.category, _ = Category.objects.get_or_create(user=cls.owner, name='게시판')
+
+    def setUp(self):
+        cache.clear()  # ✅ 같은 id를 쓰는 다른 테스트의 서로이웃 캐시 제거
+
+    def create_post(self, title, content='', visibility='everyone'):
+        return Post.objects.create(
+            user=self.owner, category=self.category, title=title, content=content,
+            status='published', visibility=visibility,
+        )
+
+    def search(self, keyword, **kwargs):
+        return search_post_ids(keyword, Post.objects.all(), **kwargs)[0]
+
+    def test_tokenize_korean_ngrams(self):
+        self.assertEqual(tokenize('<p>제주도 여행</p>'), ['제', '주', '도', '제주', '주도', '여', '행', '여행'])
+        self.assertEqual(tokenize('개 A'), ['개', 'a'])
+        self.assertEqual(query_terms('제주도 개'), {'제주', '주도', '개'})  # ✅ NGRAM_SIZE 이하 단어는 그대로
+        self.assertEqual(NGRAM_SIZE, 2)
+
+    def test_matches_all_ngrams_of_keyword(self):
+        jeju = self.create_post('제주도 여행기', '<b>바다</b>가 예뻤다')
+        busan = self.create_post('부산 여행', '바다')
+        dog = self.create_post('우리 집 개', '산책')
+
+        self.assertEqual(self.search('제주도'), [jeju.id])
+        self.assertEqual(set(self.search('여행')), {jeju.id, busan.id})
+        self.assertEqual(self.search('제주 부산'), [])  # ✅ 모든 토큰을 포함해야 결과
+        self.assertEqual(self.search('개'), [dog.id])
+        self.assertEqual(self.search('!!'), [])
+
+    def test_short_keywords_match_inside_longer_words(self):
+        camping = self.create_post('캠핑장 후기', 'Bonfire night')
+        self.create_post('산책', '')
+
+        self.assertEqual(self.search('핑'), [camping.id])
+        self.assertEqual(self.search('핑장'), [camping.id])
+        self.assertEqual(self.search('o'), [camping.id])
+        self.assertEqual(self.search('fi'), [camping.id])
+
+    def test_ngrams_must_be_adjacent(self):
+        post = self.create_post('가나 나다')  # ✅ '가나'와 '나다'를 모두 포함하지만 '가나다'는 없음
+        self.assertEqual(self.search('가나다'), [])
+        self.assertEqual(self.search('가나 나다'), [post.id])
+
+        # ✅ 확인 단계에서 걸러져도 페이지가 비지 않도록 다음 후보를 이어서 확인
+        matches = [self.create_post(f'가나다 {i}') for i in range(3)]
+        first, has_more = search_post_ids('가나다', Post.objects.all(), offset=0, limit=2)
+        rest, more = search_post_ids('가나다', Post.objects.all(), offset=2, limit=2)
+        self.assertEqual((len(first), has_more, len(rest), more), (2, True, 1, False))
+        self.assertEqual(set(first + rest), {p.id for p in matches})
+
+    def test_ranking_and_paging(self):
+        content_only = self.create_post('일기', '캠핑')
+        title = self.create_post('캠핑', '')
+        twice = self.create_post('캠핑 캠핑', '')
+        caption = self.create_post('사진', '')
+        PostImage.objects.create(post=caption, image='post_pics/x/a.jpg', caption='캠핑')
+
+        # ✅ 제목(3) > 사진 설명(2) > 본문(1), 같은 필드는 등장 횟수만큼
+        expected = [twice.id, title.id, caption.id, content_only.id]
+        self.assertEqual(self.search('캠핑'), expected)
+
+        first, has_more = search_post_ids('캠핑', Post.objects.all(), offset=0, limit=3)
+        self.assertEqual((first, has_more), (expected[:3], True))
+        rest, has_more = search_post_ids('캠핑', Post.objects.all(), offset=3, limit=3)
+        self.assertEqual((rest, has_more), (expected[3:], False))
+
+    def test_reindex_on_edit_and_captions(self):
+        post = self.create_post('봄 소풍', '김밥')
+        self.assertEqual(self.search('김밥'), [post.id])
+
+        post.title, post.content = '가을 운동회', '달리기'
+        post.save()
+        self.assertEqual(self.search('김밥'), [])
+        self.assertEqual(self.search('소풍'), [])
+        self.assertEqual(self.search('운동회'), [post.id])
+
+        image = PostImage.objects.create(post=post, image='post_pics/x/b.jpg', caption='단체 사진')
+        self.assertEqual(self.search('단체'), [post.id])
+        image.delete()
+        self.assertEqual(self.search('단체'), [])
+
+    def test_visibility_in_search_views(self):
+        self.create_post('여행 전체', visibility='everyone')
+        self.create_post('여행 이웃', visibility='mutual')
+        self.create_post('여행 비밀', visibility='me')
+
+        def blog_titles(viewer):
+            self.client.force_authenticate(viewer)
+            results = self.client.get('/search/blog/', {'urlname': 'owner', 'q': '여행'}).json()['results']
+            return sorted(result['title'] for result in results)
+
+        self.assertEqual(blog_titles(self.friend), ['여행 이웃', '여행 전체'])
+        self.assertEqual(blog_titles(self.stranger), ['여행 전체'])
+        self.assertEqual(blog_titles(None), ['여행 전체'])
+
+        self.client.force_authenticate(self.friend)
+        posts = self.client.get('/search/global-post/', {'q': '여행'}).json()['posts']
+        self.assertEqual([post['title'] for post in posts], ['여행 전체'])
+
+    def test_migration_backfills_existing_posts(self):
+        post = self.create_post('오래된 글', '<p>캠핑 후기</p>')
+        PostImage.objects.create(post=post, image='post_pics/x/c.jpg', caption='바닷가')
+        PostSearchTerm.objects.all().delete()  # ✅ 색인 도입 전에 작성된 게시물
+        self.assertEqual(self.search('캠핑'), [])
+
+        migration = import_module('main.migrations.0016_backfill_search_index')
+        migration.backfill_search_index(apps, None)
+        self.assertEqual(self.search('캠핑'), [post.id])
+        self.assertEqual(self.search('바닷'), [post.id])
+        self.assertEqual(self.search('된'), [post.id])
@@ -0,0 +1,39 @@
+from main.models.comment import Comment
+
+THREAD_ORDERING = ('created_at', 'id')
+
+
+def load_comment_thread(post, top_level=None):
+    """
+    ✅ 게시글의 댓글 스레드를 트리 형태로 불러오기
+    - top_level이 없으면: 게시글의 댓글/대댓글 전체를 쿼리 한 번으로 조회
+    - top_level(최상위 댓글 페이지)이 있으면: 해당 댓글들의 대댓글만 쿼리 한 번으로 추가 조회
+    - 작성자(Profile)는 select_related로 함께 가져오고, post / parent는 메모리의 객체를 연결
+      → CommentSerializer가 비밀 댓글 마스킹·작성자 여부 판단 시 추가 쿼리를 만들지 않음
+    - 반환: 최상위 댓글 목록 (각 댓글의 thread_replies에 대댓글 목록)
+    """
+    if top_level is None:
+        comments = list(
+            Comment.objects.filter(post_id=post.id).select_related('author').order_by(*THREAD_ORDERING)
+        )
+    else:
+        top_level = list(top_level)
+        replies = Comment.objects.filter(
+            parent_id__in=[comment.id for comment in top_level]
+        ).select_related('author').order_by(*THREAD_ORDERING)
+        comments = top_level + list(replies)
+
+    by_id = {comment.id: comment for comment in comments}
+    roots = []
+    for comment in comments:
+        comment.post = post
+        comment.thread_replies = []
+
+    for comment in comments:
+        if comment.parent_id is None:
+            roots.append(comment)
+        elif comment.parent_id in by_id:
+            parent = by_id[comment.parent_id]
+            comment.parent = parent
+            parent.thread_replies.append(comment)
+    return roots
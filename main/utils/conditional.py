@@ -0,0 +1,56 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from main.models.post import Post, PostImage
+from main.utils.counters import get_like_count
+
+
+def make_etag(*parts):
+    """ ✅ 응답을 결정하는 값들로 만든 약한(W/) ETag (본문 바이트가 아니라 의미상 동일 여부) """
+    digest = hashlib.md5(repr(parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def conditional_response(request, etag, build, last_modified=None):
+    """
+    ✅ 조건부 GET 처리
+    - If-None-Match가 ETag와 같으면 build()(직렬화)를 호출하지 않고 304 반환
+    - 아니면 build()로 만든 200 응답에 ETag / Last-Modified / Cache-Control 헤더 추가
+    - 304 판단은 ETag로만 함: Last-Modified는 updated_at 기준이라 카운터 변화(하트 등)를 반영하지 못함
+    """
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = build()
+    if response.status_code in (200, 304):
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        patch_cache_control(response, private=True, no_cache=True)  # ✅ 브라우저가 저장하되 매번 재검증
+    return response
+
+
+def post_validators(queryset, request):
+    """
+    ✅ 게시물 상세 응답(PostSerializer)의 ETag / Last-Modified를 직렬화 없이 계산
+    - 게시물 수정 시각, 하트/댓글 수, 카테고리 이름, 작성자 프로필 수정 시각, 이미지 목록, 요청 host
+    - queryset에 접근 권한 조건이 들어 있으므로 볼 수 없는 글이면 (None, None)
+    """
+    row = queryset.values(
+        'id', 'updated_at', 'like_count', 'comment_count', 'category__name', 'user__profile__updated_at'
+    ).first()
+    if row is None:
+        return None, None
+
+    images = list(
+        PostImage.objects.filter(post_id=row['id']).order_by('id')
+        .values_list('id', 'image', 'caption', 'is_representative', 'status', 'variants')
+    )
+    like_count = get_like_count(Post(pk=row['id'], like_count=row['like_count']))
+    etag = make_etag(
+        'post', row['id'], row['updated_at'], like_count, row['comment_count'], row['category__name'],
+        row['user__profile__updated_at'], images, request.get_host(),
+    )
+    last_modified = max(filter(None, [row['updated_at'], row['user__profile__updated_at']]))
+    return etag, last_modified
@@ -0,0 +1,59 @@
+import hashlib
+import re
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.html import escape
+
+# ✅ 렌더링된 게시물 본문 캐시
+# - 키: (게시물 id, updated_at, 이미지 목록 digest, 요청 host) → 수정(PATCH)·이미지 변경 시 키가 바뀌어 자동 무효화
+CONTENT_CACHE_TIMEOUT = 60 * 60 * 24
+CONTENT_CACHE_KEY = "post_content:{post_id}:{digest}"
+
+# ✅ 캡션 <input> 태그와 따옴표 바로 뒤의 미디어 경로를 한 번의 정규식 순회로 찾음
+CONTENT_PATTERN = re.compile(
+    r'(?P<input><input[^>]*id="caption_(?P<image_id>\d+)"[^>]*>)'
+    r'|(?<=["\'])(?P<url>' + re.escape(settings.MEDIA_URL) + r'[^"\'\s>]+)'
+)
+
+
+def images_digest(images):
+    """ ✅ 본문 렌더링에 영향을 주는 이미지 속성(id, 경로, 캡션) digest """
+    source = "|".join(f"{image.id}:{image.image.name}:{image.caption or ''}" for image in images)
+    return hashlib.md5(source.encode()).hexdigest()
+
+
+def _render(content, images, request):
+    captions = {str(image.id): escape(image.caption) if image.caption else "" for image in images}
+    image_urls = {image.image.url for image in images if image.image} if request else set()
+
+    def replace(match):
+        if match.group('input') is not None:
+            image_id = match.group('image_id')
+            return captions[image_id] if image_id in captions else match.group(0)
+
+        url = match.group('url')
+        return request.build_absolute_uri(url) if url in image_urls else url
+
+    return CONTENT_PATTERN.sub(replace, content)
+
+
+def render_post_content(post, request=None):
+    """
+    ✅ 게시물 본문 최종 HTML
+    - `<figcaption>` 안의 `<input id="caption_{id}">`를 실제 캡션으로 변환
+    - 게시물 이미지 URL을 요청 host 기준 절대 URL로 변경
+    - 결과는 (게시물, 수정 시각, 이미지 digest, host) 단위로 캐시 → 목록 재조회 시 정규식 처리 생략
+    """
+    content = post.content or ""
+    images = list(post.images.all())  # ✅ 목록에서는 prefetch된 이미지 사용
+    host = request.build_absolute_uri('/') if request else ""
+
+    key_source = f"{post.updated_at.isoformat() if post.updated_at else ''}|{images_digest(images)}|{host}"
+    key = CONTENT_CACHE_KEY.format(post_id=post.id, digest=hashlib.md5(key_source.encode()).hexdigest())
+
+    rendered = cache.get(key)
+    if rendered is None:
+        rendered = _render(content, images, request)
+        cache.set(key, rendered, CONTENT_CACHE_TIMEOUT)
+    return rendered
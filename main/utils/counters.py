@@ -0,0 +1,176 @@
+import atexit
+import logging
+import threading
+import zlib
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedCounter:
+    """
+    ✅ 샤드로 나눈 메모리 내 카운터 (write-behind)
+    - 증감값은 (모델, 필드, pk) 키별로 샤드에 누적되고, 백그라운드 스레드가 주기적으로 DB에 일괄 반영
+    - 샤드마다 별도 Lock을 사용해 인기 게시물에 토글이 몰려도 전역 잠금 경합이 생기지 않음
+    - 반영 전의 증감값은 pending()으로 조회해 DB 값에 더해서 읽음
+    """
+
+    def __init__(self, shards=16, flush_interval=1.0):
+        self.shards = [(threading.Lock(), defaultdict(int)) for _ in range(max(1, shards))]
+        self.flush_interval = flush_interval
+        self._inflight = defaultdict(int)  # ✅ 샤드에서 꺼냈지만 아직 DB에 쓰지 않은 증감값
+        self._inflight_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flusher = None
+        self._stop = threading.Event()
+
+    def _shard(self, key):
+        return self.shards[zlib.crc32(repr(key).encode()) % len(self.shards)]
+
+    def add(self, model, field, pk, delta):
+        """ ✅ 증감값 누적 (DB 쓰기 없음) """
+        key = (model._meta.label, field, pk)
+        lock, deltas = self._shard(key)
+        with lock:
+            deltas[key] += delta
+            if deltas[key] == 0:
+                del deltas[key]
+        self._ensure_flusher()
+
+    def pending(self, model, field, pk):
+        """ ✅ 아직 DB에 반영되지 않은 증감값 """
+        key = (model._meta.label, field, pk)
+        lock, deltas = self._shard(key)
+        with lock:
+            delta = deltas.get(key, 0)
+        with self._inflight_lock:
+            return delta + self._inflight.get(key, 0)
+
+    def _drain(self):
+        drained = defaultdict(int)
+        for lock, deltas in self.shards:
+            with lock:
+                for key, delta in deltas.items():
+                    drained[key] += delta
+                deltas.clear()
+        with self._inflight_lock:
+            for key, delta in drained.items():
+                self._inflight[key] += delta
+        return drained
+
+    def flush(self):
+        """
+        ✅ 누적된 증감값을 DB에 반영
+        - 같은 (모델, 필드, 증감값)끼리 묶어 pk__in UPDATE 한 번으로 처리
+        - 0 미만으로 내려가지 않도록 GREATEST(값 + delta, 0) 사용
+        """
+        with self._flush_lock:
+            drained = self._drain()
+            if not drained:
+                return 0
+
+            grouped = defaultdict(list)
+            for (label, field, pk), delta in drained.items():
+                if delta:
+                    grouped[(label, field, delta)].append(pk)
+
+            try:
+                with transaction.atomic():
+                    for (label, field, delta), pks in grouped.items():
+                        model = apps.get_model(label)
+                        model.objects.filter(pk__in=pks).update(
+                            **{field: Greatest(F(field) + delta, Value(0))}
+                        )
+            except Exception:
+                # ✅ 실패한 증감값은 버리지 않고 다음 flush에서 다시 시도
+                logger.exception("like counter flush failed")
+                for (label, field, pk), delta in drained.items():
+                    key = (label, field, pk)
+                    lock, deltas = self._shard(key)
+                    with lock:
+                        deltas[key] += delta
+                raise
+            finally:
+                with self._inflight_lock:
+                    for key, delta in drained.items():
+                        self._inflight[key] -= delta
+                        if self._inflight[key] == 0:
+                            del self._inflight[key]
+            return len(drained)
+
+    def _ensure_flusher(self):
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        with self._flush_lock:
+            if self._flusher is not None and self._flusher.is_alive():
+                return
+            self._stop.clear()
+            self._flusher = threading.Thread(target=self._run, name="like-counter-flusher", daemon=True)
+            self._flusher.start()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                pass  # ✅ 이미 로그를 남겼고, 증감값은 다음 주기에 다시 반영
+            finally:
+                close_old_connections()
+
+    def stop(self):
+        """ ✅ 백그라운드 스레드를 멈추고 남은 증감값을 모두 반영 """
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+
+
+def _buffer_settings():
+    return getattr(settings, "LIKE_COUNTER_BUFFER", {})
+
+
+like_counter = BufferedCounter(
+    shards=_buffer_settings().get("SHARDS", 16),
+    flush_interval=_buffer_settings().get("FLUSH_INTERVAL", 1.0),
+)
+atexit.register(like_counter.flush)
+
+
+def is_buffer_enabled():
+    return _buffer_settings().get("ENABLED", False)
+
+
+def increment_like_count(instance, delta, counter=None):
+    """
+    ✅ Post / Comment의 like_count 증감
+    - 버퍼 사용 시: 커밋 이후 샤드 카운터(기본값 like_counter)에 누적 (DB 행 잠금 없음)
+    - 버퍼 미사용 시: F() 표현식으로 즉시 원자적 UPDATE
+    """
+    model = type(instance)
+    if is_buffer_enabled():
+        counter = counter or like_counter
+        transaction.on_commit(lambda: counter.add(model, "like_count", instance.pk, delta))
+        return
+
+    rows = model.objects.filter(pk=instance.pk)
+    if delta < 0:
+        rows = rows.filter(like_count__gte=-delta)  # ✅ 0 미만 방지
+    rows.update(like_count=F("like_count") + delta)
+
+
+def get_like_count(instance, refresh=False, counter=None):
+    """ ✅ DB에 저장된 like_count + 아직 반영되지 않은 증감값 """
+    model = type(instance)
+    like_count = instance.like_count
+    if refresh:
+        like_count = model.objects.filter(pk=instance.pk).values_list("like_count", flat=True).get()
+    if is_buffer_enabled():
+        like_count = max(0, like_count + (counter or like_counter).pending(model, "like_count", instance.pk))
+    return like_count
@@ -0,0 +1,64 @@
+import threading
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models import Count
+
+from main.models.post import Post, PostImage
+from main.utils.image_pipeline import enqueue_release
+from main.utils.post_counts import adjust_post_counts
+
+# ✅ 게시물 삭제 중인 post id (스레드별) - CASCADE로 지워지는 댓글/하트/이미지의 행 단위 signal 처리를 건너뜀
+_local = threading.local()
+
+
+def _deleting():
+    if not hasattr(_local, 'post_ids'):
+        _local.post_ids = set()
+    return _local.post_ids
+
+
+@contextmanager
+def post_cascade(post_ids):
+    """
+    ✅ 게시물 CASCADE 삭제 구간
+    - 댓글 수 감소, 사진 설명 색인 갱신, 응답 캐시 무효화 등 게시물 단위 signal을 행마다 실행하지 않음
+      (게시물 자체가 사라지므로 결과가 버려지고, 행 수만큼 쿼리가 나감)
+    - 스레드 로컬이라 다른 요청의 삭제/저장에는 영향 없음
+    """
+    post_ids = set(post_ids) - _deleting()
+    _deleting().update(post_ids)
+    try:
+        yield
+    finally:
+        _deleting().difference_update(post_ids)
+
+
+def in_post_cascade(post_id):
+    """ ✅ post_id 게시물이 삭제 중인지 (signal 수신부에서 확인) """
+    return post_id in _deleting()
+
+
+def delete_posts(queryset):
+    """
+    ✅ 게시물 일괄 삭제
+    - 이미지 경로/변형은 쿼리 한 번으로 모아두고, 파일 삭제는 커밋 후 워커에서 처리 (참조가 남은 파일은 유지)
+    - CASCADE 되는 댓글/하트/이미지의 행 단위 signal은 post_cascade로 건너뜀
+    - 게시물 수 카운터는 (작성자, 공개 범위, 상태)별로 묶어서 한 번에 차감
+    - 반환값: 삭제한 게시물 수
+    """
+    post_ids = list(queryset.values_list('id', flat=True))
+    if not post_ids:
+        return 0
+
+    images = list(PostImage.objects.filter(post_id__in=post_ids).values_list('image', 'variants'))
+    groups = (
+        Post.objects.filter(pk__in=post_ids).order_by()
+        .values_list('user_id', 'visibility', 'status').annotate(total=Count('id'))
+    )
+    with transaction.atomic(), post_cascade(post_ids):
+        counts = {(user_id, visibility, post_status): -total for user_id, visibility, post_status, total in groups}
+        _, deleted = Post.objects.filter(pk__in=post_ids).delete()
+        adjust_post_counts(counts)
+        enqueue_release(images)
+    return deleted.get(Post._meta.label, 0)
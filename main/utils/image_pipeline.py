@@ -0,0 +1,345 @@
+import base64
+import binascii
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files import File
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from main.models.post import PostImage
+from main.utils.image_variants import generate_variants
+from main.utils.media_store import release_blobs, save_blob
+from main.utils.response_cache import bump_response_version
+
+try:
+    import pillow_heif  # HEIC 지원을 위한 라이브러리 (Image.open으로 HEIC 열기)
+    pillow_heif.register_heif_opener()
+except ImportError:
+    pillow_heif = None
+
+logger = logging.getLogger(__name__)
+
+SPOOL_CHUNK_SIZE = 64 * 1024
+BASE64_CHUNK_SIZE = 4 * 16 * 1024  # ✅ 4의 배수로 잘라야 조각별 디코딩 가능
+EXIF_ORIENTATION = 0x0112
+CONVERT_TO_JPEG = {'HEIF'}
+DECODED_BYTES_PER_PIXEL = 4  # ✅ 디코딩된 RGBA 한 픽셀 (메모리 예산 계산용)
+
+_executor = None
+_converter = None
+_executor_lock = threading.Lock()
+
+
+def pipeline_settings():
+    """ ✅ IMAGE_PIPELINE 설정 (없는 키는 기본값) """
+    return {
+        'ASYNC': True,
+        'WORKERS': 2,
+        'MAX_DIMENSION': 2560,
+        'SPOOL_DIR': None,
+        'CONVERT_WORKERS': 1,
+        'CONVERT_MEMORY_MB': 256,
+        'CONVERT_TIMEOUT': 30,
+        **getattr(settings, 'IMAGE_PIPELINE', {}),
+    }
+
+
+def _get_executor():
+    """ ✅ 이미지 처리 워커 풀 (첫 작업 제출 시 생성) """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, pipeline_settings()['WORKERS']),
+                thread_name_prefix='image-pipeline',
+            )
+        return _executor
+
+
+def _get_converter():
+    """ ✅ HEIC 등 요청 안에서 끝내야 하는 변환 전용 워커 풀 (동시에 전체 해상도로 디코딩하는 수 제한) """
+    global _converter
+    with _executor_lock:
+        if _converter is None:
+            _converter = ThreadPoolExecutor(
+                max_workers=max(1, pipeline_settings()['CONVERT_WORKERS']),
+                thread_name_prefix='image-convert',
+            )
+        return _converter
+
+
+class MemoryBudget:
+    """
+    ✅ 전체 해상도 디코딩에 쓰는 메모리 예산 (바이트)
+    - 예약한 양의 합이 상한을 넘지 않도록 대기시킴 → 큰 사진이 동시에 몰려도 RSS가 상한 근처에서 멈춤
+    - 한 장이 상한보다 크면 상한만큼 예약 (혼자서만 디코딩)
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.reserved = 0
+        self._condition = threading.Condition()
+
+    def reserve(self, amount, timeout=None):
+        amount = min(amount, self.capacity)
+        with self._condition:
+            if not self._condition.wait_for(lambda: self.reserved + amount <= self.capacity, timeout):
+                raise TimeoutError("이미지 변환 대기 시간 초과")
+            self.reserved += amount
+        return amount
+
+    def release(self, amount):
+        with self._condition:
+            self.reserved -= amount
+            self._condition.notify_all()
+
+
+decode_budget = MemoryBudget(pipeline_settings()['CONVERT_MEMORY_MB'] * 1024 * 1024)
+
+
+def decoded_size(width, height):
+    return width * height * DECODED_BYTES_PER_PIXEL
+
+
+def probe_image(file):
+    """
+    ✅ 헤더만 읽어 (형식, 가로, 세로) 반환 - 픽셀 데이터는 디코딩하지 않음
+    - 읽은 뒤 파일 위치를 되돌려 이후 저장에 영향 없음
+    """
+    position = file.tell()
+    try:
+        with Image.open(file) as image:
+            return image.format, image.width, image.height
+    finally:
+        file.seek(position)
+
+
+def _convert_to_jpeg(uploaded_file, size):
+    """ ✅ 변환 워커에서 실행: 디코딩 결과를 메모리 버퍼 대신 임시 파일로 바로 인코딩 """
+    reserved = decode_budget.reserve(size)
+    try:
+        uploaded_file.seek(0)
+        with Image.open(uploaded_file) as source:
+            image = source if source.mode == 'RGB' else source.convert('RGB')
+            name = os.path.splitext(uploaded_file.name)[0] + '.jpg'
+            converted = TemporaryUploadedFile(name, 'image/jpeg', 0, None)
+            image.save(converted, format='JPEG', quality=90)
+        converted.size = converted.tell()
+        converted.seek(0)
+        return converted
+    finally:
+        decode_budget.release(reserved)
+
+
+def convert_to_jpeg(uploaded_file, width, height):
+    """
+    ✅ HEIC 등 브라우저가 표시하지 못하는 형식을 JPEG 업로드 파일로 변환
+    - 변환 워커 수(CONVERT_WORKERS)와 디코딩 메모리 예산(CONVERT_MEMORY_MB)으로 동시 변환량 제한
+    - CONVERT_TIMEOUT 안에 끝나지 않으면 TimeoutError
+    """
+    config = pipeline_settings()
+    future = _get_converter().submit(_convert_to_jpeg, uploaded_file, decoded_size(width, height))
+    return future.result(timeout=config['CONVERT_TIMEOUT'])
+
+
+def _spool_file():
+    spool_dir = pipeline_settings()['SPOOL_DIR']
+    if spool_dir:
+        os.makedirs(spool_dir, exist_ok=True)
+    return tempfile.NamedTemporaryFile(prefix='upload-', dir=spool_dir, delete=False)
+
+
+def spool_upload(uploaded_file):
+    """
+    ✅ 업로드 파일을 조각 단위로 임시 파일에 기록 (메모리에 통째로 올리지 않음)
+    - 요청이 끝나면 Django의 업로드 임시 파일은 지워지므로 워커가 읽을 별도 사본을 만듦
+    """
+    with _spool_file() as spool:
+        for chunk in uploaded_file.chunks(SPOOL_CHUNK_SIZE):
+            spool.write(chunk)
+    return spool.name
+
+
+def spool_base64(data):
+    """ ✅ Base64 문자열을 조각 단위로 디코딩해 임시 파일에 기록 (형식 오류면 ValueError) """
+    try:
+        with _spool_file() as spool:
+            for start in range(0, len(data), BASE64_CHUNK_SIZE):
+                spool.write(base64.b64decode(data[start:start + BASE64_CHUNK_SIZE], validate=True))
+    except binascii.Error as e:
+        os.remove(spool.name)
+        raise ValueError(f"Base64 디코딩 실패: {e}")
+    return spool.name
+
+
+def upload_digest(uploaded_file):
+    """ ✅ 업로드 파일 내용의 SHA-256 (조각 단위로 읽고 파일 위치는 처음으로 되돌림) """
+    digest = hashlib.sha256()
+    for chunk in uploaded_file.chunks(SPOOL_CHUNK_SIZE):
+        digest.update(chunk)
+    uploaded_file.seek(0)
+    return digest.hexdigest()
+
+
+def base64_digest(data):
+    """ ✅ Base64 문자열을 조각 단위로 디코딩한 내용의 SHA-256 (형식 오류면 ValueError) """
+    digest = hashlib.sha256()
+    try:
+        for start in range(0, len(data), BASE64_CHUNK_SIZE):
+            digest.update(base64.b64decode(data[start:start + BASE64_CHUNK_SIZE], validate=True))
+    except binascii.Error as e:
+        raise ValueError(f"Base64 디코딩 실패: {e}")
+    return digest.hexdigest()
+
+
+def _decode_and_store(image_id, name, spool_path):
+    """ ✅ 디코딩 → EXIF 회전 보정 → 최대 크기로 축소 → 내용 주소 경로에 저장 → thumb/medium 변형 생성 """
+    max_dimension = pipeline_settings()['MAX_DIMENSION']
+    with Image.open(spool_path) as source:
+        reserved = decode_budget.reserve(decoded_size(*source.size))
+        try:
+            source.load()  # ✅ 잘린 파일 등 디코딩 오류는 여기서 확인
+            rotated = source.getexif().get(EXIF_ORIENTATION, 1) != 1
+            oversized = max(source.size) > max_dimension
+            if source.format in CONVERT_TO_JPEG:
+                # ✅ 브라우저가 표시하지 못하는 형식(HEIC)은 JPEG으로 변환
+                image = ImageOps.exif_transpose(source).convert('RGB')
+                image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+                image.save(spool_path, format='JPEG', quality=90)
+            # ✅ 움직이는 GIF/WebP는 프레임이 사라지지 않도록 원본 그대로 저장
+            elif (rotated or oversized) and not getattr(source, 'is_animated', False):
+                image = ImageOps.exif_transpose(source)
+                image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+                image.save(spool_path, format=source.format)
+        finally:
+            decode_budget.release(reserved)
+
+    with open(spool_path, 'rb') as f:
+        saved_name = save_blob(name, File(f))
+    try:
+        variants = generate_variants(spool_path, saved_name)
+    except Exception:
+        logger.exception("변형 이미지 생성 실패 (PostImage %s) - 원본으로 대체", image_id)
+        variants = {}
+    return saved_name, variants
+
+
+def process_image(image_id, name, spool_path):
+    """
+    ✅ 워커에서 실행: 업로드 이미지를 처리해 최종 경로(내용 주소)에 저장
+    - 같은 경로를 다른 이미지가 이미 처리했으면 디코딩/저장 없이 그 결과(변형 포함)를 재사용
+    - 재사용한 파일이 그 사이 정리됐으면(마지막 참조 행 삭제) 임시 파일로 다시 저장
+    - 성공하면 status=ready, 디코딩/저장 실패 시 status=failed
+    """
+    try:
+        processed = PostImage.objects.filter(image=name, status=PostImage.STATUS_READY) \
+            .exclude(pk=image_id).values_list('variants', flat=True).first()
+        reused = processed is not None and default_storage.exists(name)
+        if reused:
+            saved_name, variants = name, processed
+        else:
+            saved_name, variants = _decode_and_store(image_id, name, spool_path)
+
+        PostImage.objects.filter(pk=image_id).update(
+            image=saved_name, variants=variants, status=PostImage.STATUS_READY
+        )
+        # ✅ 확인과 UPDATE 사이에 공유 파일이 정리됐으면 (이제 이 행이 참조하므로 다시 지워지지 않음) 다시 저장
+        if reused and not default_storage.exists(saved_name):
+            saved_name, variants = _decode_and_store(image_id, name, spool_path)
+            PostImage.objects.filter(pk=image_id).update(image=saved_name, variants=variants)
+    except Exception:
+        logger.exception("이미지 처리 실패 (PostImage %s)", image_id)
+        PostImage.objects.filter(pk=image_id).update(status=PostImage.STATUS_FAILED)
+    finally:
+        if os.path.exists(spool_path):
+            os.remove(spool_path)
+
+    # ✅ UPDATE는 signal이 없으므로 게시물 주인의 응답 캐시를 직접 무효화
+    bump_response_version(PostImage.objects.filter(pk=image_id).values_list('post__user_id', flat=True).first())
+
+
+def process_field_variants(model_label, pk, field, variants_field):
+    """
+    ✅ 워커에서 실행: 이미 저장된 이미지 필드(프로필 사진 등)의 변형 생성
+    - 그 사이 사진이 다시 바뀌었으면 만든 변형은 버림 (원본 경로 조건부 UPDATE)
+    """
+    model = apps.get_model(model_label)
+    instance = model.objects.filter(pk=pk).only(field).first()
+    field_file = getattr(instance, field, None)
+    if not field_file:
+        return
+    try:
+        with field_file.open('rb') as f:
+            variants = generate_variants(f, field_file.name, storage=field_file.storage)
+    except Exception:
+        logger.exception("변형 이미지 생성 실패 (%s %s.%s)", model_label, pk, field)
+        return
+
+    changes = {variants_field: variants}
+    if any(f.name == 'updated_at' for f in model._meta.concrete_fields):
+        changes['updated_at'] = timezone.now()  # ✅ 응답이 바뀌므로 조건부 GET 기준 시각도 갱신
+    updated = model.objects.filter(pk=pk, **{field: field_file.name}).update(**changes)
+    if not updated:
+        release_blobs([(field_file.name, variants)], storage=field_file.storage)
+    else:
+        bump_response_version(getattr(instance, 'user_id', None))  # ✅ 프로필 사진 변형 → 블로그 응답 캐시 무효화
+
+
+def _run_in_worker(func, args):
+    """ ✅ 워커 스레드 전용 DB 연결이 오래 열려 있지 않도록 작업 전후로 정리 """
+    close_old_connections()
+    try:
+        func(*args)
+    finally:
+        close_old_connections()
+
+
+def _dispatch(func, jobs):
+    """
+    ✅ 작업을 워커 풀에 제출
+    - 트랜잭션 커밋 후에 제출해 워커가 방금 저장한 행을 볼 수 있도록 함
+    - ASYNC=False(테스트 등)면 요청 스레드에서 바로 처리
+    """
+    if not jobs:
+        return
+    if not pipeline_settings()['ASYNC']:
+        for job in jobs:
+            func(*job)
+        return
+
+    def submit():
+        executor = _get_executor()
+        for job in jobs:
+            executor.submit(_run_in_worker, func, job)
+
+    transaction.on_commit(submit)
+
+
+def enqueue_images(jobs):
+    """ ✅ 업로드 이미지 처리 작업 (image_id, 최종 경로, 임시 파일) 제출 """
+    _dispatch(process_image, jobs)
+
+
+def enqueue_variants(instance, field, variants_field):
+    """ ✅ 저장된 이미지 필드의 변형 생성 작업 제출 """
+    _dispatch(process_field_variants, [(instance._meta.label, instance.pk, field, variants_field)])
+
+
+def enqueue_release(entries):
+    """
+    ✅ 참조가 끊긴 원본/변형 파일 정리를 커밋 후 워커에 예약 (요청은 파일 삭제를 기다리지 않음)
+    - ASYNC=False여도 커밋 후에 삭제 (롤백되면 행이 예전 파일을 계속 가리키므로)
+    """
+    if entries:
+        entries = list(entries)
+        transaction.on_commit(lambda: _dispatch(release_blobs, [(entries,)]))
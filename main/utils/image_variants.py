@@ -0,0 +1,88 @@
+import io
+import os
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+from main.utils.media_store import save_blob
+
+# ✅ 변형 이미지 크기 (긴 변 기준 픽셀) - 큰 것부터 만들고 작은 것은 앞 결과를 다시 줄여 계산량 절약
+VARIANT_SIZES = {
+    'medium': 1024,
+    'thumb': 320,
+}
+WEBP_QUALITY = 80
+JPEG_QUALITY = 85
+
+
+def variant_name(name, key, ext):
+    """ ✅ 원본 옆에 저장할 변형 파일 경로 (post_pics/1/abc.jpg → post_pics/1/abc_thumb.jpg) """
+    root, _ = os.path.splitext(name)
+    return f"{root}_{key}.{ext}"
+
+
+def _encode(image, image_format, **options):
+    buffer = io.BytesIO()
+    image.save(buffer, format=image_format, **options)
+    return ContentFile(buffer.getvalue())
+
+
+def generate_variants(source, name, storage=default_storage):
+    """
+    ✅ 원본 이미지(파일 경로 또는 파일 객체)로 thumb / medium 변형과 각각의 WebP 사본을 만들어 저장
+    - 경로는 원본 경로에서 정해지므로 같은 원본의 변형이 이미 있으면 다시 쓰지 않음
+    - 알파 채널이 있으면 PNG, 없으면 JPEG (움직이는 GIF는 첫 프레임)
+    - 반환값: {'thumb': 경로, 'thumb_webp': 경로, 'medium': 경로, 'medium_webp': 경로}
+    """
+    variants = {}
+    with Image.open(source) as original:
+        largest = max(VARIANT_SIZES.values())
+        original.draft('RGB', (largest, largest))  # ✅ JPEG는 필요한 해상도로만 디코딩
+        image = ImageOps.exif_transpose(original)
+
+        has_alpha = image.mode in ('RGBA', 'LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info)
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+        ext, image_format, options = ('png', 'PNG', {'optimize': True}) if has_alpha \
+            else ('jpg', 'JPEG', {'quality': JPEG_QUALITY, 'optimize': True})
+
+        for key, size in sorted(VARIANT_SIZES.items(), key=lambda item: -item[1]):
+            image.thumbnail((size, size), Image.LANCZOS)
+            variants[key] = save_blob(variant_name(name, key, ext), _encode(image, image_format, **options), storage)
+            variants[f"{key}_webp"] = save_blob(
+                variant_name(name, key, 'webp'), _encode(image, 'WEBP', quality=WEBP_QUALITY), storage
+            )
+    return variants
+
+
+def delete_variants(variants, storage=default_storage):
+    """ ✅ 변형 파일 삭제 (원본 교체/삭제 시) """
+    for path in (variants or {}).values():
+        if path and storage.exists(path):
+            storage.delete(path)
+
+
+def variant_urls(field_file, variants, request=None):
+    """
+    ✅ 변형 이미지 URL 목록 (아직 만들지 못한 변형은 원본 URL로 대체)
+    - request가 있으면 절대 URL
+    """
+    if not field_file:
+        return None
+    original = field_file.url
+    urls = {'original': original}
+    for key in VARIANT_SIZES:
+        for variant_key in (key, f"{key}_webp"):
+            path = (variants or {}).get(variant_key)
+            urls[variant_key] = field_file.storage.url(path) if path else original
+    if request:
+        urls = {key: request.build_absolute_uri(url) for key, url in urls.items()}
+    return urls
+
+
+def thumbnail_url(field_file, variants):
+    """ ✅ 목록/카드용 썸네일 URL (변형이 없으면 원본) """
+    if not field_file:
+        return None
+    path = (variants or {}).get('thumb')
+    return field_file.storage.url(path) if path else field_file.url
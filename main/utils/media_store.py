@@ -0,0 +1,104 @@
+import hashlib
+import os
+
+from django.core.files.storage import default_storage
+from django.db.models import Q
+
+from main.models.post import PostImage
+from main.models.profile import Profile
+
+# ✅ 내용 주소(content-addressed) 미디어 저장소
+# - 파일 경로: {prefix}/{해시 앞 2자}/{다음 2자}/{SHA-256}.{확장자} → 같은 이미지는 한 번만 저장
+# - 변형(thumb/medium)은 원본 경로에서 이름을 만들므로 같은 원본을 쓰는 행끼리 공유
+# - 참조 수는 별도 카운터 없이 원본 경로를 가진 PostImage / Profile 행 수로 계산 (카운터가 어긋날 일이 없음)
+MEDIA_PREFIXES = ('post_pics', 'blog_pics', 'user_pics')
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+def blob_name(prefix, digest, ext):
+    """ ✅ 해시로 정한 저장 경로 (디렉터리당 파일 수를 줄이기 위해 두 단계로 나눔) """
+    return f"{prefix}/{digest[:2]}/{digest[2:4]}/{digest}.{ext.lower().lstrip('.')}"
+
+
+def file_digest(file):
+    """ ✅ 파일 내용의 SHA-256 (조각 단위로 읽고 파일 위치는 처음으로 되돌림) """
+    digest = hashlib.sha256()
+    file.seek(0)
+    for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def save_blob(name, content, storage=default_storage):
+    """
+    ✅ 내용 주소 경로에 저장 (이미 있으면 쓰지 않음)
+    - 동시에 같은 파일을 저장해 storage가 다른 이름을 붙였으면 그 사본은 지우고 원래 경로 반환
+    """
+    if storage.exists(name):
+        return name
+    saved_name = storage.save(name, content)
+    if saved_name != name:
+        storage.delete(saved_name)
+    return name
+
+
+def referenced_names(names):
+    """ ✅ 주어진 원본 경로 중 아직 PostImage / Profile 행이 참조하는 경로 """
+    names = [name for name in names if name]
+    if not names:
+        return set()
+    referenced = set(PostImage.objects.filter(image__in=names).values_list('image', flat=True))
+    for blog_pic, user_pic in Profile.objects.filter(Q(blog_pic__in=names) | Q(user_pic__in=names)) \
+            .values_list('blog_pic', 'user_pic'):
+        referenced.update({blog_pic, user_pic})
+    return referenced
+
+
+def release_blobs(entries, storage=default_storage):
+    """
+    ✅ 참조를 끊은 원본과 변형 파일 정리 - 행을 삭제/변경한 뒤 호출
+    - entries: [(원본 경로, 변형 dict), ...]
+    - 다른 행이 같은 원본을 참조하면 남겨둠 (기본 이미지는 항상 유지)
+    """
+    from main.utils.image_variants import delete_variants  # ✅ image_variants가 save_blob을 가져다 쓰므로 지연 import
+
+    entries = [(name, variants) for name, variants in entries if name]
+    defaults = set(Profile.DEFAULT_PICS.values())
+    referenced = referenced_names([name for name, _ in entries]) | defaults
+    released = set()
+    for name, variants in entries:
+        if name in referenced or name in released:
+            continue
+        if storage.exists(name):
+            storage.delete(name)
+        delete_variants(variants, storage=storage)
+        released.add(name)
+    return released
+
+
+def all_referenced_files():
+    """ ✅ DB가 참조하는 모든 미디어 경로 (원본 + 변형) - 가비지 컬렉션용 """
+    names = set(Profile.DEFAULT_PICS.values())
+    for image, variants in PostImage.objects.values_list('image', 'variants').iterator():
+        names.add(image)
+        names.update((variants or {}).values())
+    rows = Profile.objects.values_list('blog_pic', 'user_pic', 'blog_pic_variants', 'user_pic_variants')
+    for blog_pic, user_pic, blog_variants, user_variants in rows.iterator():
+        names.update({blog_pic, user_pic})
+        names.update((blog_variants or {}).values())
+        names.update((user_variants or {}).values())
+    names.discard(None)
+    names.discard('')
+    return names
+
+
+def walk_files(prefix, storage=default_storage):
+    """ ✅ storage 안의 prefix 아래 모든 파일 경로 """
+    if not storage.exists(prefix):
+        return
+    directories, files = storage.listdir(prefix)
+    for file_name in files:
+        yield f"{prefix}/{file_name}"
+    for directory in directories:
+        yield from walk_files(os.path.join(prefix, directory).replace(os.sep, '/'), storage)
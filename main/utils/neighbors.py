@@ -0,0 +1,70 @@
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache
+from django.db.models import Q
+
+from main.models.neighbor import Neighbor
+
+# ✅ 서로이웃 id 집합 캐시 (Neighbor 저장/삭제, 서로이웃 수락 시 무효화)
+# - 서로이웃 공개 글/댓글/하트 권한 판단에 쓰이므로, 무효화가 모든 워커에 닿지 않는
+#   프로세스별 캐시(LocMem)에서는 몇 초만 유지 (관계를 끊은 뒤에도 다른 워커에서 접근이 허용되지 않게)
+NEIGHBOR_CACHE_TIMEOUT = 60 * 60
+NEIGHBOR_LOCAL_CACHE_TIMEOUT = 5
+NEIGHBOR_CACHE_KEY = "neighbors:{user_id}"
+LOCAL_CACHE_BACKENDS = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
+
+
+def neighbor_cache_timeout():
+    """ ✅ 공유 캐시(Redis 등)면 1시간, 프로세스별 캐시면 몇 초 """
+    backend = settings.CACHES.get(DEFAULT_CACHE_ALIAS, {}).get('BACKEND')
+    return NEIGHBOR_LOCAL_CACHE_TIMEOUT if backend in LOCAL_CACHE_BACKENDS else NEIGHBOR_CACHE_TIMEOUT
+
+
+def _user_id(user):
+    """ ✅ CustomUser 객체 / id 문자열 모두 허용 (비로그인 사용자는 None) """
+    if user is None:
+        return None
+    if isinstance(user, str):
+        return user
+    if not getattr(user, "is_authenticated", True):
+        return None
+    return user.pk
+
+
+def neighbors_of(user):
+    """
+    ✅ 사용자의 서로이웃(accepted) user id 집합 반환
+    - Neighbor 요청은 방향(A → B)이 있으므로 양쪽 방향을 한 번에 조회해 합침
+    - 결과는 캐시에 저장되어 같은 사용자에 대한 이후 요청은 쿼리 없이 응답
+    """
+    user_id = _user_id(user)
+    if user_id is None:
+        return frozenset()
+
+    key = NEIGHBOR_CACHE_KEY.format(user_id=user_id)
+    neighbor_ids = cache.get(key)
+    if neighbor_ids is None:
+        rows = Neighbor.objects.filter(
+            Q(from_user_id=user_id) | Q(to_user_id=user_id),
+            status="accepted"
+        ).values_list("from_user_id", "to_user_id")
+        neighbor_ids = frozenset(uid for pair in rows for uid in pair) - {user_id}
+        cache.set(key, neighbor_ids, neighbor_cache_timeout())
+    return neighbor_ids
+
+
+def is_mutual(user_a, user_b):
+    """ ✅ 두 사용자가 서로이웃인지 확인 (본인 / 비로그인은 False) """
+    a_id, b_id = _user_id(user_a), _user_id(user_b)
+    if a_id is None or b_id is None or a_id == b_id:
+        return False
+    return b_id in neighbors_of(a_id)
+
+
+def invalidate_neighbors(*users):
+    """ ✅ 서로이웃 관계가 바뀐 사용자들의 캐시 삭제 """
+    keys = [NEIGHBOR_CACHE_KEY.format(user_id=_user_id(user)) for user in users if _user_id(user) is not None]
+    if keys:
+        cache.delete_many(keys)
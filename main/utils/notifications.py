@@ -0,0 +1,37 @@
+from main.models.comment import Comment
+from main.models.notification import Notification
+
+
+def notifications_for_comment(comment, post_owner_id, actor_id):
+    """
+    ✅ 새 댓글/대댓글에 대한 알림 목록 (저장 전)
+    - 게시글 작성자에게 post_comment (본인이 쓴 댓글 제외)
+    - 부모 댓글 작성자에게 comment_reply (본인 / 이미 post_comment를 받는 게시글 작성자 제외)
+    """
+    notifications = []
+    if post_owner_id != actor_id:
+        notifications.append(Notification(
+            recipient_id=post_owner_id, actor_id=actor_id, type='post_comment',
+            post_id=comment.post_id, comment=comment, created_at=comment.created_at,
+        ))
+
+    if comment.parent_id:
+        parent_author_id = (
+            Comment.objects.filter(pk=comment.parent_id).values_list('author__user_id', flat=True).first()
+        )
+        if parent_author_id and parent_author_id not in (actor_id, post_owner_id):
+            notifications.append(Notification(
+                recipient_id=parent_author_id, actor_id=actor_id, type='comment_reply',
+                post_id=comment.post_id, comment=comment, created_at=comment.created_at,
+            ))
+    return notifications
+
+
+def notifications_for_heart(heart, post_owner_id):
+    """ ✅ 새 하트에 대한 알림 (게시글 작성자 본인이 누른 하트는 제외) """
+    if post_owner_id == heart.user_id:
+        return []
+    return [Notification(
+        recipient_id=post_owner_id, actor_id=heart.user_id, type='post_like',
+        post_id=heart.post_id, heart=heart, created_at=heart.created_at,
+    )]
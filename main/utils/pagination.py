@@ -0,0 +1,126 @@
+import base64
+import json
+from datetime import datetime
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+
+
+class KeysetPagination(BasePagination):
+    """
+    ✅ (created_at, id) 키셋 기반 커서 페이지네이션
+    - `cursor` 또는 `page_size` 쿼리 파라미터가 있을 때만 동작 (없으면 기존처럼 전체 목록 반환)
+    - OFFSET 없이 마지막 행의 정렬 키 이후부터 page_size + 1개만 조회
+    - 응답: {"results": [...], "next_cursor": "...", "has_more": true/false}
+    """
+    ordering = ('-created_at', '-id')
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 20
+    max_page_size = 100
+
+    def is_requested(self, request):
+        """ ✅ 클라이언트가 페이지네이션 모드를 요청했는지 확인 """
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def get_page_size(self, request):
+        raw = request.query_params.get(self.page_size_query_param)
+        if raw is None:
+            return self.page_size
+        try:
+            page_size = int(raw)
+            if page_size < 1:
+                raise ValueError
+        except ValueError:
+            raise ValidationError(f"{self.page_size_query_param}는 1 이상의 정수여야 합니다.")
+        return min(page_size, self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.page_size = self.get_page_size(request)
+        cursor = request.query_params.get(self.cursor_query_param)
+
+        queryset = self.seek(queryset, cursor)
+        rows = list(queryset[:self.page_size + 1])  # ✅ 한 개 더 가져와서 다음 페이지 존재 여부 판단 (COUNT 없음)
+        self.has_more = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        self.next_cursor = self.encode_cursor(self.page[-1]) if self.has_more else None
+        return self.page
+
+    def seek(self, queryset, cursor):
+        """ ✅ 정렬 후 cursor(마지막으로 본 행의 정렬 키) 다음 행부터로 좁힘 - cursor가 없으면 정렬만 """
+        queryset = queryset.order_by(*self.ordering)
+        if not cursor:
+            return queryset
+        try:
+            return queryset.filter(self.build_keyset_filter(self.decode_cursor(cursor)))
+        except (DjangoValidationError, ValueError, TypeError):
+            raise ValidationError("유효하지 않은 cursor 값입니다.")
+
+    def get_paginated_response(self, data):
+        return Response({
+            "results": data,
+            "next_cursor": self.next_cursor,
+            "has_more": self.has_more,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'results': schema,
+                'next_cursor': {'type': 'string', 'nullable': True},
+                'has_more': {'type': 'boolean'},
+            },
+        }
+
+    def build_keyset_filter(self, values):
+        """
+        ✅ 정렬 키 튜플 비교를 Q 객체로 변환
+        예) ('-created_at', '-id') → created_at < c OR (created_at = c AND id < i)
+        """
+        if len(values) != len(self.ordering):
+            raise ValidationError("유효하지 않은 cursor 값입니다.")
+
+        keyset = Q()
+        for idx, field in enumerate(self.ordering):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition = Q(**{f"{name}__{lookup}": values[idx]})
+            for prev_idx in range(idx):
+                prev_name = self.ordering[prev_idx].lstrip('-')
+                condition &= Q(**{prev_name: values[prev_idx]})
+            keyset |= condition
+        return keyset
+
+    def encode_cursor(self, obj):
+        values = []
+        for field in self.ordering:
+            value = getattr(obj, field.lstrip('-'))
+            values.append(value.isoformat() if isinstance(value, datetime) else value)
+        raw = json.dumps(values, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        except (ValueError, TypeError):
+            raise ValidationError("유효하지 않은 cursor 값입니다.")
+        if not isinstance(values, list):
+            raise ValidationError("유효하지 않은 cursor 값입니다.")
+        return values
+
+
+class CommentThreadPagination(KeysetPagination):
+    """
+    ✅ 최상위 댓글 단위 키셋 페이지네이션 (작성순)
+    - 대댓글은 페이지에 포함된 최상위 댓글 아래에 모두 붙여서 반환
+    """
+    ordering = ('created_at', 'id')
@@ -0,0 +1,64 @@
+from collections import defaultdict
+
+from django.db.models import Case, Count, F, Q, Value, When
+
+from main.models.post import Post
+from main.models.postCount import PostCount
+
+# ✅ 조회자별로 보이는 공개 범위 (본인은 '나만 보기' 포함, 임시 저장 글은 누구에게도 세지 않음)
+VISIBLE_TO_OWNER = ('everyone', 'mutual', 'me')
+VISIBLE_TO_MUTUAL = ('everyone', 'mutual')
+VISIBLE_TO_PUBLIC = ('everyone',)
+
+
+def count_expressions():
+    """ ✅ 카운터 컬럼별 Count(filter=...) - 한 사용자의 게시물을 한 번의 집계로 계산 """
+    return {
+        column: Count('id', filter=Q(visibility=visibility, status=post_status))
+        for (visibility, post_status), column in PostCount.COLUMNS.items()
+    }
+
+
+def recount_posts(user_id):
+    """ ✅ 실제 게시물 수로 카운터 행을 다시 계산 (행이 없으면 생성) """
+    counts = Post.objects.filter(user_id=user_id).aggregate(**count_expressions())
+    post_counts, _ = PostCount.objects.update_or_create(user_id=user_id, defaults=counts)
+    return post_counts
+
+
+def get_post_counts(user_id):
+    """ ✅ 카운터 행 조회 (아직 없으면 한 번 집계해서 생성) """
+    post_counts = PostCount.objects.filter(user_id=user_id).first()
+    return post_counts or recount_posts(user_id)
+
+
+def _shifted(column, delta):
+    """ ✅ F(column) + delta (0 아래로 내려가지 않게 - MySQL UNSIGNED 뺄셈 오류 방지) """
+    if delta >= 0:
+        return F(column) + delta
+    return Case(When(**{f"{column}__gte": -delta}, then=F(column) + delta), default=Value(0))
+
+
+def adjust_post_counts(deltas):
+    """
+    ✅ 카운터 증감 - deltas: {(user_id, visibility, status): 증감값}
+    - 사용자마다 UPDATE 한 번 (여러 컬럼을 함께 변경)
+    - 선택지 밖의 (visibility, status)는 건너뜀
+    - 증가인데 카운터 행이 없으면 실제 게시물 수로 새로 만듦 (방금 저장한 글까지 포함)
+    """
+    by_user = defaultdict(lambda: defaultdict(int))
+    for (user_id, visibility, post_status), delta in deltas.items():
+        column = PostCount.COLUMNS.get((visibility, post_status))
+        if column is None:
+            continue  # ✅ 선택지 밖의 값은 세는 칸이 없음 (뷰에서 막지만 저장 자체는 실패시키지 않음)
+        by_user[user_id][column] += delta
+
+    for user_id, columns in by_user.items():
+        columns = {column: delta for column, delta in columns.items() if delta}
+        if not columns:
+            continue
+        updated = PostCount.objects.filter(user_id=user_id).update(
+            **{column: _shifted(column, delta) for column, delta in columns.items()}
+        )
+        if not updated and any(delta > 0 for delta in columns.values()):
+            recount_posts(user_id)
@@ -0,0 +1,148 @@
+import functools
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+_current_profile = ContextVar("request_profile", default=None)
+
+
+def profiling_settings():
+    """ ✅ REQUEST_PROFILING 설정 (없는 키는 기본값) """
+    return {
+        'ENABLED': True,
+        'SERVER_TIMING': True,
+        'WINDOW': 200,
+        'QUERY_BUDGET_STRICT': False,
+        **getattr(settings, 'REQUEST_PROFILING', {}),
+    }
+
+
+class QueryBudgetExceeded(Exception):
+    """ ✅ 뷰에 선언한 query_budget보다 많은 쿼리를 실행 (QUERY_BUDGET_STRICT일 때만 발생) """
+
+
+class RequestProfile:
+    """
+    ✅ 요청 하나의 DB / Serializer 측정값
+    - 쿼리 수·DB 시간은 connection.execute_wrapper로, Serializer 시간은 ProfiledSerializerMixin으로 누적
+    - serializer_queries: 직렬화 도중 실행된 쿼리 수 (0이 아니면 N+1 의심)
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_queries = 0
+        self._serializer_depth = 0
+        self._serializer_started = None
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.queries += 1
+            if self._serializer_depth:
+                self.serializer_queries += 1
+
+    @contextmanager
+    def serializing(self):
+        if self._serializer_depth == 0:
+            self._serializer_started = time.perf_counter()
+        self._serializer_depth += 1
+        try:
+            yield
+        finally:
+            self._serializer_depth -= 1
+            if self._serializer_depth == 0:
+                self.serializer_time += time.perf_counter() - self._serializer_started
+
+
+def current_profile():
+    return _current_profile.get()
+
+
+@contextmanager
+def profile_request():
+    profile = RequestProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+def _timed_representation(to_representation):
+    @functools.wraps(to_representation)
+    def wrapper(self, instance):
+        profile = _current_profile.get()
+        if profile is None:
+            return to_representation(self, instance)
+        with profile.serializing():
+            return to_representation(self, instance)
+    return wrapper
+
+
+class ProfiledSerializerMixin:
+    """
+    ✅ 직렬화 시간 / 직렬화 중 실행된 쿼리 수 측정용 Serializer 믹스인
+    - to_representation을 직접 구현한 하위 클래스(NewsSerializer 등)도 자동으로 감쌈
+    - 중첩 호출(대댓글 등)은 가장 바깥 호출 기준으로 한 번만 측정
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'to_representation' in cls.__dict__:
+            cls.to_representation = _timed_representation(cls.__dict__['to_representation'])
+
+    @_timed_representation
+    def to_representation(self, instance):
+        return super().to_representation(instance)
+
+
+class RollingStats:
+    """ ✅ 엔드포인트별 최근 N개 요청 측정값 (프로세스 메모리) """
+
+    def __init__(self):
+        self._samples = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, sample, window):
+        with self._lock:
+            samples = self._samples[endpoint]
+            samples.append(sample)
+            while len(samples) > window:
+                samples.popleft()
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self):
+        with self._lock:
+            snapshot = {endpoint: list(samples) for endpoint, samples in self._samples.items()}
+
+        result = {}
+        for endpoint, samples in sorted(snapshot.items()):
+            durations = sorted(s['total_ms'] for s in samples)
+            count = len(samples)
+            result[endpoint] = {
+                'count': count,
+                'p50_ms': round(durations[count // 2], 2),
+                'p95_ms': round(durations[min(count - 1, int(count * 0.95))], 2),
+                'avg_queries': round(sum(s['queries'] for s in samples) / count, 1),
+                'max_queries': max(s['queries'] for s in samples),
+                'max_serializer_queries': max(s['serializer_queries'] for s in samples),
+                'avg_db_ms': round(sum(s['db_ms'] for s in samples) / count, 2),
+                'avg_serializer_ms': round(sum(s['serializer_ms'] for s in samples) / count, 2),
+                'avg_bytes': round(sum(s['bytes'] for s in samples) / count),
+            }
+        return result
+
+
+request_stats = RollingStats()
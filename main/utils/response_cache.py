@@ -0,0 +1,79 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from main.utils.neighbors import is_mutual
+
+# ✅ 블로그 단위 응답 캐시 (프로필 / 카테고리 목록 / 서로이웃 목록 / 최신 글 5개)
+# - 키: (뷰, urlname, 블로그 버전, 조회자 구분, host, 쿼리 파라미터)
+# - 블로그 버전은 Profile / Category / Post / Neighbor 등이 바뀔 때 signal에서 올림 → 이전 키는 자연 만료
+RESPONSE_VERSION_KEY = "response_version:{user_id}"
+RESPONSE_CACHE_KEY = "response:{view}:{urlname}:{version}:{viewer}:{digest}"
+
+# ✅ 조회자 구분 (같은 구분이면 응답이 같음)
+VIEWER_OWNER = "owner"
+VIEWER_MUTUAL = "mutual"
+VIEWER_PUBLIC = "public"
+
+
+def response_cache_settings():
+    """ ✅ RESPONSE_CACHE 설정 (없는 키는 기본값) """
+    return {
+        'ENABLED': False,
+        'TIMEOUT': 60 * 10,
+        **getattr(settings, 'RESPONSE_CACHE', {}),
+    }
+
+
+def viewer_class(viewer, owner_id):
+    """ ✅ 블로그 주인 / 서로이웃 / 그 외(비로그인 포함) 구분 """
+    if getattr(viewer, "is_authenticated", False) and viewer.pk == owner_id:
+        return VIEWER_OWNER
+    return VIEWER_MUTUAL if is_mutual(viewer, owner_id) else VIEWER_PUBLIC
+
+
+def response_version(user_id):
+    """
+    ✅ 블로그의 현재 응답 버전
+    - 버전 키가 없으면(첫 조회, 캐시 축출) 현재 시각으로 시작 → 축출 전에 저장된 옛 응답 키와 겹치지 않음
+    """
+    key = RESPONSE_VERSION_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_response_version(*user_ids):
+    """ ✅ 블로그 내용이 바뀐 사용자들의 응답 버전 증가 (캐시된 응답 일괄 무효화) """
+    for user_id in set(filter(None, user_ids)):
+        key = RESPONSE_VERSION_KEY.format(user_id=user_id)
+        try:
+            cache.incr(key)
+        except ValueError:  # ✅ 버전 키가 없으면 새로 시작
+            cache.set(key, time.time_ns(), None)
+
+
+def cached_response_data(request, view_name, profile, build, viewer=None):
+    """
+    ✅ build()로 만든 응답 데이터를 블로그 버전 단위로 캐시
+    - viewer: 조회자 구분 (응답이 조회자와 무관하면 None)
+    - 절대 URL이 들어가므로 host와 쿼리 파라미터(card 등)도 키에 포함
+    """
+    config = response_cache_settings()
+    if not config['ENABLED']:
+        return build()
+
+    source = f"{request.get_host()}|{sorted(request.query_params.lists())}"
+    key = RESPONSE_CACHE_KEY.format(
+        view=view_name, urlname=profile.urlname, version=response_version(profile.user_id),
+        viewer=viewer or "any", digest=hashlib.md5(source.encode()).hexdigest(),
+    )
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, config['TIMEOUT'])
+    return data
@@ -0,0 +1,141 @@
+import html
+import re
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Case, Count, Exists, F, IntegerField, OuterRef, Q, Sum, Value, When
+from django.utils.html import strip_tags
+
+from main.models.post import Post, PostImage
+from main.models.postSearchTerm import PostSearchTerm
+
+NGRAM_SIZE = 2
+VERIFY_BATCH_SIZE = 100  # ✅ 검색어 포함 여부를 한 번에 확인할 후보 수
+
+# ✅ 랭킹 가중치 (제목 > 사진 설명 > 본문)
+FIELD_WEIGHTS = {
+    'title': 3,
+    'caption': 2,
+    'content': 1,
+}
+
+WORD_PATTERN = re.compile(r'\w+')
+
+
+def _words(text):
+    """ ✅ HTML 태그 제거 후 소문자 단어 목록 """
+    if not text:
+        return []
+    return WORD_PATTERN.findall(html.unescape(strip_tags(text)).lower())
+
+
+def tokenize(text, n=NGRAM_SIZE):
+    """
+    ✅ 텍스트를 색인용 토큰 목록으로 변환
+    - HTML 태그 제거 후 단어 단위로 나누고, 각 단어를 1~n글자씩 겹쳐 자름
+    - n글자보다 짧은 토큰도 함께 넣어 짧은 검색어가 긴 단어 안에서도 일치하도록 함
+    """
+    tokens = []
+    for word in _words(text):
+        for size in range(1, n + 1):
+            tokens.extend(word[i:i + size] for i in range(len(word) - size + 1))
+    return tokens
+
+
+def query_terms(keyword, n=NGRAM_SIZE):
+    """ ✅ 검색어 토큰 - n글자 이하 단어는 그대로, 긴 단어는 n-gram으로 """
+    terms = set()
+    for word in _words(keyword):
+        if len(word) <= n:
+            terms.add(word)
+        else:
+            terms.update(word[i:i + n] for i in range(len(word) - n + 1))
+    return terms
+
+
+def contains_keyword(keyword):
+    """ ✅ 제목 / 본문 / 사진 설명 중 하나에 검색어가 그대로 들어 있는 게시물 (기존 icontains 검색과 같은 조건) """
+    captions = PostImage.objects.filter(post=OuterRef('pk'), caption__icontains=keyword)
+    return Q(title__icontains=keyword) | Q(content__icontains=keyword) | Q(Exists(captions))
+
+
+def _build_terms(post_id, field, text):
+    return [
+        PostSearchTerm(post_id=post_id, field=field, term=term, frequency=freq)
+        for term, freq in Counter(tokenize(text)).items()
+    ]
+
+
+def index_post(post):
+    """ ✅ 게시물의 제목/본문 색인을 다시 만든다 (사진 설명은 index_post_captions에서 처리) """
+    terms = _build_terms(post.id, 'title', post.title) + _build_terms(post.id, 'content', post.content)
+    with transaction.atomic():
+        PostSearchTerm.objects.filter(post_id=post.id, field__in=['title', 'content']).delete()
+        PostSearchTerm.objects.bulk_create(terms)
+
+
+def index_post_captions(post_id):
+    """ ✅ 게시물에 속한 이미지들의 사진 설명 색인을 다시 만든다 """
+    captions = PostImage.objects.filter(post_id=post_id).exclude(caption__isnull=True).values_list('caption', flat=True)
+    terms = _build_terms(post_id, 'caption', " ".join(captions))
+    with transaction.atomic():
+        PostSearchTerm.objects.filter(post_id=post_id, field='caption').delete()
+        PostSearchTerm.objects.bulk_create(terms)
+
+
+def rebuild_index(posts):
+    """ ✅ 여러 게시물의 색인을 한 번에 다시 만든다 (관리 명령어용) """
+    for post in posts.prefetch_related('images'):
+        captions = " ".join(image.caption for image in post.images.all() if image.caption)
+        terms = (
+            _build_terms(post.id, 'title', post.title)
+            + _build_terms(post.id, 'content', post.content)
+            + _build_terms(post.id, 'caption', captions)
+        )
+        with transaction.atomic():
+            PostSearchTerm.objects.filter(post_id=post.id).delete()
+            PostSearchTerm.objects.bulk_create(terms)
+
+
+def search_post_ids(keyword, queryset, offset=0, limit=20):
+    """
+    ✅ 색인에서 검색어의 모든 토큰을 포함하는 게시물 id를 점수순으로 반환
+    - queryset: 검색 대상 게시물 범위 (공개 범위·블로그 필터가 적용된 Post queryset)
+    - 토큰은 위치와 무관하게 모으므로, 후보는 검색어가 실제로 이어서 들어 있는지 id로 다시 확인
+    - 반환: (post_id 목록, 다음 페이지 존재 여부)
+    """
+    terms = query_terms(keyword)
+    if not terms:
+        return [], False
+
+    weight = Case(
+        *[When(field=field, then=Value(w)) for field, w in FIELD_WEIGHTS.items()],
+        output_field=IntegerField(),
+    )
+    ranked = (
+        PostSearchTerm.objects
+        .filter(term__in=terms, post__in=queryset)
+        .values('post_id')
+        .annotate(matched=Count('term', distinct=True), score=Sum(F('frequency') * weight))
+        .filter(matched=len(terms))  # ✅ 검색어의 모든 토큰을 포함하는 게시물만
+        .order_by('-score', '-post_id')
+        .values_list('post_id', flat=True)
+    )
+
+    # ✅ 점수순 후보를 묶음 단위로 확인 (pk IN (...) 범위 안에서만 LIKE 비교)
+    contains = contains_keyword(keyword.strip())
+    wanted = offset + limit + 1
+    batch_size = max(wanted, VERIFY_BATCH_SIZE)
+    verified, start = [], 0
+    while len(verified) < wanted:
+        candidates = list(ranked[start:start + batch_size])
+        if not candidates:
+            break
+        matching = set(Post.objects.filter(id__in=candidates).filter(contains).values_list('id', flat=True))
+        verified += [post_id for post_id in candidates if post_id in matching]
+        if len(candidates) < batch_size:
+            break
+        start += batch_size
+
+    post_ids = verified[offset:wanted]
+    return post_ids[:limit], len(post_ids) > limit
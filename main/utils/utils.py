@@ -1,86 +1,230 @@
-import base64
 import json
 import re
 import os
-from django.core.files.base import ContentFile
-from main.models.post import PostImage
+from collections import defaultdict
+from django.core.files.storage import default_storage
 
-def save_images_from_request(post, request):
+from main.models.post import Post, PostImage
+from main.utils.deletion import post_cascade
+from main.utils.image_pipeline import (
+    base64_digest, enqueue_images, enqueue_release, spool_base64, spool_upload, upload_digest,
+)
+from main.utils.media_store import blob_name
+from main.utils.response_cache import bump_response_version
+from main.utils.search_index import index_post_captions
+
+BASE64_IMG_PATTERN = re.compile(r'(<img[^>]*?src=["\'])data:image/([a-zA-Z]+);base64,([^"\']+)(?=["\'])')
+BASE64_EXTENSIONS = ["png", "jpg", "jpeg", "gif", "webp"]
+CONVERTED_EXTENSIONS = ["heic", "heif"]
+
+
+def _pending_image(post, ext, caption, is_representative, content_hash):
     """
-    ✅ `request`에서 다중 이미지 저장 (multipart와 Base64 지원)
-    ✅ `captions`, `is_representative` 처리 포함
-    ✅ `PostImage` 모델에 저장
+    ✅ 최종 저장 경로(내용 주소)를 미리 정해둔 처리 대기(pending) 이미지 (파일은 워커가 기록)
+    - 같은 내용이 이미 처리되어 있으면(다른 게시물 포함) 그 경로를 사용 → 워커가 디코딩 없이 결과만 재사용
+    - 재사용이어도 바로 ready로 만들지 않음: 이 행이 커밋되기 전에 원래 행이 지워지면 파일이 정리될 수 있으므로
+      커밋 후 워커가 파일이 남아 있는지 확인하고, 없으면 임시 파일로 다시 저장
+    """
+    stored = PostImage.objects.filter(content_hash=content_hash, status=PostImage.STATUS_READY) \
+        .only('image').first()
+    post_image = PostImage(
+        post=post,
+        caption=caption,
+        is_representative=is_representative,
+        status=PostImage.STATUS_PENDING,
+        content_hash=content_hash,
+    )
+    post_image.image.name = stored.image.name if stored else blob_name('post_pics', content_hash, ext)
+    return post_image
+
+
+def _reuse_image(post_image, caption, is_representative, changed):
+    """ ✅ 내용이 같은 기존 이미지 재사용 (캡션/대표사진 여부만 바뀌었으면 bulk_update 대상에 추가) """
+    if (post_image.caption, post_image.is_representative) != (caption, is_representative):
+        post_image.caption, post_image.is_representative = caption, is_representative
+        changed.append(post_image)
+    return post_image
+
+
+def has_image_data(request):
+    """ ✅ 요청에 이미지 목록(파일 / 캡션 / 본문 Base64)이 포함되어 있는지 """
+    return bool(
+        request.FILES.getlist('images')
+        or 'captions' in request.data
+        or BASE64_IMG_PATTERN.search(request.data.get('content') or '')
+    )
+
+
+def _ingest_images(post, request, existing_by_hash):
+    """
+    ✅ `request`의 이미지(multipart / 본문 Base64)를 요청 순서대로 처리
+    - 내용 해시(SHA-256)가 existing_by_hash에 있으면 파일을 다시 쓰지 않고 기존 이미지 재사용
+    - 새 이미지만 임시 파일로 옮기고 `pending` 행 생성 → 워커가 디코딩/축소/저장
+    - 반환값: (새로 만든 이미지, 재사용한 기존 이미지)
     """
     captions = json.loads(request.data.get('captions', '[]'))
     is_representative_flags = json.loads(request.data.get('is_representative', '[]'))
 
-    # ✅ 1. Multipart (파일) 이미지 저장
-    images = request.FILES.getlist('images', [])
+    ordered_images = []  # ✅ 요청 순서 (새 이미지 + 재사용 이미지)
     created_images = []
+    reused_images = []
+    changed_images = []  # ✅ 캡션/대표사진 여부가 바뀐 재사용 이미지
+    jobs = []  # ✅ 워커가 처리할 (새 이미지, 임시 파일)
+
+    # ✅ 1. Multipart (파일) 이미지 → 임시 파일
+    images = request.FILES.getlist('images', [])
 
     for idx, image_file in enumerate(images):
         caption = captions[idx] if idx < len(captions) else None
         is_representative = is_representative_flags[idx] if idx < len(is_representative_flags) else False
 
+        content_hash = upload_digest(image_file)
+        if content_hash in existing_by_hash:
+            post_image = _reuse_image(existing_by_hash.pop(content_hash), caption, is_representative, changed_images)
+            reused_images.append(post_image)
+            ordered_images.append(post_image)
+            continue
+
         # ✅ 파일 확장자를 안전하게 추출
-        ext = os.path.splitext(image_file.name)[-1].lower()
+        ext = os.path.splitext(image_file.name)[-1].lower().lstrip('.')
         if not ext:
-            ext = ".png"  # 기본 확장자 설정
-
-        post_image = PostImage.objects.create(
-            post=post,
-            image=image_file,
-            caption=caption,
-            is_representative=is_representative
-        )
+            ext = "png"  # 기본 확장자 설정
+        elif ext in CONVERTED_EXTENSIONS:
+            ext = "jpg"  # HEIC는 워커에서 JPEG으로 변환
+
+        post_image = _pending_image(post, ext, caption, is_representative, content_hash)
         created_images.append(post_image)
+        ordered_images.append(post_image)
+        jobs.append((post_image, spool_upload(image_file)))
+
+    # ✅ 2. Base64 이미지 (content 내 포함된 이미지) → 임시 파일 + 최종 URL로 한 번에 치환
+    content = request.data.get('content', post.content) or ''  # ✅ content는 NULL일 수 있음
 
-    # ✅ 2. Base64 이미지 저장 (content 내 포함된 이미지)
-    content = request.data.get('content', '')
-    base64_images = re.findall(r'<img.*?src=["\'](data:image/[a-zA-Z]+;base64,[^"\']+)["\']', content)
+    def replace_base64(match):
+        idx = len(ordered_images)
+        ext = match.group(2).lower()
 
-    base64_start_idx = len(created_images)  # 기존 업로드된 이미지 수를 기준으로 Base64 인덱스 설정
+        # ✅ 확장자가 올바른지 확인 후 기본값 설정
+        if ext not in BASE64_EXTENSIONS:
+            ext = "png"
 
-    for idx, img_str in enumerate(base64_images, start=base64_start_idx):
         try:
-            # ✅ Base64 디코딩
-            format, imgstr = img_str.split(';base64,')
-            ext = format.split('/')[-1].lower()
-
-            # ✅ 확장자가 올바른지 확인 후 기본값 설정
-            if ext not in ["png", "jpg", "jpeg", "gif", "webp"]:
-                ext = "png"
-
-            image_data = base64.b64decode(imgstr)
-            image_file = ContentFile(image_data, name=f"post_{post.id}_base64_{idx}.{ext}")
-
-            # ✅ Base64 이미지에 대한 캡션 및 대표사진 여부 설정
-            caption = captions[idx] if idx < len(captions) else f"Base64 이미지 {idx + 1}"
-            is_representative = is_representative_flags[idx] if idx < len(is_representative_flags) else False
-
-            post_image = PostImage.objects.create(
-                post=post,
-                image=image_file,
-                caption=caption,
-                is_representative=is_representative
-            )
-            created_images.append(post_image)
+            content_hash = base64_digest(match.group(3))
+        except ValueError as e:
+            print(f"❌ Base64 이미지 처리 오류: {e}")
+            return match.group(0)
 
-            # ✅ content 내 Base64 URL → 실제 이미지 URL로 치환
-            content = content.replace(img_str, post_image.image.url)
+        # ✅ Base64 이미지에 대한 캡션 및 대표사진 여부 설정
+        caption = captions[idx] if idx < len(captions) else f"Base64 이미지 {idx + 1}"
+        is_representative = is_representative_flags[idx] if idx < len(is_representative_flags) else False
 
-        except Exception as e:
-            print(f"❌ Base64 이미지 처리 오류: {e}")
+        if content_hash in existing_by_hash:
+            post_image = _reuse_image(existing_by_hash.pop(content_hash), caption, is_representative, changed_images)
+            reused_images.append(post_image)
+        else:
+            post_image = _pending_image(post, ext, caption, is_representative, content_hash)
+            created_images.append(post_image)
+            jobs.append((post_image, spool_base64(match.group(3))))
+        ordered_images.append(post_image)
+        return match.group(1) + default_storage.url(post_image.image.name)
 
-    # ✅ `content`의 Base64 URL을 실제 URL로 업데이트
-    post.content = content
-    post.save()
+    try:
+        content = BASE64_IMG_PATTERN.sub(replace_base64, content)
+    except Exception:
+        for _, spool_path in jobs:
+            os.remove(spool_path)
+        raise
 
     # ✅ 3. 대표사진 자동 설정 (없으면 첫 번째 이미지)
-    if not any(img.is_representative for img in created_images) and created_images:
-        created_images[0].is_representative = True
-        created_images[0].save()
+    if not any(img.is_representative for img in ordered_images) and ordered_images:
+        first = ordered_images[0]
+        first.is_representative = True
+        if first.pk and first not in changed_images:
+            changed_images.append(first)
+
+    try:
+        PostImage.objects.bulk_create(created_images)
+        if created_images and created_images[0].pk is None:
+            # ✅ bulk_create가 pk를 돌려주지 않는 DB(MySQL)는 미리 정한 경로로 다시 조회
+            # - 같은 이미지를 두 번 넣으면 경로가 겹치므로 id 순서대로 나눠 가짐
+            saved = PostImage.objects.filter(post=post, image__in=[img.image.name for img in created_images]) \
+                .exclude(pk__in=[img.pk for img in existing_by_hash.values()] + [img.pk for img in reused_images]) \
+                .order_by('id').values_list('image', 'pk')
+            pks_by_name = defaultdict(list)
+            for name, pk in saved:
+                pks_by_name[name].append(pk)
+            for img in created_images:
+                img.pk = pks_by_name[img.image.name].pop(0)
+                img._state.adding = False
+    except Exception:
+        for _, spool_path in jobs:
+            os.remove(spool_path)
+        raise
+
+    if changed_images:
+        PostImage.objects.bulk_update(changed_images, ['caption', 'is_representative'])
+
+    # ✅ `content`의 Base64 URL을 실제 URL로 업데이트 (바뀐 경우에만)
+    if content != (post.content or ''):
+        post.content = content
+        post.save(update_fields=['content', 'updated_at'])
+
+    if created_images or changed_images:
+        index_post_captions(post.id)  # ✅ bulk_create / bulk_update는 post_save 시그널이 없으므로 직접 갱신
+    enqueue_images([(img.pk, img.image.name, spool_path) for img, spool_path in jobs])
+
+    return created_images, reused_images
 
+
+def save_images_from_request(post, request):
+    """
+    ✅ `request`에서 다중 이미지 저장 (multipart와 Base64 지원)
+    ✅ `captions`, `is_representative` 처리 포함
+    ✅ 업로드는 임시 파일로 옮겨두고 디코딩/축소/저장은 워커 풀에서 처리 (main/utils/image_pipeline.py)
+    ✅ 요청 스레드에서는 최종 URL이 정해진 `pending` 상태의 `PostImage`만 생성해 바로 반환
+    """
+    created_images, _ = _ingest_images(post, request, {})
     return created_images
 
 
+def delete_post_images(images):
+    """
+    ✅ 게시물 이미지 삭제 (DELETE 한 번)
+    - 행 단위 signal(색인 갱신 등) 대신 게시물별로 한 번씩 처리
+    - 다른 행이 참조하지 않는 원본/변형 파일은 커밋 후 워커에서 정리
+    """
+    images = list(images)
+    if not images:
+        return
+    post_ids = {image.post_id for image in images}
+    with post_cascade(post_ids):
+        PostImage.objects.filter(pk__in=[image.pk for image in images]).delete()
+    for post_id in post_ids:
+        index_post_captions(post_id)
+    bump_response_version(*Post.objects.filter(pk__in=post_ids).values_list('user_id', flat=True))
+    enqueue_release([(image.image.name, image.variants) for image in images])
+
+
+def update_images_from_request(post, request):
+    """
+    ✅ 게시물 수정 시 이미지 목록 반영 (전체 삭제 후 재등록 대신 내용 해시로 비교)
+    - 요청에 이미지 목록이 없으면(제목/본문만 수정) 기존 이미지 유지
+    - 같은 내용의 이미지는 기존 행/파일 재사용, 새 이미지만 저장
+    - 요청에 없고 본문에서도 참조하지 않는 기존 이미지는 파일과 함께 일괄 삭제
+    - 반환값: (새로 만든 이미지, 삭제한 이미지)
+    """
+    if not has_image_data(request):
+        return [], []
+
+    existing_images = list(post.images.all())
+    existing_by_hash = {img.content_hash: img for img in existing_images if img.content_hash}
+    created_images, reused_images = _ingest_images(post, request, existing_by_hash)
+
+    kept_ids = {img.pk for img in reused_images}
+    content = post.content or ""
+    removed_images = [
+        img for img in existing_images
+        if img.pk not in kept_ids and not (img.image and default_storage.url(img.image.name) in content)
+    ]
+    delete_post_images(removed_images)
+    return created_images, removed_images
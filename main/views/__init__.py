@@ -3,12 +3,13 @@ from .profile import ProfileDetailView,ProfilePublicView,ProfileUrlnameUpdateVie
 from .login import LoginView
 from .logout import LogoutView
 from .account import PasswordUpdateView
-from .post import PostListView,PostCreateView,PostMyView,PostMyCurrentView,PostMyDetailView,PostMyRecentView,PostMutualListView,PostMutualDetailView,PostDetailView,PostManageView,DraftPostListView,DraftPostDetailView
+from .post import PostListView,PostCreateView,PostMyView,PostMyCurrentView,PostMyDetailView,PostMyRecentView,PostMutualListView,PostMutualDetailView,PostDetailView,PostManageView,PostBulkDeleteView,DraftPostListView,DraftPostDetailView
 from .comment import CommentListView,CommentDetailView
 from .heart import ToggleHeartView, PostHeartUsersView,PostHeartCountView
 from .commentHeart import ToggleCommentHeartView,CommentHeartCountView
 from .neighbor import NeighborView,NeighborAcceptView,NeighborRejectView,NeighborRequestListView,PublicNeighborListView
 from .activity import MyActivityListView
-from .news import MyNewsListView
+from .news import MyNewsListView,MyNewsReadView
 from .search import BlogPostSearchView, GlobalBlogSearchView, GlobalNickAndIdSearchView, GlobalPostSearchView
-from .category import CategoryListView,CategoryDetailView,MyCategoryListView,MyCategoryDetailView
\ No newline at end of file
+from .category import CategoryListView,CategoryDetailView,MyCategoryListView,MyCategoryDetailView
+from .profiling import ProfilingStatsView
\ No newline at end of file
@@ -1,52 +1,63 @@
+from rest_framework import status
 from rest_framework.generics import ListAPIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from main.models.comment import Comment
-from main.models.heart import Heart
-from main.models.commentHeart import CommentHeart  # ✅ 댓글 좋아요 추가
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from main.models.activity import Activity
 from main.serializers.activity import ActivitySerializer
+from main.utils.pagination import KeysetPagination
+
+ACTIVITY_PREVIEW_SIZE = 5  # ✅ 페이지네이션 파라미터가 없을 때 반환하는 최신 활동 개수
+
 
 class MyActivityListView(ListAPIView):
+    """
+    내 활동 API (좋아요 누른 게시글/댓글, 작성한 댓글/대댓글)
+    - 생성 시점에 기록된 Activity 로그를 인덱스 한 번으로 조회 → 비용은 페이지 크기에 비례
+    """
     permission_classes = [IsAuthenticated]
+    query_budget = {'GET': 3}  # ✅ 인증 + 활동 기록 (+ 여유 1)
     serializer_class = ActivitySerializer
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
-        return self.get_latest_unread_activity(self.request.user)
-
-    def list(self, request, *args, **kwargs):
-        queryset = self.get_latest_unread_activity(request.user)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-
-    @staticmethod
-    def get_latest_unread_activity(user):
-        profile = user.profile
-
-        # ✅ 내가 좋아요 누른 게시글 (안 읽은 것만)
-        liked_posts = list(Heart.objects.filter(user=user, post__isnull=False, is_read=False)
-                           .select_related('post', 'user')
-                           .order_by('-created_at'))
-
-        # ✅ 내가 좋아요 누른 댓글 (안 읽은 것만)
-        liked_comments = list(CommentHeart.objects.filter(user=user, comment__isnull=False, is_read=False)
-                              .select_related('comment', 'user')
-                              .order_by('-created_at'))
-
-        # ✅ 내가 작성한 댓글 (안 읽은 것만)
-        my_comments = list(Comment.objects.filter(
-            author=profile, is_read=False, is_parent=True
-        ).select_related('author').order_by('-created_at'))
-
-        # ✅ 내가 작성한 대댓글 (안 읽은 것만)
-        my_replies = list(Comment.objects.filter(
-            author=profile, is_read=False, is_parent=False
-        ).select_related('author').order_by('-created_at'))
-
-        # ✅ 최신순 정렬 후 최대 5개 반환
-        combined_activity = sorted(
-            liked_posts + liked_comments + my_comments + my_replies,
-            key=lambda obj: obj.created_at,
-            reverse=True
-        )[:5]
-
-        return combined_activity
+        return (
+            Activity.objects
+            .filter(user=self.request.user, is_read=False)
+            .select_related('post__user__profile', 'comment')
+            .order_by('-created_at', '-id')
+        )
+
+    @swagger_auto_schema(
+        operation_summary="내 활동 조회",
+        operation_description="내가 좋아요 누른 게시글/댓글, 작성한 댓글/대댓글을 최신순으로 조회. "
+                              "cursor / page_size가 없으면 최신 5개만 반환합니다.",
+        manual_parameters=[
+            openapi.Parameter(
+                'cursor', openapi.IN_QUERY,
+                description="이전 응답의 next_cursor 값 (키셋 페이지네이션)",
+                required=False,
+                type=openapi.TYPE_STRING
+            ),
+            openapi.Parameter(
+                'page_size', openapi.IN_QUERY,
+                description="페이지당 활동 수 (기본 20, 최대 100)",
+                required=False,
+                type=openapi.TYPE_INTEGER
+            ),
+        ],
+        responses={200: ActivitySerializer(many=True)}
+    )
+    def get(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+
+        # ✅ cursor / page_size가 주어지면 키셋 페이지 단위로 응답
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        # ✅ 기존처럼 최신 5개만 반환
+        serializer = self.get_serializer(queryset[:ACTIVITY_PREVIEW_SIZE], many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
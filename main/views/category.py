@@ -9,6 +9,7 @@ from django.db.models import Q
 from main.models.category import Category
 from main.models.profile import Profile
 from main.serializers.category import CategorySerializer
+from main.utils.response_cache import cached_response_data
 from drf_yasg.utils import swagger_auto_schema  # ✅ Swagger 추가
 from drf_yasg import openapi  # ✅ Swagger 문서 필드 설정
 
@@ -20,21 +21,31 @@ class CategoryListView(ListAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = CategorySerializer
 
-    def get_queryset(self):
+    def get_profile(self):
         urlname = self.request.query_params.get("urlname", None)
 
         if not urlname:
             raise ValidationError("urlname은 필수 입력값입니다.")
 
-        # ✅ urlname을 이용해 Profile 찾고, 연결된 CustomUser 가져오기
-        profile = Profile.objects.filter(urlname=urlname).select_related("user").first()
+        # ✅ urlname을 이용해 Profile 찾기
+        profile = Profile.objects.filter(urlname=urlname).only("user_id", "urlname").first()
         if not profile:
             raise NotFound("해당 urlname을 가진 사용자가 존재하지 않습니다.")
+        return profile
 
-        user = profile.user  # ✅ Profile과 연결된 CustomUser 가져오기
-
+    def get_queryset(self):
         # ✅ 특정 사용자가 만든 모든 카테고리 반환 (기본 설정 카테고리 포함)
-        return user.categories.all()
+        return Category.objects.filter(user_id=self.get_profile().user_id)
+
+    def list(self, request, *args, **kwargs):
+        # ✅ 카테고리 목록은 조회자와 무관 → 블로그 버전 단위로 캐시 (카테고리 추가/수정/삭제 시 무효화)
+        profile = self.get_profile()
+
+        def build():
+            queryset = self.filter_queryset(Category.objects.filter(user_id=profile.user_id))
+            return self.get_serializer(queryset, many=True).data
+
+        return Response(cached_response_data(request, "categories", profile, build))
 
     @swagger_auto_schema(
         operation_summary="특정 사용자가 만든 모든 카테고리 조회",
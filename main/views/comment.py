@@ -11,17 +11,38 @@ from main.models.comment import Comment
 from main.models.post import Post
 from main.serializers.comment import CommentSerializer
 from main.models.profile import Profile  # ✅ Profile 모델 임포트
+from main.utils.neighbors import is_mutual
+from main.utils.comment_tree import load_comment_thread
+from main.utils.pagination import CommentThreadPagination
 from django.contrib.auth import get_user_model
 from rest_framework.response import Response
 from django.http import Http404
+from django.db import transaction
 
 class CommentListView(ListCreateAPIView):
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    query_budget = {'GET': 7}  # ✅ 인증 + 게시글 + 서로이웃 + 프로필 + 스레드(페이지 시 +1) (+ 여유 1)
+    pagination_class = CommentThreadPagination
 
     @swagger_auto_schema(
         operation_summary="댓글 목록 조회",
-        operation_description="게시글의 댓글 및 대댓글을 조회합니다. 비밀 댓글은 작성자 또는 게시글 작성자만 볼 수 있습니다.",
+        operation_description="게시글의 댓글 및 대댓글을 조회합니다. 비밀 댓글은 작성자 또는 게시글 작성자만 볼 수 있습니다. "
+                              "cursor / page_size를 넘기면 최상위 댓글 단위로 페이지네이션합니다.",
+        manual_parameters=[
+            openapi.Parameter(
+                'cursor', openapi.IN_QUERY,
+                description="이전 응답의 next_cursor 값 (키셋 페이지네이션)",
+                required=False,
+                type=openapi.TYPE_STRING
+            ),
+            openapi.Parameter(
+                'page_size', openapi.IN_QUERY,
+                description="페이지당 최상위 댓글 수 (기본 20, 최대 100)",
+                required=False,
+                type=openapi.TYPE_INTEGER
+            ),
+        ],
         responses={
             200: openapi.Response(description="조회 성공", schema=CommentSerializer(many=True)),
             403: openapi.Response(description="조회 권한이 없습니다."),
@@ -31,12 +52,21 @@ class CommentListView(ListCreateAPIView):
     def get(self, request, *args, **kwargs):
         queryset = self.get_queryset()
 
-        # 게시글이 없는 경우 404 반환
-        if queryset is None:
-            return Response({"error": "게시글을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
-
-        # 🔥 `context={'request': request}` 추가!
-        serializer = self.serializer_class(queryset, many=True, context={'request': request})
+        # ✅ 게시글이 없거나 조회 권한이 없으면 기존처럼 빈 목록 반환
+        post = getattr(self, 'thread_post', None)
+        if post is None:
+            return Response([], status=status.HTTP_200_OK)
+
+        # ✅ cursor / page_size가 주어지면 최상위 댓글 단위로 페이지네이션 (대댓글은 쿼리 한 번으로 추가)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            comments = load_comment_thread(post, top_level=page)
+            serializer = self.get_serializer(comments, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        # ✅ 전체 스레드를 쿼리 한 번으로 가져와 메모리에서 트리 구성
+        comments = load_comment_thread(post)
+        serializer = self.get_serializer(comments, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def get_queryset(self):
@@ -57,17 +87,17 @@ class CommentListView(ListCreateAPIView):
         user = self.request.user
 
         # ✅ '나만 보기' 게시물 → 작성자 본인만 조회 가능
-        if post.visibility == 'me' and (not user.is_authenticated or post.user != user):
+        if post.visibility == 'me' and (not user.is_authenticated or post.user_id != user.pk):
             return Comment.objects.none()
 
         # ✅ '서로 이웃 공개' 게시물 → 서로 이웃만 조회 가능
-        if post.visibility == 'mutual' and not post.user.profile.neighbors.filter(id=user.profile.id).exists():
+        if post.visibility == 'mutual' and not is_mutual(post.user_id, user):
             return Comment.objects.none()
 
-        # ✅ 댓글과 대댓글을 계층적으로 가져오기
-        comments = Comment.objects.filter(post_id=post_id, parent__isnull=True).prefetch_related('replies')
+        self.thread_post = post
 
-        return comments
+        # ✅ 최상위 댓글만 (대댓글은 load_comment_thread에서 붙임)
+        return Comment.objects.filter(post_id=post_id, parent__isnull=True).select_related('author')
 
     @swagger_auto_schema(
         operation_summary="댓글 생성",
@@ -99,14 +129,15 @@ class CommentListView(ListCreateAPIView):
             return Response({"error": "이 게시글에는 작성자 본인만 댓글을 작성할 수 있습니다."}, status=403)
 
         # ✅ '서로 이웃 공개' 게시물 → 서로 이웃인지 체크
-        if post.visibility == 'mutual' and not post.user.profile.neighbors.filter(id=user.profile.id).exists():
+        if post.visibility == 'mutual' and not is_mutual(post.user_id, user):
             return Response({"error": "서로 이웃 관계인 사용자만 댓글을 작성할 수 있습니다."}, status=403)
 
         # ✅ 댓글 저장
         is_private = request.data.get('is_private', False)
         serializer = self.get_serializer(data=request.data, context={'request': request})
         if serializer.is_valid():
-            serializer.save(post=post, is_private=is_private)  # ✅ user.profile 대신 create()에서 처리
+            with transaction.atomic():  # ✅ 댓글 저장과 comment_count 증가를 함께 커밋
+                serializer.save(post=post, is_private=is_private)  # ✅ user.profile 대신 create()에서 처리
             return Response(serializer.data, status=201)
 
         return Response(serializer.errors, status=400)
@@ -147,7 +178,7 @@ class CommentDetailView(RetrieveUpdateDestroyAPIView):
         if post.visibility == 'me' and (not user.is_authenticated or post.user.profile != user.profile):
             return Comment.objects.none()
 
-        if post.visibility == 'mutual' and not post.user.profile.neighbors.filter(id=user.profile.id).exists():
+        if post.visibility == 'mutual' and not is_mutual(post.user_id, user):
             return Comment.objects.none()
 
         return Comment.objects.filter(post_id=post_id)
@@ -294,6 +325,7 @@ class CommentDetailView(RetrieveUpdateDestroyAPIView):
             comment.is_private = False
             comment.save()
         else:
-            comment.delete()
+            with transaction.atomic():  # ✅ 댓글 삭제와 comment_count 감소를 함께 커밋
+                comment.delete()
 
         return Response({"message": "댓글이 삭제되었습니다."}, status=status.HTTP_204_NO_CONTENT)
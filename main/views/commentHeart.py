@@ -2,9 +2,12 @@ from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
+from django.db import transaction
 from main.models.comment import Comment
 from main.models.commentHeart import CommentHeart
 from main.serializers.commentHeart import CommentHeartSerializer
+from main.utils.counters import get_like_count, increment_like_count
+from main.utils.neighbors import is_mutual
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
@@ -45,17 +48,19 @@ class ToggleCommentHeartView(generics.GenericAPIView):
         if comment.is_private:
             return Response({"error": "비밀 댓글에는 좋아요 기능이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        # ✅ 현재 유저가 이미 좋아요를 눌렀는지 확인
-        heart, created = CommentHeart.objects.get_or_create(comment=comment, user=user)
+        # ✅ 현재 유저가 이미 좋아요를 눌렀는지 확인하고, 좋아요 추가/취소와 like_count 증감을 한 트랜잭션으로 처리
+        with transaction.atomic():
+            heart, created = CommentHeart.objects.get_or_create(comment=comment, user=user)
+            if not created:
+                # ✅ 이미 좋아요를 눌렀다면 취소 (삭제)
+                heart.delete()
+            increment_like_count(comment, 1 if created else -1)
+        like_count = get_like_count(comment, refresh=True)
 
         if not created:
-            # ✅ 이미 좋아요를 눌렀다면 취소 (삭제)
-            heart.delete()
-            like_count = CommentHeart.objects.filter(comment=comment).count()
             return Response({"message": "좋아요 취소됨", "like_count": like_count}, status=status.HTTP_200_OK)
 
         # ✅ 좋아요 추가
-        like_count = CommentHeart.objects.filter(comment=comment).count()  # 💡 변경된 부분
 
         return Response({"message": "좋아요 추가됨", "like_count": like_count}, status=status.HTTP_201_CREATED)
 
@@ -91,13 +96,11 @@ class CommentHeartCountView(generics.RetrieveAPIView):
             return Response({"error": "이 게시글의 댓글 좋아요 개수를 조회할 수 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
         # ✅ '서로 이웃 공개' 게시글이면 서로 이웃만 좋아요 개수 조회 가능
-        if comment.post.visibility == 'mutual' and not comment.post.user.profile.neighbors.filter(id=user.profile.id).exists():
+        if comment.post.visibility == 'mutual' and not is_mutual(comment.post.user_id, user):
             return Response({"error": "서로 이웃만 이 게시글의 댓글 좋아요 개수를 조회할 수 있습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        # ✅ 최신 좋아요 개수 동기화
-        like_count = CommentHeart.objects.filter(comment=comment).count()
-
-        return Response({"like_count": like_count}, status=status.HTTP_200_OK)
+        # ✅ 토글 시 원자적으로 갱신되는 like_count 사용 (COUNT 쿼리 없음)
+        return Response({"like_count": get_like_count(comment)}, status=status.HTTP_200_OK)
 
 
 
@@ -2,12 +2,16 @@ from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
+from django.db import transaction
 from main.models.post import Post
 from main.models.heart import Heart
 from django.contrib.auth import get_user_model
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from main.serializers.heart import HeartSerializer
+from main.utils.conditional import conditional_response, make_etag
+from main.utils.counters import get_like_count, increment_like_count
+from main.utils.neighbors import is_mutual
 
 User = get_user_model()  # ✅ Django의 사용자 모델 가져오기
 
@@ -47,24 +51,23 @@ class ToggleHeartView(generics.GenericAPIView):
         if post.visibility == 'me':
             return Response({"error": "이 게시글에서는 좋아요를 누를 수 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        # ✅ '서로 이웃 공개' 게시글이면 서로 이웃만 하트 가능 (is_mutual 대신 neighbors 사용)
-        if post.visibility == 'mutual' and not post.user.profile.neighbors.filter(id=user.profile.id).exists():
+        # ✅ '서로 이웃 공개' 게시글이면 서로 이웃만 하트 가능 (서로이웃 캐시 사용)
+        if post.visibility == 'mutual' and not is_mutual(post.user_id, user):
             return Response({"error": "서로 이웃만 이 게시글에 좋아요를 누를 수 있습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        # ✅ 현재 유저가 이미 하트를 눌렀는지 확인하고 최적화
-        heart = Heart.objects.filter(post=post, user=user).first()
+        # ✅ 하트 추가/삭제와 like_count 증감을 하나의 트랜잭션으로 처리
+        # ✅ 버퍼 미사용 시 F() 표현식으로 즉시 증감, 사용 시 샤드 카운터에 누적 후 일괄 반영 (main.utils.counters)
+        with transaction.atomic():
+            heart, created = Heart.objects.get_or_create(post=post, user=user)
+            if not created:
+                heart.delete()
+            increment_like_count(post, 1 if created else -1)
+        like_count = get_like_count(post, refresh=True)
 
-        if heart:
-            heart.delete()
-            post.like_count = max(0, post.like_count - 1)  # ✅ like_count 감소
-            post.save()
-            return Response({"message": "하트 취소", "like_count": post.like_count}, status=status.HTTP_200_OK)
+        if not created:
+            return Response({"message": "하트 취소", "like_count": like_count}, status=status.HTTP_200_OK)
 
-        Heart.objects.create(post=post, user=user)
-        post.like_count += 1
-        post.save()
-
-        return Response({"message": "하트 추가", "like_count": post.like_count}, status=status.HTTP_201_CREATED)
+        return Response({"message": "하트 추가", "like_count": like_count}, status=status.HTTP_201_CREATED)
 
 
 class PostHeartUsersView(generics.RetrieveAPIView):
@@ -104,7 +107,7 @@ class PostHeartUsersView(generics.RetrieveAPIView):
             return Response({"error": "이 게시글의 좋아요 유저 목록을 조회할 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
         # ✅ '서로 이웃 공개' 게시글이면 서로 이웃만 하트 목록 조회 가능
-        if post.visibility == 'mutual' and not post.user.profile.neighbors.filter(id=user.profile.id).exists():
+        if post.visibility == 'mutual' and not is_mutual(post.user_id, user):
             return Response({"error": "서로 이웃만 이 게시글의 좋아요 유저 목록을 조회할 수 있습니다."}, status=status.HTTP_403_FORBIDDEN)
 
         # ✅ Heart 테이블에서 해당 게시글을 좋아요한 유저 정보 가져오기
@@ -148,8 +151,11 @@ class PostHeartCountView(generics.RetrieveAPIView):
         if post.visibility == 'me' and post.user != user:
             return Response({"error": "이 게시글의 하트 개수를 조회할 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        # ✅ '서로 이웃 공개' 게시글이면 서로 이웃만 하트 개수 조회 가능 (is_mutual 대신 neighbors 사용)
-        if post.visibility == 'mutual' and not post.user.profile.neighbors.filter(id=user.profile.id).exists():
+        # ✅ '서로 이웃 공개' 게시글이면 서로 이웃만 하트 개수 조회 가능 (서로이웃 캐시 사용)
+        if post.visibility == 'mutual' and not is_mutual(post.user_id, user):
             return Response({"error": "서로 이웃만 이 게시글의 하트 개수를 조회할 수 있습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        return Response({"like_count": post.like_count}, status=status.HTTP_200_OK)
+        # ✅ 아직 DB에 반영되지 않은 버퍼 증감값까지 합산
+        like_count = get_like_count(post)
+        etag = make_etag('post-likes', post.id, like_count)
+        return conditional_response(request, etag, lambda: Response({"like_count": like_count}, status=status.HTTP_200_OK))
@@ -12,6 +12,9 @@ from django.shortcuts import get_object_or_404
 from ..models.neighbor import Neighbor
 from ..models.profile import Profile
 from ..serializers.neighbor import NeighborSerializer
+from ..utils.conditional import conditional_response, make_etag
+from ..utils.neighbors import invalidate_neighbors
+from ..utils.response_cache import bump_response_version, cached_response_data
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from django.db import models
@@ -182,10 +185,16 @@ class NeighborAcceptView(APIView):
         neighbor_requests.update(status="accepted")
         reverse_neighbor_requests.update(status="accepted")
 
+        # ✅ update()는 signal이 발생하지 않으므로 서로이웃 캐시를 직접 무효화
+        invalidate_neighbors(from_user, to_user)
+
         # ✅ Profile의 `neighbors`에도 서로 추가 (양방향)
         from_user_profile.neighbors.add(to_user_profile)
         to_user_profile.neighbors.add(from_user_profile)
 
+        # ✅ update() / M2M add()는 post_save가 없으므로 양쪽 블로그 응답 캐시도 직접 무효화 (목록 변경 후)
+        bump_response_version(from_user.pk, to_user.pk)
+
         return Response({"message": "서로이웃 요청이 수락되었습니다."}, status=status.HTTP_200_OK)
 
 
@@ -275,27 +284,31 @@ class PublicNeighborListView(APIView):
         if not profile.neighbor_visibility:
             return Response({"message": "비공개입니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        # ✅ `Neighbor` 모델을 사용하여 서로이웃 관계 조회
-        neighbors = Neighbor.objects.filter(
-            Q(from_user=profile.user) | Q(to_user=profile.user),
-            status="accepted"
-        ).select_related("from_user__profile", "to_user__profile")
+        def build():
+            # ✅ `Neighbor` 모델을 사용하여 서로이웃 관계 조회
+            neighbors = Neighbor.objects.filter(
+                Q(from_user_id=profile.user_id) | Q(to_user_id=profile.user_id),
+                status="accepted"
+            ).select_related("from_user__profile", "to_user__profile")
 
-        neighbor_list = []
-        for neighbor in neighbors:
-            neighbor_user = neighbor.to_user if neighbor.from_user == profile.user else neighbor.from_user
+            neighbor_list = []
+            for neighbor in neighbors:
+                neighbor_user = neighbor.to_user if neighbor.from_user_id == profile.user_id else neighbor.from_user
 
-            # ✅ `username` 추가
-            neighbor_list.append({
-                "urlname": neighbor_user.profile.urlname,
-                "username": neighbor_user.profile.username,  # ✅ 여기 추가
-                "user_pic": neighbor_user.profile.user_pic.url if neighbor_user.profile.user_pic else None
-            })
+                # ✅ `username` 추가
+                neighbor_list.append({
+                    "urlname": neighbor_user.profile.urlname,
+                    "username": neighbor_user.profile.username,  # ✅ 여기 추가
+                    "user_pic": neighbor_user.profile.user_pic.url if neighbor_user.profile.user_pic else None
+                })
 
-        return Response({
-            "urlname": profile.urlname,
-            "neighbors": neighbor_list
-        }, status=status.HTTP_200_OK)
+            return {
+                "urlname": profile.urlname,
+                "neighbors": neighbor_list
+            }
+
+        # ✅ 목록은 조회자와 무관 → 블로그 버전 단위로 캐시 (Neighbor / 이웃 프로필 변경 시 무효화)
+        return Response(cached_response_data(request, "neighbors", profile, build), status=status.HTTP_200_OK)
 
 
 
@@ -395,6 +408,9 @@ class MyNeighborDeleteView(APIView):
         profile.neighbors.remove(neighbor_profile)
         neighbor_profile.neighbors.remove(profile)
 
+        # ✅ Neighbor 삭제 signal은 M2M 제거 전에 실행되므로 제거 후 한 번 더 무효화
+        bump_response_version(request.user.pk, neighbor_profile.user_id)
+
         return Response({"message": "서로이웃 관계가 삭제되었습니다."}, status=status.HTTP_200_OK)
 
 
@@ -420,4 +436,5 @@ class NeighborNumberView(APIView):
 
         neighbor_count = profile.neighbors.count()
 
-        return Response({"urlname": urlname, "neighbor_count": neighbor_count})
\ No newline at end of file
+        etag = make_etag('neighbor-count', urlname, neighbor_count)
+        return conditional_response(request, etag, lambda: Response({"urlname": urlname, "neighbor_count": neighbor_count}))
\ No newline at end of file
@@ -1,53 +1,103 @@
-from rest_framework.generics import ListAPIView
+from rest_framework import status
+from rest_framework.generics import GenericAPIView, ListAPIView
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from main.serializers import NewsSerializer
-from main.models.comment import Comment
-from main.models.heart import Heart
+from main.models.notification import Notification
+from main.utils.pagination import KeysetPagination
+
+NEWS_PREVIEW_SIZE = 5  # ✅ 페이지네이션 파라미터가 없을 때 반환하는 최신 소식 개수
+
 
 class MyNewsListView(ListAPIView):
     """
     내 소식 API (내 게시글에 달린 댓글, 좋아요 / 내 댓글에 달린 대댓글)
+    - 댓글/하트 생성 시 미리 만들어 둔 Notification 수신함을 인덱스 한 번으로 조회
     """
     permission_classes = [IsAuthenticated]
+    query_budget = {'GET': 3}  # ✅ 인증 + 수신함 (+ 여유 1)
     serializer_class = NewsSerializer
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        return (
+            Notification.objects
+            .filter(recipient=self.request.user, is_read=False)
+            .select_related('actor__profile', 'post__user__profile', 'comment')
+            .order_by('-created_at', '-id')
+        )
 
     @swagger_auto_schema(
         operation_summary="내 소식 조회",
-        operation_description="내 게시물에 달린 댓글, 좋아요 및 내 댓글에 달린 대댓글을 최신순으로 조회",
+        operation_description="내 게시물에 달린 댓글, 좋아요 및 내 댓글에 달린 대댓글을 최신순으로 조회. "
+                              "cursor / page_size가 없으면 최신 5개만 반환합니다.",
+        manual_parameters=[
+            openapi.Parameter(
+                'cursor', openapi.IN_QUERY,
+                description="이전 응답의 next_cursor 값 (키셋 페이지네이션)",
+                required=False,
+                type=openapi.TYPE_STRING
+            ),
+            openapi.Parameter(
+                'page_size', openapi.IN_QUERY,
+                description="페이지당 소식 수 (기본 20, 최대 100)",
+                required=False,
+                type=openapi.TYPE_INTEGER
+            ),
+        ],
         responses={200: NewsSerializer(many=True)}
     )
-    def get_queryset(self):
-        user = self.request.user
-        profile = user.profile  # ✅ Profile 객체 가져오기
-
-        # ✅ 내가 작성한 게시글에 달린 댓글 (post__user → 내가 작성한 게시글)
-        post_comment_news = list(Comment.objects.filter(
-            post__user=user, is_read=False
-        ).exclude(author=profile)  # ✅ 내가 쓴 댓글은 제외
-        .select_related('post', 'author')
-        .order_by('-created_at'))
-
-        # ✅ 내가 작성한 게시글에 달린 좋아요 (post__user → 내가 작성한 게시글)
-        post_like_news = list(Heart.objects.filter(
-            post__user=user, is_read=False
-        ).exclude(user=profile.user)  # ✅ 내가 누른 좋아요는 제외, profile.user로 수정
-        .select_related('post', 'user')
-        .order_by('-created_at'))
-
-        # ✅ 내가 작성한 댓글에 달린 대댓글 (parent__author → 내가 쓴 댓글에 대한 대댓글)
-        comment_reply_news = list(Comment.objects.filter(
-            parent__author=profile, is_read=False
-        ).exclude(author=profile)  # ✅ 내가 작성한 대댓글은 제외
-        .select_related('post', 'author')
-        .order_by('-created_at'))
-
-        # ✅ 최신순으로 정렬하고 최대 5개만 반환
-        combined_news = sorted(
-            post_comment_news + post_like_news + comment_reply_news,
-            key=lambda obj: obj.created_at,
-            reverse=True
-        )[:5]
-
-        return combined_news
+    def get(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+
+        # ✅ cursor / page_size가 주어지면 키셋 페이지 단위로 응답
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        # ✅ 기존처럼 최신 5개만 반환
+        serializer = self.get_serializer(queryset[:NEWS_PREVIEW_SIZE], many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class MyNewsReadView(GenericAPIView):
+    """
+    내 소식 읽음 처리 API
+    - ids를 넘기면 해당 알림만, 없으면 미확인 알림 전체를 UPDATE 한 번으로 읽음 처리
+    """
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="내 소식 읽음 처리",
+        operation_description="지정한 알림(ids) 또는 미확인 알림 전체를 읽음 처리합니다.",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "ids": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(type=openapi.TYPE_INTEGER),
+                    description="읽음 처리할 알림 id 목록 (생략 시 전체)"
+                ),
+            }
+        ),
+        responses={200: openapi.Response(description="읽음 처리 완료", schema=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "updated": openapi.Schema(type=openapi.TYPE_INTEGER, description="읽음 처리된 알림 수")
+            }
+        ))}
+    )
+    def post(self, request, *args, **kwargs):
+        notifications = Notification.objects.filter(recipient=request.user, is_read=False)
+
+        ids = request.data.get("ids")
+        if ids is not None:
+            if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+                return Response({"error": "ids는 정수 목록이어야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+            notifications = notifications.filter(id__in=ids)
 
+        updated = notifications.update(is_read=True)
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
@@ -1,4 +1,4 @@
-from rest_framework.generics import CreateAPIView, ListAPIView, RetrieveAPIView, UpdateAPIView, DestroyAPIView
+from rest_framework.generics import CreateAPIView, ListAPIView, RetrieveAPIView, UpdateAPIView, DestroyAPIView, GenericAPIView
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
@@ -8,17 +8,24 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from ..models import Post, PostImage,CustomUser,Profile,Category
 from ..models.neighbor import Neighbor
-from django.db.models import Q
-from ..serializers import PostSerializer
+from django.db.models import Prefetch, Q
+from ..serializers import PostSerializer, PostCardSerializer
 import json
 import os
+from functools import partial
 import shutil
 from rest_framework.exceptions import NotFound,MethodNotAllowed, ValidationError
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.timezone import now, timedelta
 from pickle import FALSE
-from main.utils.utils import save_images_from_request
+from main.utils.utils import save_images_from_request, update_images_from_request
+from main.utils.deletion import delete_posts
+from main.utils.pagination import KeysetPagination
+from main.utils.conditional import conditional_response, make_etag, post_validators
+from main.utils.neighbors import neighbors_of, is_mutual
+from main.utils.post_counts import VISIBLE_TO_MUTUAL, VISIBLE_TO_OWNER, VISIBLE_TO_PUBLIC, get_post_counts
+from main.utils.response_cache import cached_response_data, viewer_class
 
 def to_boolean(value):
     """
@@ -32,13 +39,92 @@ def to_boolean(value):
         return bool(value)  # 1 → True, 0 → False
     return False  # 기본적으로 False 처리
 
-class PostListView(ListAPIView):
+# ✅ 목록 API 공통 `view` 쿼리 파라미터 (swagger 문서용)
+CARD_VIEW_PARAMETER = openapi.Parameter(
+    'view', openapi.IN_QUERY,
+    description="card: 본문 HTML 대신 요약(excerpt)·대표 썸네일만 반환하는 경량 카드 응답",
+    required=False,
+    type=openapi.TYPE_STRING,
+    enum=['card']
+)
+
+
+class PostCardViewMixin:
+    """
+    ✅ 게시물 목록 API에서 `?view=card`이면 PostCardSerializer로 응답
+    - content 컬럼은 불러오지 않고(defer), 이미지는 대표 이미지만 prefetch
+    - get()에서 self.filter_queryset(self.get_queryset())으로 호출해야 적용됨
+    """
+
+    def is_card_view(self):
+        return self.request.query_params.get('view') == 'card'
+
+    def get_serializer_class(self):
+        if self.is_card_view():
+            return PostCardSerializer
+        return super().get_serializer_class()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not self.is_card_view():
+            return queryset
+        representative_images = PostImage.objects.filter(is_representative=True).order_by('id')
+        return (
+            queryset
+            .defer('content')
+            .select_related('user__profile', 'category')
+            .prefetch_related(None)
+            .prefetch_related(Prefetch('images', queryset=representative_images, to_attr='representative_images'))
+        )
+
+
+class PostKeysetListMixin:
+    """
+    ✅ 게시물 목록 키셋 페이지네이션 (main/utils/pagination.py)
+    - `cursor` / `page_size`를 넘기면 {"results", "next_cursor", "has_more"} 형태로 한 페이지만 응답 (COUNT 없음)
+    - 없으면 기존처럼 목록 전체(default_limit가 있으면 최신 default_limit개)를 배열로 응답
+    """
+    pagination_class = KeysetPagination
+    default_limit = None
+
+    def keyset_list(self, queryset):
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        if self.default_limit:
+            queryset = queryset[:self.default_limit]
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+# ✅ 키셋 페이지네이션 쿼리 파라미터 (Swagger 문서용)
+CURSOR_PARAMETERS = [
+    openapi.Parameter(
+        'cursor', openapi.IN_QUERY,
+        description="이전 응답의 next_cursor 값 (키셋 페이지네이션)",
+        required=False,
+        type=openapi.TYPE_STRING
+    ),
+    openapi.Parameter(
+        'page_size', openapi.IN_QUERY,
+        description="페이지당 게시물 수 (기본 20, 최대 100)",
+        required=False,
+        type=openapi.TYPE_INTEGER
+    ),
+]
+
+
+class PostListView(PostKeysetListMixin, PostCardViewMixin, ListAPIView):
     """
     ✅ 게시물 목록 조회 API
     - 서로이웃 공개 글과 전체 공개 글을 조회할 수 있음
     - 쿼리 파라미터: urlname, category_name, pk, keyword로 필터링 가능
+    - `cursor` / `page_size`를 넘기면 (created_at, id) 키셋 페이지네이션 모드로 동작
     """
     permission_classes = [IsAuthenticated]
+    query_budget = {'GET': 5}  # ✅ 인증 + 서로이웃 + 게시물 + 이미지 (+ 여유 1)
     parser_classes = [JSONParser]
     queryset = Post.objects.all()
     serializer_class = PostSerializer
@@ -66,7 +152,7 @@ class PostListView(ListAPIView):
         mutual_posts = Post.objects.filter(
             status="published",
             visibility="mutual",
-            user__profile__neighbors=request_user.profile
+            user_id__in=neighbors_of(request_user)
         ).exclude(user=request_user)
 
         # ✅ 특정 사용자의 게시물 조회 (`urlname`이 주어진 경우)
@@ -79,11 +165,11 @@ class PostListView(ListAPIView):
         else:
             queryset = (public_posts | mutual_posts).distinct()  # ✅ 중복 제거!
 
-        # ✅ keyword 필터링
+        # ✅ keyword 필터링 (단독 사용이므로 바로 반환)
         if keyword:
             if keyword not in dict(Post.KEYWORD_CHOICES):
                 raise ValidationError(f"'{keyword}'은(는) 유효하지 않은 keyword 값입니다.")
-            return queryset.filter(keyword=keyword)
+            return self.with_relations(queryset.filter(keyword=keyword))
 
         # ✅ 특정 카테고리 필터링 (이름을 `category`로 변경)
         if category:
@@ -97,7 +183,17 @@ class PostListView(ListAPIView):
         if pk:
             queryset = queryset.filter(pk=pk)
 
-        return queryset.order_by('-created_at')  # 🔥 최신순 정렬 추가
+        return self.with_relations(queryset)
+
+    @staticmethod
+    def with_relations(queryset):
+        """ ✅ 작성자 프로필·카테고리는 JOIN, 이미지는 prefetch → 페이지당 쿼리 수 고정 (키셋 페이지 기준 최신순 정렬) """
+        return (
+            queryset
+            .select_related('user__profile', 'category')
+            .prefetch_related('images')
+            .order_by('-created_at', '-id')  # 🔥 최신순 정렬 추가
+        )
 
     @swagger_auto_schema(
         operation_summary="게시물 목록 조회",
@@ -129,11 +225,13 @@ class PostListView(ListAPIView):
                 type=openapi.TYPE_STRING,
                 enum=[choice[0] for choice in getattr(Post, 'KEYWORD_CHOICES', [])]  # ✅ `getattr()`로 안전 처리
             ),
+            *CURSOR_PARAMETERS,
+            CARD_VIEW_PARAMETER,
         ],
         responses={200: PostSerializer(many=True)}
     )
     def get(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
+        queryset = self.filter_queryset(self.get_queryset())
 
         pk = self.request.query_params.get('pk', None)
         if pk:
@@ -141,8 +239,17 @@ class PostListView(ListAPIView):
             serializer = self.get_serializer(post)
             return Response(serializer.data, status=status.HTTP_200_OK)
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # ✅ cursor / page_size가 주어지면 키셋 페이지 단위로 응답
+        return self.keyset_list(queryset)
+
+def validate_status_and_visibility(post_status, visibility):
+    """ ✅ 저장 전에 status / visibility가 모델 선택지인지 확인 (게시물 수 카운터 컬럼과 1:1) - 잘못되면 400 응답 반환 """
+    if post_status not in dict(Post.POST_CHOICES):
+        return Response({"error": "게시물 상태가 유효하지 않습니다."}, status=400)
+    if visibility not in dict(Post.VISIBILITY_CHOICES):
+        return Response({"error": "공개 범위가 유효하지 않습니다."}, status=400)
+    return None
+
 
 class PostCreateView(CreateAPIView):
     """
@@ -174,6 +281,10 @@ class PostCreateView(CreateAPIView):
         if not title:
             return Response({"error": "제목은 필수 항목입니다."}, status=400)
 
+        invalid = validate_status_and_visibility(post_status, visibility)
+        if invalid:
+            return invalid
+
         if category_name:
             try:
                 category = user.categories.get(name=category_name)  # ✅ 변경된 부분
@@ -205,17 +316,16 @@ class PostCreateView(CreateAPIView):
 
         if post_status == "published":
             return Response({"message": "게시물이 성공적으로 생성되었습니다.", "post": serializer.data}, status=201)
-        elif post_status == "draft":
-            return Response({"message": "게시물이 임시 저장되었습니다.", "post": serializer.data}, status=201)
-        else:
-            return Response({"error": "게시물 상태가 유효하지 않습니다."}, status=400)
+        return Response({"message": "게시물이 임시 저장되었습니다.", "post": serializer.data}, status=201)
 
-class PostMyView(ListAPIView):
+class PostMyView(PostKeysetListMixin, PostCardViewMixin, ListAPIView):
     """
     ✅ 로그인한 사용자가 작성한 모든 게시물 목록을 조회하는 API
     - 쿼리 파라미터: category_name / pk로 필터링 가능
+    - `cursor` / `page_size`를 넘기면 키셋 페이지네이션 모드로 동작
     """
     permission_classes = [IsAuthenticated]
+    query_budget = {'GET': 4}  # ✅ 인증 + 게시물 + 이미지 (+ 여유 1)
     serializer_class = PostSerializer
 
     def get_queryset(self):
@@ -234,9 +344,13 @@ class PostMyView(ListAPIView):
         if pk:
             queryset = queryset.filter(pk=pk)
 
-        queryset = queryset.order_by('-created_at')
-
-        return queryset
+        # ✅ 작성자 프로필·카테고리는 JOIN, 이미지는 prefetch → 게시물 수와 무관하게 쿼리 수 고정
+        return (
+            queryset
+            .select_related('user__profile', 'category')
+            .prefetch_related('images')
+            .order_by('-created_at', '-id')
+        )
 
     @swagger_auto_schema(
         operation_summary="내가 작성한 게시물 목록 조회",
@@ -257,13 +371,13 @@ class PostMyView(ListAPIView):
                 description="게시물 ID로 필터링합니다.",
                 required=False,
                 type=openapi.TYPE_INTEGER
-            )
+            ),
+            *CURSOR_PARAMETERS,
+            CARD_VIEW_PARAMETER,
         ]
     )
     def get(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.keyset_list(self.filter_queryset(self.get_queryset()))
 
 
 class PostMyDetailView(RetrieveAPIView):
@@ -299,16 +413,26 @@ class PostMyDetailView(RetrieveAPIView):
         ]
     )
     def get(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        def build():
+            instance = self.get_object()
+            serializer = self.get_serializer(instance)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+
+        # ✅ If-None-Match가 일치하면 직렬화 없이 304
+        queryset = Post.objects.filter(user=request.user, pk=self.kwargs.get('pk'), status="published")
+        etag, last_modified = post_validators(queryset, request)
+        if etag is None:
+            return build()  # 404
+        return conditional_response(request, etag, build, last_modified)
 
 class PostMyRecentView(RetrieveAPIView):
     """
     ✅ 로그인한 사용자가 작성한 게시물 중 n번째 최신 `published` 상태인 게시물 조회 API
+    - `cursor`(이전 응답의 X-Next-Cursor 헤더)를 넘기면 그 게시물 다음부터 n번째를 (created_at, id) 키셋으로 조회
     """
     permission_classes = [IsAuthenticated]
     serializer_class = PostSerializer
+    pagination_class = KeysetPagination
 
     def get_object(self):
         user = self.request.user
@@ -323,17 +447,23 @@ class PostMyRecentView(RetrieveAPIView):
             raise ValidationError("n은 1 이상의 정수여야 합니다.")
 
         # 현재 로그인한 사용자의 `published` 상태인 게시물 중 최신순으로 n번째 게시물 가져오기
-        posts = Post.objects.filter(user=user, status='published').order_by('-created_at')
-
-        if len(posts) < n:
+        # ✅ cursor가 있으면 OFFSET 없이 그 다음 행으로 바로 이동 (n=1이면 LIMIT 1만)
+        posts = self.paginator.seek(
+            Post.objects.filter(user=user, status='published'),
+            self.request.query_params.get(self.paginator.cursor_query_param),
+        )
+        # ✅ 건너뛰는 n-1개는 (user, status, created_at) 인덱스에서 id만 읽고, 본문이 있는 행은 찾은 한 건만 조회
+        post_id = next(iter(posts.values_list('id', flat=True)[n - 1:n]), None)
+        if post_id is None:
             raise NotFound(f"출판된 게시물이 {n}개 미만입니다.")
 
-        return posts[n - 1]  # 0-based index
+        return Post.objects.select_related('user__profile', 'category').prefetch_related('images').get(pk=post_id)
 
     @swagger_auto_schema(
         operation_summary="내가 작성한 가장 최근 게시물 조회",
         operation_description="로그인한 사용자가 작성한 게시물 중 `published` 상태이며, `n`번째 최신 게시물을 조회합니다. "
-                              "`n`을 쿼리 파라미터로 입력하면 n번째 최신 게시물을 가져옵니다. (기본값: 1)",
+                              "`n`을 쿼리 파라미터로 입력하면 n번째 최신 게시물을 가져옵니다. (기본값: 1) "
+                              "응답의 `X-Next-Cursor` 헤더 값을 `cursor`로 넘기면 그 다음 게시물부터 셉니다.",
         manual_parameters=[
             openapi.Parameter(
                 'n', openapi.IN_QUERY,
@@ -341,35 +471,38 @@ class PostMyRecentView(RetrieveAPIView):
                 required=False,
                 type=openapi.TYPE_INTEGER
             ),
+            openapi.Parameter(
+                'cursor', openapi.IN_QUERY,
+                description="이전 응답의 X-Next-Cursor 헤더 값 (키셋 페이지네이션)",
+                required=False,
+                type=openapi.TYPE_STRING
+            ),
         ],
         responses={200: PostSerializer()},
     )
     def get(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        response = Response(serializer.data, status=status.HTTP_200_OK)
+        response['X-Next-Cursor'] = self.paginator.encode_cursor(instance)
+        return response
 
-class PostMutualListView(ListAPIView):
+class PostMutualListView(PostKeysetListMixin, PostCardViewMixin, ListAPIView):
     """
     ✅ 최근 1주일 내 작성된 '서로 이웃 공개' 게시물을 조회하는 API
     - `visibility='mutual'` 또는 `visibility='everyone'`인 게시물만 조회
     - **본인 게시물 제외**
+    - `cursor` / `page_size`를 넘기면 키셋 페이지네이션 모드로 동작
     """
     permission_classes = [IsAuthenticated]
+    query_budget = {'GET': 5}  # ✅ 인증 + 서로이웃 + 게시물 + 이미지 (+ 여유 1)
     serializer_class = PostSerializer
 
     def get_queryset(self):
         user = self.request.user
 
-        # ✅ 서로이웃 ID 리스트 가져오기
-        from_neighbors = list(
-            Neighbor.objects.filter(from_user=user, status="accepted").values_list('to_user', flat=True)
-        )
-        to_neighbors = list(
-            Neighbor.objects.filter(to_user=user, status="accepted").values_list('from_user', flat=True)
-        )
-        neighbor_ids = set(from_neighbors + to_neighbors)
-        neighbor_ids.discard(user.id)  # ✅ 본인 ID 제거
+        # ✅ 서로이웃 ID 집합 (캐시, 본인 제외)
+        neighbor_ids = neighbors_of(user)
 
         # ✅ 최근 1주일 이내 작성된 글만 조회
         one_week_ago = timezone.now() - timedelta(days=7)
@@ -382,18 +515,22 @@ class PostMutualListView(ListAPIView):
             Q(created_at__gte=one_week_ago)  # ✅ 최근 7일 이내 작성된 글
         ).exclude(user=user)  # ✅ 본인 게시물 제외
 
-        # ✅ 최신순 정렬 추가
-        return queryset.order_by('-created_at')
+        # ✅ 최신순 정렬 추가 (작성자 프로필·카테고리 JOIN, 이미지 prefetch)
+        return (
+            queryset
+            .select_related('user__profile', 'category')
+            .prefetch_related('images')
+            .order_by('-created_at', '-id')
+        )
 
     @swagger_auto_schema(
         operation_summary="서로이웃 게시물 목록 조회",
         operation_description="최근 1주일 내 작성된 서로이웃 공개 게시물을 조회합니다.",
+        manual_parameters=[*CURSOR_PARAMETERS, CARD_VIEW_PARAMETER],
         responses={200: PostSerializer(many=True)}
     )
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.keyset_list(self.filter_queryset(self.get_queryset()))
 
 
 class PostMutualDetailView(RetrieveAPIView):
@@ -404,15 +541,8 @@ class PostMutualDetailView(RetrieveAPIView):
     def get_queryset(self):
         user = self.request.user
 
-        # ✅ 서로이웃 ID 리스트 가져오기
-        from_neighbors = list(
-            Neighbor.objects.filter(from_user=user, status="accepted").values_list('to_user', flat=True)
-        )
-        to_neighbors = list(
-            Neighbor.objects.filter(to_user=user, status="accepted").values_list('from_user', flat=True)
-        )
-        neighbor_ids = set(from_neighbors + to_neighbors)
-        neighbor_ids.discard(user.id)  # ✅ 본인 ID 제거
+        # ✅ 서로이웃 ID 집합 (캐시, 본인 제외)
+        neighbor_ids = neighbors_of(user)
 
         # ✅ 서로이웃 + 전체 공개 글만 필터링
         queryset = Post.objects.filter(
@@ -449,16 +579,8 @@ class PostDetailView(RetrieveAPIView):
         urlname = self.request.query_params.get('urlname', None)
         pk = self.kwargs.get('pk')  # ✅ pk는 URL 경로에서 받음
 
-        # ✅ 서로이웃 ID 리스트 가져오기
-        from_neighbors = list(
-            Neighbor.objects.filter(from_user=user, status="accepted").values_list('to_user', flat=True)
-        )
-        to_neighbors = list(
-            Neighbor.objects.filter(to_user=user, status="accepted").values_list('from_user', flat=True)
-        )
-
-        neighbor_ids = set(from_neighbors + to_neighbors)
-        neighbor_ids.discard(user.id)  # ❌ 본인 ID 제외
+        # ✅ 서로이웃 ID 집합 (캐시, 본인 제외)
+        neighbor_ids = neighbors_of(user)
 
         mutual_neighbor_posts = Q(visibility='mutual', user_id__in=neighbor_ids)  # ✅ 서로 이웃 게시물
         public_posts = Q(visibility='everyone')  # ✅ 전체 공개 게시물
@@ -494,7 +616,11 @@ class PostDetailView(RetrieveAPIView):
         responses={200: PostSerializer()},
     )
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        # ✅ If-None-Match가 일치하면 직렬화 없이 304
+        etag, last_modified = post_validators(self.get_queryset(), request)
+        if etag is None:
+            return super().get(request, *args, **kwargs)  # 404
+        return conditional_response(request, etag, partial(super().get, request, *args, **kwargs), last_modified)
 
 
 
@@ -509,7 +635,7 @@ class PostManageView(UpdateAPIView, DestroyAPIView):
 
     @swagger_auto_schema(
         operation_summary="게시물 부분 수정 (PATCH)",
-        operation_description="기존 게시물을 덮어쓰기 방식으로 수정합니다. 기존 이미지는 전부 삭제되고, 새로운 이미지가 추가됩니다.",
+        operation_description="기존 게시물을 덮어쓰기 방식으로 수정합니다. 이미지 목록을 보내면 내용이 같은 기존 이미지는 유지되고, 새 이미지만 추가되며, 목록과 본문에서 빠진 이미지는 삭제됩니다. 이미지 목록이 없으면 기존 이미지를 그대로 둡니다.",
         manual_parameters=[
             openapi.Parameter('title', openapi.IN_FORM, description='게시물 제목', type=openapi.TYPE_STRING, required=False),
             openapi.Parameter('content', openapi.IN_FORM, description='게시물 본문 (HTML 포함)', type=openapi.TYPE_STRING, required=False),
@@ -534,6 +660,10 @@ class PostManageView(UpdateAPIView, DestroyAPIView):
         instance.visibility = request.data.get("visibility", instance.visibility)
         instance.subject = request.data.get("subject", instance.subject)
 
+        invalid = validate_status_and_visibility(instance.status, instance.visibility)
+        if invalid:
+            return invalid
+
         # ✅ 카테고리 업데이트
         category_name = request.data.get("category_name")
         if category_name:
@@ -545,11 +675,8 @@ class PostManageView(UpdateAPIView, DestroyAPIView):
         instance.updated_at = now()
         instance.save()
 
-        # ✅ 기존 이미지 삭제 (전체 삭제 후 다시 추가)
-        instance.images.all().delete()
-
-        # ✅ 새로운 이미지 저장
-        save_images_from_request(instance, request)
+        # ✅ 이미지 목록 반영 (내용 해시로 비교 → 같은 이미지는 유지, 새 이미지만 저장, 빠진 이미지는 일괄 삭제)
+        update_images_from_request(instance, request)
 
         # ✅ 응답 반환 (업데이트된 게시물 데이터)
         serializer = PostSerializer(instance)
@@ -576,37 +703,75 @@ class PostManageView(UpdateAPIView, DestroyAPIView):
         if instance.user != request.user:
             return Response({"error": "게시물을 삭제할 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
-        # ✅ 이미지 삭제 (파일 존재 여부 확인 후 삭제)
-        for image in instance.images.all():
-            if image.image and os.path.exists(image.image.path):
-                image.image.delete()  # 실제 파일 삭제
-            image.delete()  # DB 레코드 삭제
-
-        # ✅ 게시물 삭제
-        instance.delete()
+        # ✅ 게시물 삭제 (댓글/하트/이미지는 CASCADE, 파일 정리는 커밋 후 워커에서)
+        delete_posts(Post.objects.filter(pk=instance.pk))
 
         return Response({"message": "게시물이 삭제되었습니다."}, status=status.HTTP_200_OK)  # 200 반환
 
-class DraftPostListView(ListAPIView):
+class PostBulkDeleteView(GenericAPIView):
+    """
+    ✅ 내 게시물 일괄 삭제 API
+    - ids로 지정한 내 게시물을 한 번에 삭제 (다른 사용자의 게시물 id는 무시)
+    """
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="내 게시물 일괄 삭제",
+        operation_description="지정한 내 게시물(ids)과 댓글/하트/이미지를 한 번에 삭제합니다.",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=["ids"],
+            properties={
+                "ids": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(type=openapi.TYPE_INTEGER),
+                    description="삭제할 게시물 id 목록"
+                ),
+            }
+        ),
+        responses={200: openapi.Response(description="삭제 완료", schema=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "deleted": openapi.Schema(type=openapi.TYPE_INTEGER, description="삭제된 게시물 수")
+            }
+        ))}
+    )
+    def post(self, request, *args, **kwargs):
+        ids = request.data.get("ids")
+        if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+            return Response({"error": "ids는 정수 목록이어야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        deleted = delete_posts(Post.objects.filter(user=request.user, id__in=ids))
+        return Response({"deleted": deleted}, status=status.HTTP_200_OK)
+
+class DraftPostListView(PostKeysetListMixin, ListAPIView):
     """
     임시 저장된 게시물만 반환하는 뷰
+    - `cursor` / `page_size`를 넘기면 키셋 페이지네이션 모드로 동작
     """
     permission_classes = [IsAuthenticated]
+    query_budget = {'GET': 4}  # ✅ 인증 + 게시물 + 이미지 (+ 여유 1)
     serializer_class = PostSerializer
 
     @swagger_auto_schema(
         operation_summary="임시 저장된 게시물 목록 조회",
         operation_description="로그인한 사용자의 임시 저장된 게시물만 반환합니다.",
+        manual_parameters=CURSOR_PARAMETERS,
         responses={200: PostSerializer(many=True)},
     )
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        return self.keyset_list(self.filter_queryset(self.get_queryset()))
 
     def get_queryset(self):
         """
-        요청한 사용자의 임시 저장된 게시물만 반환
+        요청한 사용자의 임시 저장된 게시물만 반환 (최신순)
         """
-        return Post.objects.filter(user=self.request.user, status="draft")  # ✅ Boolean 값으로 필터링
+        return (
+            Post.objects.filter(user=self.request.user, status="draft")
+            .select_related('user__profile', 'category')
+            .prefetch_related('images')
+            .order_by('-created_at', '-id')
+        )
 
 
 class DraftPostDetailView(RetrieveAPIView):
@@ -622,7 +787,11 @@ class DraftPostDetailView(RetrieveAPIView):
         responses={200: PostSerializer()},
     )
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        # ✅ If-None-Match가 일치하면 직렬화 없이 304
+        etag, last_modified = post_validators(self.get_queryset(), request)
+        if etag is None:
+            return super().get(request, *args, **kwargs)  # 404
+        return conditional_response(request, etag, partial(super().get, request, *args, **kwargs), last_modified)
 
     def get_queryset(self):
         """
@@ -631,35 +800,45 @@ class DraftPostDetailView(RetrieveAPIView):
         return Post.objects.filter(user=self.request.user, status="draft")
 
 
-class PostMyCurrentView(ListAPIView):
+class PostMyCurrentView(PostKeysetListMixin, PostCardViewMixin, ListAPIView):
     """
     로그인된 유저가 작성한 최신 5개 게시물 목록을 조회하는 API
     ✅ 로그인된 유저가 작성한 게시물 중 status="published"인 게시물만 조회
+    ✅ `cursor` / `page_size`를 넘기면 그 다음 글들을 키셋 페이지 단위로 조회
     """
     permission_classes = [IsAuthenticated]
+    query_budget = {'GET': 4}  # ✅ 인증 + 게시물 + 이미지 (+ 여유 1)
     serializer_class = PostSerializer
+    default_limit = 5
 
     def get_queryset(self):
         user = self.request.user
         # ✅ is_complete=True 조건 추가
-        return Post.objects.filter(user=user, status="published").order_by('-created_at')[:5]
+        return (
+            Post.objects.filter(user=user, status="published")
+            .select_related('user__profile', 'category')
+            .prefetch_related('images')
+            .order_by('-created_at', '-id')
+        )
 
     @swagger_auto_schema(
         operation_summary="내가 작성한 최근 5개 게시물 조회",
         operation_description="로그인된 유저가 작성한 게시물 중 status=published인 상태에서 최근 5개만 반환합니다.",
+        manual_parameters=[*CURSOR_PARAMETERS, CARD_VIEW_PARAMETER],
         responses={200: PostSerializer(many=True)}
     )
     def get(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.keyset_list(self.filter_queryset(self.get_queryset()))
 
-class PostPublicCurrentView(ListAPIView):
+class PostPublicCurrentView(PostKeysetListMixin, PostCardViewMixin, ListAPIView):
     """
     ✅ 특정 사용자의 최신 5개(최대 5개) 게시물을 조회하는 API (서로이웃 여부 고려)
+    ✅ `cursor` / `page_size`를 넘기면 블로그 글 목록을 키셋 페이지 단위로 조회
     """
     permission_classes = [AllowAny]  # ✅ 비로그인 사용자도 조회 가능
+    query_budget = {'GET': 6}  # ✅ 인증 + 프로필 + 블로그 주인 + 게시물 + 이미지 (+ 여유 1)
     serializer_class = PostSerializer
+    default_limit = 5
 
     def get_queryset(self):
         """
@@ -674,41 +853,37 @@ class PostPublicCurrentView(ListAPIView):
 
         # ✅ 본인이 자신의 블로그를 조회하는 경우 모든 게시물 조회
         if viewer == blog_owner:
-            return Post.objects.filter(
-                user=blog_owner,
-                status="published"
-            ).order_by("-created_at")[:5]
-
-        # ✅ 서로이웃 여부 확인
-        is_mutual = Neighbor.objects.filter(
-            (Q(from_user=viewer, to_user=blog_owner) | Q(from_user=blog_owner, to_user=viewer)),
-            status="accepted"
-        ).exists()
-
-        # ✅ 공개 범위 조건 설정
-        if is_mutual:
+            visibility_filter = Q()
+        # ✅ 공개 범위 조건 설정 (서로이웃 여부는 캐시에서 확인)
+        elif is_mutual(viewer, blog_owner):
             visibility_filter = Q(visibility="everyone") | Q(visibility="mutual")  # ✅ 가독성 개선
         else:
             visibility_filter = Q(visibility="everyone")
 
-        # ✅ 게시물 가져오기 (최근 5개)
+        # ✅ 게시물 가져오기 (최신순 - 개수 제한은 default_limit / 페이지네이션에서)
         post_status = "published"  # ✅ 기존 `status` 변수와 겹치는 문제 해결
         return Post.objects.filter(
             visibility_filter,
             user=blog_owner,
             status=post_status,  # ✅ `status` 변수명이 아닌 `post_status` 사용하여 문제 방지
-        ).order_by("-created_at")[:5]
+        ).select_related('user__profile', 'category').prefetch_related('images').order_by("-created_at", "-id")
 
     @swagger_auto_schema(
         operation_summary="타인의 블로그에서 최신 5개 게시물 조회",
         operation_description="특정 사용자의 블로그에서 최근 5개의 게시물을 가져옵니다. "
                               "서로이웃일 경우 'mutual'까지 포함하고, 아니라면 'everyone' 공개 글만 반환합니다.",
+        manual_parameters=[*CURSOR_PARAMETERS, CARD_VIEW_PARAMETER],
         responses={200: PostSerializer(many=True)}
     )
     def get(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=200)
+        profile = get_object_or_404(Profile.objects.only("user_id", "urlname"), urlname=self.kwargs.get("urlname"))
+
+        def build():
+            return self.keyset_list(self.filter_queryset(self.get_queryset())).data
+
+        # ✅ 같은 조회자 구분(본인/서로이웃/그 외)이면 같은 목록 → 블로그 버전 단위로 캐시
+        viewer = viewer_class(request.user, profile.user_id)
+        return Response(cached_response_data(request, "posts_current", profile, build, viewer), status=200)
 
 class PostCountView(APIView):
     """
@@ -721,6 +896,7 @@ class PostCountView(APIView):
         - **전체 공개(`everyone`) 게시물 개수만 반환**
     """
     permission_classes = [AllowAny]  # ✅ 인증 없이 접근 가능 (서로이웃 여부에 따라 결과 달라짐)
+    query_budget = {'GET': 3}  # ✅ 인증 + 프로필 + 게시물 수 카운터
 
     @swagger_auto_schema(
         operation_summary="사용자의 게시물 개수 조회",
@@ -732,42 +908,19 @@ class PostCountView(APIView):
         """
         ✅ GET 요청을 통해 특정 사용자의 게시물 개수 반환
         """
-        profile = get_object_or_404(Profile, urlname=urlname)
-        blog_owner = profile.user
+        profile = get_object_or_404(Profile.objects.only("user_id", "urlname"), urlname=urlname)
+        blog_owner_id = profile.user_id
         current_user = request.user if request.user.is_authenticated else None
 
-        # ✅ 로그인하지 않은 사용자가 조회하는 경우 → 전체 공개 게시물만 세서 반환
-        if not current_user:
-            post_count = Post.objects.filter(
-                user=blog_owner, status="published", visibility="everyone"
-            ).count()
-            return Response({"urlname": urlname, "post_count": post_count})
-
-        # ✅ 본인이 자신의 블로그를 조회하는 경우 → 모든 `published` 상태 게시물 개수 반환
-        if current_user == blog_owner:
-            post_count = Post.objects.filter(user=blog_owner, status="published").count()
-            return Response({"urlname": urlname, "post_count": post_count})
-
-        # ✅ 서로이웃 관계 확인
-        is_neighbor = Neighbor.objects.filter(
-            (Q(from_user=current_user, to_user=blog_owner) |
-             Q(from_user=blog_owner, to_user=current_user)),
-            status="accepted"
-        ).exists()
-
-        # ✅ 서로이웃이면 '전체 공개 + 서로이웃 공개' 게시물 개수 반환
-        if is_neighbor:
-            post_count = Post.objects.filter(
-                user=blog_owner,
-                status="published",
-                visibility__in=["everyone", "mutual"]
-            ).count()
+        # ✅ 본인 → 모든 `published` 게시물, 서로이웃 → 전체 공개 + 서로이웃 공개, 그 외(비로그인 포함) → 전체 공개
+        # - 게시물 수는 사용자별 카운터 행 하나에서 계산 (COUNT 없음), 서로이웃 관계는 캐시
+        if current_user and current_user.pk == blog_owner_id:
+            visibilities = VISIBLE_TO_OWNER
+        elif is_mutual(current_user, blog_owner_id):
+            visibilities = VISIBLE_TO_MUTUAL
         else:
-            # ✅ 서로이웃이 아니면 '전체 공개' 게시물 개수만 반환
-            post_count = Post.objects.filter(
-                user=blog_owner,
-                status="published",
-                visibility="everyone"
-            ).count()
-
-        return Response({"urlname": urlname, "post_count": post_count})
\ No newline at end of file
+            visibilities = VISIBLE_TO_PUBLIC
+        post_count = get_post_counts(blog_owner_id).published(visibilities)
+
+        etag = make_etag('post-count', urlname, post_count)
+        return conditional_response(request, etag, lambda: Response({"urlname": urlname, "post_count": post_count}))
\ No newline at end of file
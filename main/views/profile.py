@@ -13,6 +13,9 @@ from rest_framework.response import Response
 from ..models.profile import Profile
 from main.models.neighbor import Neighbor
 from ..serializers.profile import ProfileSerializer,UrlnameUpdateSerializer
+from ..utils.conditional import conditional_response, make_etag
+from ..utils.neighbors import is_mutual
+from ..utils.response_cache import cached_response_data, viewer_class
 from django.db.models import Q
 from rest_framework.exceptions import ValidationError
 
@@ -196,21 +199,23 @@ class ProfilePublicView(RetrieveAPIView):
     )
     def get(self, request, urlname):
         profile = get_object_or_404(Profile, urlname=urlname)
-        serializer = self.get_serializer(profile)
 
         # ✅ 현재 로그인한 사용자가 서로이웃인지 확인 (status="accepted"인 경우만 체크)
-        is_neighbor = False
-        if request.user.is_authenticated:
-            is_neighbor = Neighbor.objects.filter(
-                (Q(from_user=request.user, to_user=profile.user) |
-                 Q(from_user=profile.user, to_user=request.user)),
-                status="accepted"
-            ).exists()
-
-        response_data = serializer.data
-        response_data["is_neighbor"] = is_neighbor  # ✅ 서로이웃 여부 추가
-
-        return Response(response_data)
+        is_neighbor = is_mutual(request.user, profile.user_id)
+
+        def serialize():
+            response_data = self.get_serializer(profile).data
+            response_data["is_neighbor"] = is_neighbor  # ✅ 서로이웃 여부 추가
+            return response_data
+
+        def build():
+            # ✅ 같은 조회자 구분(본인/서로이웃/그 외)이면 같은 응답 → 블로그 버전 단위로 캐시
+            viewer = viewer_class(request.user, profile.user_id)
+            return Response(cached_response_data(request, "profile", profile, serialize, viewer))
+
+        # ✅ 프로필 수정 시각 + 서로이웃 여부가 같으면 직렬화 없이 304
+        etag = make_etag('profile', profile.id, profile.updated_at, is_neighbor, request.get_host())
+        return conditional_response(request, etag, build, profile.updated_at)
 
 
 
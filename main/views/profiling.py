@@ -0,0 +1,26 @@
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_yasg.utils import swagger_auto_schema
+from main.utils.profiling import request_stats
+
+
+class ProfilingStatsView(APIView):
+    """ ✅ 엔드포인트별 최근 요청 측정값 (RequestProfilingMiddleware, 관리자 전용) """
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_summary="요청 프로파일링 통계",
+        operation_description="엔드포인트별 최근 요청의 p50/p95 응답 시간, 쿼리 수, DB/Serializer 시간, 응답 크기를 반환합니다.",
+    )
+    def get(self, request):
+        return Response(request_stats.summary(), status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        operation_summary="요청 프로파일링 통계 초기화",
+        responses={204: "초기화 완료"},
+    )
+    def delete(self, request):
+        request_stats.clear()
+        return Response(status=status.HTTP_204_NO_CONTENT)
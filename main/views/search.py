@@ -8,6 +8,12 @@ from drf_yasg import openapi
 from ..models.post import Post, PostImage  # 🔹 PostImage 추가
 from ..models.profile import Profile
 from ..serializers.search import PostSearchSerializer
+from ..utils.neighbors import is_mutual
+from ..utils.image_variants import thumbnail_url
+from ..utils.search_index import search_post_ids
+
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE_SIZE = 50
 
 
 def is_mutual_friend(user, author):
@@ -18,7 +24,39 @@ def is_mutual_friend(user, author):
     if not user.is_authenticated:
         return False  # 로그인하지 않은 사용자는 서로 이웃이 아님
 
-    return user.following.filter(id=author.id).exists()  # 'following' 필드는 예시
+    return is_mutual(user, author)
+
+
+def get_search_page(request):
+    """
+    ✅ 검색 결과 페이지 파라미터(page, page_size)를 (offset, limit)으로 변환
+    """
+    try:
+        page = max(int(request.GET.get('page', 1)), 1)
+        page_size = int(request.GET.get('page_size', SEARCH_PAGE_SIZE))
+    except ValueError:
+        page, page_size = 1, SEARCH_PAGE_SIZE
+    page_size = min(max(page_size, 1), SEARCH_MAX_PAGE_SIZE)
+    return (page - 1) * page_size, page_size
+
+
+def get_ranked_posts(search_keyword, queryset, request):
+    """
+    ✅ 검색 색인으로 찾은 게시물을 점수순으로 반환 (작성자 프로필·이미지 포함)
+    """
+    offset, limit = get_search_page(request)
+    post_ids, has_more = search_post_ids(search_keyword, queryset, offset=offset, limit=limit)
+    posts = Post.objects.filter(id__in=post_ids).select_related('user__profile').prefetch_related('images')
+    posts_by_id = {post.id: post for post in posts}
+    return [posts_by_id[post_id] for post_id in post_ids if post_id in posts_by_id], has_more
+
+
+def get_thumbnail_url(post):
+    """
+    ✅ prefetch된 이미지 중 대표 이미지의 썸네일 변형 URL 반환 (추가 쿼리 없음)
+    """
+    thumbnail = next((image for image in post.images.all() if image.is_representative), None)
+    return thumbnail_url(thumbnail.image, thumbnail.variants) if thumbnail else None
 
 
 def get_excerpt(text, keyword, context_length=30):
@@ -48,6 +86,8 @@ class BlogPostSearchView(APIView):
             openapi.Parameter('urlname', openapi.IN_QUERY, description="블로그 식별자 (사용자 프로필 URL 식별자)",
                               type=openapi.TYPE_STRING, required=True),
             openapi.Parameter('q', openapi.IN_QUERY, description="검색어", type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter('page', openapi.IN_QUERY, description="페이지 번호 (기본 1)", type=openapi.TYPE_INTEGER),
+            openapi.Parameter('page_size', openapi.IN_QUERY, description="페이지당 결과 수 (기본 20, 최대 50)", type=openapi.TYPE_INTEGER),
         ],
         responses={200: PostSearchSerializer(many=True)}
     )
@@ -69,57 +109,34 @@ class BlogPostSearchView(APIView):
 
         user = request.user  # 현재 검색을 요청한 사용자
 
-        # 🔹 제목 검색 (나만 보기 필터링)
-        title_matches = Post.objects.filter(
-            Q(title__icontains=search_keyword) & Q(user=blog_owner) & ~Q(visibility='me')
-        )
-
-        # 🔹 본문 검색 (나만 보기 필터링)
-        content_matches = Post.objects.filter(
-            Q(content__icontains=search_keyword) & Q(user=blog_owner) & ~Q(visibility='me')
-        )
+        # 🔹 검색 범위 (나만 보기 제외, 서로 이웃이 아니면 서로이웃 공개 글도 제외)
+        queryset = Post.objects.filter(user=blog_owner).exclude(visibility='me')
+        if not is_mutual_friend(user, blog_owner):
+            queryset = queryset.exclude(visibility='mutual')
 
-        # 🔹 이미지 캡션 검색 (나만 보기 필터링)
-        caption_matches = PostImage.objects.filter(
-            Q(caption__icontains=search_keyword) & Q(post__user=blog_owner) & ~Q(post__visibility='me')
-        ).select_related('post')
-
-        # 🔹 검색된 게시물 ID 저장 (중복 제거)
-        matched_post_ids = (
-            set(title_matches.values_list('id', flat=True))
-            | set(content_matches.values_list('id', flat=True))
-            | set(caption_matches.values_list('post_id', flat=True))  # 🔹 이미지 설명 포함
-        )
-
-        # 🔹 검색된 게시물 조회 (서로 이웃 필터링 적용 + Profile 정보 포함)
-        posts = Post.objects.filter(id__in=matched_post_ids).prefetch_related('images', 'user__profile')
+        # 🔹 검색 색인에서 제목·본문·이미지 캡션을 한 번에 검색 (점수순 + 페이지)
+        posts, has_more = get_ranked_posts(search_keyword, queryset, request)
 
         results = []
         for post in posts:
-            if post.visibility == 'mutual' and not is_mutual_friend(user, post.user):
-                continue  # 서로 이웃이 아닐 경우 검색 결과에서 제외
-
-            thumbnail = post.images.filter(is_representative=True).first()
-            thumbnail_url = thumbnail.image.url if thumbnail else None
-
             excerpt = ""
-            if search_keyword.lower() in post.content.lower():  # 본문에서 검색어가 있는지 확인
+            if post.content and search_keyword.lower() in post.content.lower():  # 본문에서 검색어가 있는지 확인
                 excerpt = get_excerpt(post.content, search_keyword)
 
             # 🔹 프로필에서 username과 user_pic 가져오기
             author_username = post.user.profile.username
-            author_user_pic = post.user.profile.user_pic.url
+            author_user_pic = thumbnail_url(post.user.profile.user_pic, post.user.profile.user_pic_variants)
 
             results.append({
                 "title": post.title,
                 "created_at": post.created_at.strftime("%Y-%m-%d %H:%M"),
-                "thumbnail": thumbnail_url,
+                "thumbnail": get_thumbnail_url(post),
                 "excerpt": excerpt,
                 "username": author_username,  # ✅ username 추가
                 "user_pic": author_user_pic,  # ✅ user_pic 추가
             })
 
-        return Response({"results": results})
+        return Response({"results": results, "has_more": has_more})
 
 
 class GlobalBlogSearchView(APIView):
@@ -159,7 +176,7 @@ class GlobalBlogSearchView(APIView):
                 "urlname": profile.urlname,
                 "blog_name": profile.blog_name,
                 "intro": profile.intro,  # 🔹 블로그 한 줄 소개 추가
-                "user_pic": profile.user_pic.url if profile.user_pic else None  # 🔹 사용자 프로필 사진 추가
+                "user_pic": thumbnail_url(profile.user_pic, profile.user_pic_variants)  # 🔹 사용자 프로필 사진 추가
             }
             for profile in blog_matches
         ]
@@ -208,7 +225,7 @@ class GlobalNickAndIdSearchView(APIView):
                 "urlname": exact_match.urlname,
                 "blog_name": exact_match.blog_name,
                 "intro": exact_match.intro,
-                "user_pic": exact_match.user_pic.url if exact_match.user_pic else None
+                "user_pic": thumbnail_url(exact_match.user_pic, exact_match.user_pic_variants)
             })
             urlname_matched_user_id = exact_match.id  # 🔹 해당 사용자의 ID 저장 (중복 방지)
         except Profile.DoesNotExist:
@@ -225,7 +242,7 @@ class GlobalNickAndIdSearchView(APIView):
                 "urlname": profile.urlname,
                 "blog_name": profile.blog_name,
                 "intro": profile.intro,
-                "user_pic": profile.user_pic.url if profile.user_pic else None
+                "user_pic": thumbnail_url(profile.user_pic, profile.user_pic_variants)
             }
             for profile in username_matches
         ]
@@ -243,6 +260,8 @@ class GlobalPostSearchView(APIView):
         operation_description="전체 블로그에서 게시글을 검색합니다.",
         manual_parameters=[
             openapi.Parameter('q', openapi.IN_QUERY, description="검색할 키워드", type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter('page', openapi.IN_QUERY, description="페이지 번호 (기본 1)", type=openapi.TYPE_INTEGER),
+            openapi.Parameter('page_size', openapi.IN_QUERY, description="페이지당 결과 수 (기본 20, 최대 50)", type=openapi.TYPE_INTEGER),
         ],
         responses={200: openapi.Schema(
             type=openapi.TYPE_OBJECT,
@@ -260,51 +279,35 @@ class GlobalPostSearchView(APIView):
         if not search_keyword or len(search_keyword) < 2:
             return Response({"error": "검색어는 2글자 이상 입력해주세요."}, status=400)
 
-        matched_post_ids = set()
-        excerpts = {}  # 🔹 post_id 별 excerpt 저장 (제목, 본문, 캡션 포함)
-
-        # 🔹 1. 제목에서 검색
-        title_matches = Post.objects.filter(
-            Q(title__icontains=search_keyword) & Q(visibility='everyone')
-        )
-        for post in title_matches:
-            matched_post_ids.add(post.id)
-            excerpts[post.id] = get_excerpt(post.title, search_keyword)
-
-        # 🔹 2. 본문에서 검색 (제목에서 검색되지 않은 경우에만 추가)
-        content_matches = Post.objects.filter(
-            Q(content__icontains=search_keyword) & Q(visibility='everyone')
-        )
-        for post in content_matches:
-            if post.id not in excerpts:
-                excerpts[post.id] = get_excerpt(post.content, search_keyword)
-            matched_post_ids.add(post.id)
-
-        # 🔹 3. 이미지 캡션에서 검색 (제목과 본문에서 검색되지 않은 경우에만 추가)
-        caption_matches = PostImage.objects.filter(
-            Q(caption__icontains=search_keyword) & Q(post__visibility='everyone')
-        ).select_related('post')
-        for image in caption_matches:
-            if image.post.id not in excerpts:
-                excerpts[image.post.id] = get_excerpt(image.caption, search_keyword)
-            matched_post_ids.add(image.post.id)
-
-        # 🔹 4. 검색된 게시물 조회
-        posts = Post.objects.filter(id__in=matched_post_ids).select_related('user__profile')
+        # 🔹 검색 색인에서 제목·본문·이미지 캡션을 한 번에 검색 (점수순 + 페이지)
+        queryset = Post.objects.filter(visibility='everyone')
+        posts, has_more = get_ranked_posts(search_keyword, queryset, request)
 
         results = []
+        keyword = search_keyword.lower()
         for post in posts:
             profile = post.user.profile
+
+            # 🔹 excerpt: 제목 → 본문 → 이미지 캡션 순으로 검색어가 포함된 부분
+            if keyword in post.title.lower():
+                excerpt = get_excerpt(post.title, search_keyword)
+            elif post.content and keyword in post.content.lower():
+                excerpt = get_excerpt(post.content, search_keyword)
+            else:
+                caption = next((image.caption for image in post.images.all()
+                                if image.caption and keyword in image.caption.lower()), None)
+                excerpt = get_excerpt(caption, search_keyword) if caption else post.content
+
             results.append({
                 "post_id": post.id,  # ✅ 추가된 post_id
                 "title": post.title,
                 "username": profile.username,
                 "urlname": profile.urlname,
                 "created_at": post.created_at.strftime("%Y-%m-%d %H:%M"),
-                "thumbnail": post.images.filter(is_representative=True).first().image.url if post.images.exists() else None,
-                "excerpt": excerpts.get(post.id, post.content),
+                "thumbnail": get_thumbnail_url(post),
+                "excerpt": excerpt,
                 "visibility": post.visibility
             })
 
-        return Response({"posts": results})
+        return Response({"posts": results, "has_more": has_more})
 
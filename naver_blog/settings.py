@@ -49,6 +49,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',  # ✅ 가장 위로 이동
     'django.middleware.security.SecurityMiddleware',
+    'main.middleware.profiling.RequestProfilingMiddleware',  # ✅ 쿼리 수 / DB·Serializer 시간 측정 (Server-Timing)
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -93,6 +94,22 @@ DATABASES = {
     }
 }
 
+# ✅ 캐시 (서로이웃 / 본문 렌더링 / 블로그 응답 캐시)
+# - REDIS_URL이 있으면 여러 워커 프로세스가 공유하는 Redis, 없으면 프로세스별 로컬 메모리
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 
 
 # Password validation
@@ -207,4 +224,52 @@ CORS_ALLOW_METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH","OPTIONS"]
 # 특정 헤더 허용 (authorization 추가)
 CORS_ALLOW_HEADERS = ["*"]
 
+# ✅ 프론트엔드에서 읽을 수 있는 응답 헤더 (n번째 최신 글 조회의 다음 cursor)
+CORS_EXPOSE_HEADERS = ["X-Next-Cursor"]
+
+
 
+# ✅ 좋아요 카운터 write-behind 버퍼 (main/utils/counters.py)
+# - ENABLED: True면 하트 토글 시 Post/Comment 행을 바로 갱신하지 않고 샤드 카운터에 누적
+# - FLUSH_INTERVAL: 누적된 증감값을 DB에 일괄 반영하는 주기 (초)
+LIKE_COUNTER_BUFFER = {
+    'ENABLED': os.getenv('LIKE_COUNTER_BUFFER', 'false').lower() == 'true',
+    'SHARDS': 16,
+    'FLUSH_INTERVAL': 1.0,
+}
+
+# ✅ 게시물 이미지 처리 파이프라인 (main/utils/image_pipeline.py)
+# - ASYNC: True면 디코딩/축소/저장을 워커 풀에서 처리하고 요청은 pending 이미지로 바로 응답
+# - WORKERS: 워커 스레드 수, MAX_DIMENSION: 긴 변 기준 최대 픽셀 (초과 시 축소)
+# - SPOOL_DIR: 업로드를 임시로 옮겨 둘 디렉터리 (None이면 시스템 임시 디렉터리)
+# - CONVERT_WORKERS / CONVERT_MEMORY_MB: HEIC 변환 동시 실행 수와 전체 해상도 디코딩 메모리 상한
+# - CONVERT_TIMEOUT: 프로필 사진 변환을 기다리는 최대 시간 (초)
+IMAGE_PIPELINE = {
+    'ASYNC': os.getenv('IMAGE_PIPELINE_ASYNC', 'true').lower() == 'true',
+    'WORKERS': int(os.getenv('IMAGE_PIPELINE_WORKERS', '2')),
+    'MAX_DIMENSION': 2560,
+    'SPOOL_DIR': None,
+    'CONVERT_WORKERS': 1,
+    'CONVERT_MEMORY_MB': int(os.getenv('IMAGE_CONVERT_MEMORY_MB', '256')),
+    'CONVERT_TIMEOUT': 30,
+}
+
+# ✅ 요청 프로파일링 (main/middleware/profiling.py)
+# - SERVER_TIMING: 응답에 Server-Timing 헤더 추가
+# - WINDOW: 엔드포인트별로 보관하는 최근 요청 수 (/profiling/stats/)
+# - QUERY_BUDGET_STRICT: 뷰의 query_budget 초과 시 예외 발생 (False면 경고 로그만)
+REQUEST_PROFILING = {
+    'ENABLED': True,
+    'SERVER_TIMING': True,
+    'WINDOW': 200,
+    'QUERY_BUDGET_STRICT': False,
+}
+
+# ✅ 블로그 응답 캐시 (main/utils/response_cache.py)
+# - 프로필 / 카테고리 목록 / 서로이웃 목록 / 최신 글 5개를 (urlname, 조회자 구분) 단위로 캐시
+# - TIMEOUT: 캐시 유지 시간 (초) - 무효화는 블로그 버전으로 하므로 메모리 회수용
+# - ENABLED: 기본은 공유 캐시(REDIS_URL)가 있을 때만 - 프로세스별 캐시에서는 버전 증가가 다른 워커에 닿지 않음
+RESPONSE_CACHE = {
+    'ENABLED': os.getenv('RESPONSE_CACHE', 'true' if os.getenv('REDIS_URL') else 'false').lower() == 'true',
+    'TIMEOUT': 60 * 10,
+}
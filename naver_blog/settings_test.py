@@ -0,0 +1,25 @@
+"""
+테스트 전용 설정 (SQLite 사용)
+
+    python manage.py test main.tests.test_query_plans --settings=naver_blog.settings_test
+"""
+from .settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'test_db.sqlite3',
+    }
+}
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']  # ✅ 테스트 속도를 위해 가벼운 해셔 사용
+
+ALLOWED_HOSTS = ['*']
+
+REQUEST_PROFILING = {**REQUEST_PROFILING, 'QUERY_BUDGET_STRICT': True}  # ✅ 테스트에서는 query_budget 초과 시 실패
+
+IMAGE_PIPELINE = {**IMAGE_PIPELINE, 'ASYNC': False}  # ✅ 테스트에서는 이미지 처리를 요청 안에서 바로 실행
+
+CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}  # ✅ REDIS_URL과 무관하게 로컬 메모리
+
+RESPONSE_CACHE = {**RESPONSE_CACHE, 'ENABLED': True}  # ✅ 테스트는 단일 프로세스라 로컬 메모리로도 응답 캐시 검증 가능
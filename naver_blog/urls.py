@@ -23,14 +23,15 @@ from main.views.login import LoginView
 from main.views.logout import LogoutView
 from main.views.account import PasswordUpdateView
 from main.views.profile import ProfileDetailView, ProfilePublicView, ProfileUrlnameUpdateView
-from main.views.post import PostDetailView,PostMyView,PostMyDetailView,PostMyRecentView,PostMutualListView,PostMutualDetailView,PostManageView,PostListView,PostCreateView,DraftPostListView,DraftPostDetailView, PostMyCurrentView, PostPublicCurrentView, PostCountView
+from main.views.post import PostDetailView,PostMyView,PostMyDetailView,PostMyRecentView,PostMutualListView,PostMutualDetailView,PostManageView,PostListView,PostCreateView,DraftPostListView,DraftPostDetailView, PostMyCurrentView, PostPublicCurrentView, PostCountView, PostBulkDeleteView
 from main.views.category import CategoryListView,CategoryDetailView,MyCategoryListView,MyCategoryDetailView
 from main.views.comment import CommentListView, CommentDetailView
 from main.views.heart import ToggleHeartView, PostHeartUsersView, PostHeartCountView
 from main.views.commentHeart import ToggleCommentHeartView, CommentHeartCountView
 from main.views.neighbor import NeighborView,NeighborAcceptView,NeighborRejectView,NeighborRequestListView,PublicNeighborListView, MyNeighborListView, MyNeighborDeleteView, NeighborNumberView
-from main.views.news import MyNewsListView
+from main.views.news import MyNewsListView, MyNewsReadView
 from main.views.activity import MyActivityListView
+from main.views.profiling import ProfilingStatsView
 from main.views.search import BlogPostSearchView, GlobalBlogSearchView, GlobalNickAndIdSearchView, GlobalPostSearchView
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
@@ -65,6 +66,7 @@ urlpatterns = [
 
     # 내 소식 및 내 활동 관련 API
     path('news/list/', MyNewsListView.as_view(), name='my-news-list'), # 내 소식
+    path('news/read/', MyNewsReadView.as_view(), name='my-news-read'), # 내 소식 읽음 처리
     path('activity/list/', MyActivityListView.as_view(), name='my-activity-list'), # 내 활동
 
     # ✅ 타인 프로필 관련 API
@@ -94,6 +96,7 @@ urlpatterns = [
     path('posts/me/create/', PostCreateView.as_view(), name='post-create'),  # 게시물 생성 (POST)
     path('posts/me/recent/', PostMyRecentView.as_view(), name='post-my-recent'), #내가 작성한 게시물 중 제일 최근 게시물 1개 조회
     path('posts/me/<int:pk>/manage/', PostManageView.as_view(), name='post-manage'),  # 게시물 수정/삭제 (PUT, PATCH, DELETE)
+    path('posts/me/delete/', PostBulkDeleteView.as_view(), name='post-bulk-delete'),  # 내 게시물 일괄 삭제 (POST, ids)
     path('posts/me/current/', PostMyCurrentView.as_view(), name='post-my-current'), # 내가 작성한 게시물 목록 최신 5개 조회
 
     # 게시물 개수 세기
@@ -137,6 +140,9 @@ urlpatterns = [
     # 댓글/대댓글 좋아요 개수 조회
     path('posts/<int:post_id>/comments/<int:comment_id>/heart/count/', CommentHeartCountView.as_view(),
          name='comment-heart-count'),
+    # ✅ 요청 프로파일링 통계 (관리자 전용)
+    path('profiling/stats/', ProfilingStatsView.as_view(), name='profiling-stats'),
+
     # Swagger 관련 경로 (drf-yasg 사용)
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),  # ReDoc UI 추가
     re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),